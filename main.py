@@ -2,7 +2,11 @@ import argparse
 import os
 import sys
 import platform 
-from nanmon.game import run_game
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keep stdout clean for --stress/--replay output
+import pygame
+from nanmon.game import play_level
+from nanmon.session import GameSession
+from nanmon import hitch, trace
 
 def _maybe_set_windows_dpi_aware():
     """Optionally set process DPI awareness on Windows to avoid OS upscaling.
@@ -24,26 +28,75 @@ def main():
     parser.add_argument("--headless", type=float, default=None, nargs="?", help="Run headless for N seconds")
     parser.add_argument("--smooth-scale", action="store_true", help="Use non-integer smooth scaling (anti-aliased)")
     parser.add_argument("--margin", type=float, default=0.95, help="Initial window margin relative to display size (0..1)")
+    parser.add_argument("--soa", action="store_true", help="Use the NumPy array store for foods/projectiles")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for all gameplay RNG streams")
+    parser.add_argument("--record", metavar="FILE", default=None, help="Record per-tick input to FILE (FILE-2, FILE-3... for later runs)")
+    parser.add_argument("--replay", metavar="FILE", default=None, help="Replay a recording headless at full speed and print a summary")
+    parser.add_argument("--dirty-rects", action="store_true", help="Only push changed screen regions on static screens (low-power/software targets)")
+    parser.add_argument("--stress", type=int, nargs="?", const=3, default=None, metavar="LEVEL", help="Ramp spawn density and boss fire on LEVEL (default 3) headless until frames overrun 16.6 ms; prints the scaling curve")
+    parser.add_argument("--hitch-log", metavar="FILE", default=None, help="Where to log over-budget frames (default: hitches.jsonl beside the game)")
+    parser.add_argument("--hitch-budget", type=float, default=2.0, metavar="X", help="Log frames longer than X times the 1/FPS target (default 2)")
+    parser.add_argument("--no-hitch-log", action="store_true", help="Don't watch for frame hitches")
+    parser.add_argument("--trace", metavar="FILE", default=None, help="Write a Chrome trace (chrome://tracing, Perfetto) of the session to FILE on exit")
     args = parser.parse_args()
 
+    if args.soa:
+        from nanmon.projectiles import use_array_store
+        if not use_array_store(True):
+            print("--soa ignored: numpy is not installed", file=sys.stderr)
+
+    if args.replay:
+        from nanmon.replay import main as replay_main
+        sys.exit(replay_main(args.replay))
+
+    if args.stress is not None:
+        from nanmon.bench import main as bench_main
+        sys.exit(bench_main(["--stress", str(args.stress)]))
+
     # Optional Windows DPI awareness before pygame.init()
     _maybe_set_windows_dpi_aware()
 
-    while True:
-        res = run_game(headless_seconds=args.headless, smooth_scale=args.smooth_scale, margin=args.margin)
-        if res == "RESTART":
-            continue
-        if isinstance(res, tuple) and len(res) == 2 and res[0] == "NEXT_LEVEL":
-            # Start next level directly, skipping the menu
-            _, lvl = res
-            res = run_game(headless_seconds=args.headless, smooth_scale=args.smooth_scale, margin=args.margin, start_level=int(lvl))
+    if args.trace:
+        trace.start(args.trace)
+    if not args.no_hitch_log:
+        hitch.start(args.hitch_log, args.hitch_budget)
+
+    extra = {}
+    if args.seed is not None:
+        extra["seed"] = args.seed
+    runs = 0
+
+    def _opts():
+        nonlocal runs
+        runs += 1
+        if args.record:
+            root, ext = os.path.splitext(args.record)
+            extra["record_path"] = args.record if runs == 1 else f"{root}-{runs}{ext}"
+        return extra
+
+    # One window/mixer for the whole process; each level is played on top of it
+    try:
+        session = GameSession(headless_seconds=args.headless, smooth_scale=args.smooth_scale,
+                              margin=args.margin, dirty_rects=args.dirty_rects)
+    except pygame.error:
+        return
+    level = None  # None: start from the menu
+    try:
+        while True:
+            res = play_level(session, start_level=level, **_opts())
             if res == "RESTART":
-                continue
-            if isinstance(res, tuple) and len(res) == 2 and res[0] == "NEXT_LEVEL":
-                # loop to support multiple consecutive NEXT_LEVEL signals
-                continue
-            break
-        break
+                trace.instant("restart")
+                level = None
+            elif isinstance(res, tuple) and len(res) == 2 and res[0] == "NEXT_LEVEL":
+                # Start next level directly, skipping the menu
+                level = int(res[1])
+                trace.instant("next_level", level=level)
+            else:
+                break
+    finally:
+        session.close()
+        trace.flush()
+        hitch.stop()
 
 
 if __name__ == "__main__":
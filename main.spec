@@ -1,11 +1,15 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+import shutil
 
 
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
-    datas=[('nanmon/assets', 'nanmon/assets')],
+    # assets ship as one pack beside the executable (copied below), not in
+    # datas, which a onefile build would extract before the first frame
+    datas=[],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
@@ -36,3 +40,8 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
 )
+
+# dist/nanmon/assets.pak, where nanmon.resources looks first in a frozen build:
+# `python -m nanmon.bake`, then `python -m nanmon.pack` before building
+os.makedirs(os.path.join(DISTPATH, 'nanmon'), exist_ok=True)
+shutil.copy2(os.path.join(SPECPATH, 'nanmon', 'assets.pak'), os.path.join(DISTPATH, 'nanmon', 'assets.pak'))
@@ -0,0 +1,315 @@
+"""Process-wide registry for decoded images and sounds.
+
+Lookups are keyed by (path, size, flags), so each file/size/format is
+decoded and converted once. A sized request scales from the unscaled entry
+when someone holds it, and otherwise decodes transiently instead of keeping
+a full-resolution copy around (several source PNGs are far larger than
+they are ever drawn). Paths go through nanmon.resources, so they don't
+depend on the cwd, "nanmon/assets/x.png" and an absolute path to the same
+file share an entry, and files come out of the asset pack when there is
+one.
+
+Every lookup counts a use on behalf of a scope. These aren't refcounts
+that callers give back one at a time: a scope's uses are only dropped all
+together, by `release(scope)`, and an entry is freed once no scope holds
+it. `LEVEL` stands for whichever level is running (`set_level`), and is
+released when the next level starts, so boss sprites, backdrops and
+clear-animation art don't pile up across levels. `APP` (the default) is
+never released: APP entries stay for the whole process.
+
+Cached surfaces are shared between callers: copy() before drawing into one.
+Missing or broken files raise just like pygame.image.load / mixer.Sound.
+
+A file can also be handed in as a decode running elsewhere (`expect`, used
+by nanmon.preload): a lookup then takes that result, waiting for it if it
+isn't done, instead of reading the file again.
+
+Sized requests are served from the offline bake (`python -m nanmon.bake`)
+when it has them: raw pixels mapped straight from ASSET_BAKED_DIR instead
+of decoding and scaling the full-size file. A baked entry whose source file
+has changed since (mtime or size) is ignored and the file decoded as before.
+"""
+from __future__ import annotations
+import json
+import os
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+import pygame
+from . import resources, trace
+from .constants import ASSET_BAKED_DIR
+
+BAKE_VERSION = 1
+BAKED_INDEX = f"{ASSET_BAKED_DIR}/index.json"
+BAKED_PIXELS = f"{ASSET_BAKED_DIR}/pixels.raw"
+
+APP = "app"
+LEVEL = "level"  # resolved to the current level's scope
+
+_entries: dict[tuple, "_Entry"] = {}
+_level_scope = "level:0"
+_counts = {"decodes": 0, "loads": 0, "hits": 0, "freed": 0}
+_lock = threading.Lock()  # counters (decode() runs on preload workers)
+_quit_hooked = False
+_pending: dict[str, Future] = {}  # normalised path -> off-thread decode
+_baked_index: dict[str, dict] | None = None  # None until first looked at
+_baked_pixels: memoryview | None = None
+
+
+@dataclass(frozen=True)
+class Asset:
+    """One registry request, described ahead of time for preloading."""
+    path: str
+    size: tuple[int, int] | None = None
+    alpha: bool = True
+    smooth: bool = False
+    scope: str = APP
+    sound: bool = False
+
+
+class _Entry:
+    __slots__ = ("value", "refs")
+
+    def __init__(self, value):
+        self.value = value
+        self.refs: dict[str, int] = {}
+
+
+def _count(name: str, n: int = 1) -> None:
+    with _lock:
+        _counts[name] += n
+
+
+def _norm(path: str) -> str:
+    return os.path.normcase(resources.resolve(path))
+
+
+def _key(path: str, size, flags: str) -> tuple:
+    path = _norm(path)
+    if size is not None:
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+    return (path, size, flags)
+
+
+def _source(key: tuple):
+    """An expected off-thread decode of key's file, or None to read it here."""
+    fut = _pending.get(key[0])
+    return fut.result() if fut is not None else None
+
+
+def bake_key(key: tuple) -> str:
+    """Name of a sized registry key in the bake index."""
+    path, (w, h), flags = key
+    return f"{resources.name(path)}|{w}x{h}|{flags}"
+
+
+def _bake_entry(key: tuple) -> dict | None:
+    """key's bake index entry if there is a bake and it is current, else None."""
+    global _baked_index, _baked_pixels
+    if _baked_index is None:
+        _baked_index = {}
+        try:
+            index = json.loads(resources.read(BAKED_INDEX))
+            if index.get("version") == BAKE_VERSION and index.get("pygame") == pygame.version.ver:
+                _baked_pixels = resources.view(BAKED_PIXELS)
+                _baked_index = index["entries"]
+        except Exception:
+            pass  # no bake (or a broken one): decode everything
+    if not _baked_index or key[1] is None:
+        return None
+    e = _baked_index.get(bake_key(key))
+    if e is None:
+        return None
+    try:
+        mtime_ns, size = resources.stat(key[0])
+    except OSError:
+        return None
+    if mtime_ns != e["mtime_ns"] or size != e["file_size"]:
+        return None  # stale
+    return e
+
+
+def _baked(key: tuple) -> pygame.Surface | None:
+    """key's pre-scaled pixels over the bake's mmap (not converted yet)."""
+    e = _bake_entry(key)
+    if e is None:
+        return None
+    off = e["offset"]
+    return pygame.image.frombuffer(_baked_pixels[off:off + e["length"]], key[1], e["format"])
+
+
+def _lookup(key: tuple, scope: str, make):
+    e = _entries.get(key)
+    if e is None:
+        with trace.span("assets.load", "assets", path=key[0], size=key[1], flags=key[2]):
+            e = _Entry(make())  # raises before anything is stored
+        _entries[key] = e
+        _count("loads")
+    else:
+        _count("hits")
+    scope = _level_scope if scope == LEVEL else scope
+    e.refs[scope] = e.refs.get(scope, 0) + 1
+    return e.value
+
+
+def image(path: str, size: tuple[int, int] | None = None, *, alpha: bool = True,
+          smooth: bool = False, scope: str = APP) -> pygame.Surface:
+    """`path` converted for the display (convert_alpha, or convert when
+    `alpha` is False), scaled to `size` if given (nearest neighbour unless
+    `smooth`)."""
+    flags = "alpha" if alpha else "opaque"
+    if size is not None and smooth:
+        flags += "+smooth"
+    key = _key(path, size, flags)
+
+    def make():
+        base = _entries.get((key[0], None, key[2].split("+")[0]))
+        if base is not None:
+            base = base.value
+        else:
+            baked = _baked(key) if key[1] is not None else None
+            if baked is not None:
+                return baked.convert_alpha() if alpha else baked.convert()
+            raw = _source(key)
+            if raw is None:
+                _count("decodes")
+                raw = pygame.image.load(resources.source(path), path)
+            base = raw.convert_alpha() if alpha else raw.convert()
+        if key[1] is None:
+            return base
+        scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        return scale(base, key[1])
+
+    return _lookup(key, scope, make)
+
+
+def _drop_sounds() -> None:
+    # Sounds die with the mixer; surfaces survive pygame.quit() and are kept
+    global _quit_hooked
+    _quit_hooked = False
+    for key in [k for k in _entries if k[2] == "sound"]:
+        del _entries[key]
+
+
+def sound(path: str, *, scope: str = APP) -> pygame.mixer.Sound:
+    """A shared Sound for `path` (the mixer must already be initialised)."""
+    global _quit_hooked
+
+    key = _key(path, None, "sound")
+
+    def make():
+        snd = _source(key)
+        if snd is None:
+            _count("decodes")
+            snd = pygame.mixer.Sound(resources.source(path))
+        return snd
+
+    if not _quit_hooked:
+        pygame.register_quit(_drop_sounds)  # quit hooks run once, so re-arm
+        _quit_hooked = True
+
+    return _lookup(key, scope, make)
+
+
+def load(asset: Asset):
+    """Fetch `asset` through image() or sound()."""
+    if asset.sound:
+        return sound(asset.path, scope=asset.scope)
+    return image(asset.path, asset.size, alpha=asset.alpha, smooth=asset.smooth, scope=asset.scope)
+
+
+def _asset_key(asset: Asset) -> tuple:
+    if asset.sound:
+        return _key(asset.path, None, "sound")
+    flags = "alpha" if asset.alpha else "opaque"
+    if asset.size is not None and asset.smooth:
+        flags += "+smooth"
+    return _key(asset.path, asset.size, flags)
+
+
+def cached(asset: Asset) -> bool:
+    return _asset_key(asset) in _entries
+
+
+def baked(asset: Asset) -> bool:
+    """True if `asset` will come from the bake rather than its file."""
+    if asset.sound or asset.size is None:
+        return False
+    return _bake_entry(_asset_key(asset)) is not None
+
+
+def scaled_images() -> dict[tuple, pygame.Surface]:
+    """Every sized image held right now, by registry key (for nanmon.bake)."""
+    return {k: e.value for k, e in _entries.items() if k[1] is not None and k[2] != "sound"}
+
+
+def expect(path: str, future: Future) -> None:
+    """Use `future`'s result (an unconverted Surface, or a Sound) the next
+    time `path` has to be decoded, until `forget(path)`."""
+    _pending[_norm(path)] = future
+
+
+def forget(path: str) -> None:
+    _pending.pop(_norm(path), None)
+
+
+def decode(asset: Asset):
+    """Read and decode `asset`'s file without touching the display or the
+    registry, so it is safe off the main thread; hand the result in with
+    `expect`."""
+    _count("decodes")
+    with trace.span("assets.decode", "assets", path=asset.path):
+        if asset.sound:
+            return pygame.mixer.Sound(resources.source(asset.path))
+        return pygame.image.load(resources.source(asset.path), asset.path)
+
+
+def release(scope: str) -> int:
+    """Drop every reference `scope` holds; returns how many entries were freed."""
+    scope = _level_scope if scope == LEVEL else scope
+    dead = []
+    for key, e in _entries.items():
+        if e.refs.pop(scope, None) is not None and not e.refs:
+            dead.append(key)
+    for key in dead:
+        del _entries[key]
+    _count("freed", len(dead))
+    return len(dead)
+
+
+def set_level(level) -> None:
+    """Point `LEVEL` at `level`, releasing the previous level's assets."""
+    global _level_scope
+    scope = f"level:{level}"
+    if scope != _level_scope:
+        old, _level_scope = _level_scope, scope
+        release(old)
+
+
+def _nbytes(value) -> int:
+    if isinstance(value, pygame.Surface):
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    try:
+        freq, size, channels = pygame.mixer.get_init()
+        return int(value.get_length() * freq) * (abs(size) // 8) * channels
+    except Exception:
+        return 0
+
+
+def counts() -> dict:
+    """Just the decode/load/hit/free counters (cheap enough to poll per frame)."""
+    with _lock:
+        return dict(_counts)
+
+
+def stats() -> dict:
+    """Entry count, approximate pixel/PCM bytes held, and decode/load/hit/free counters."""
+    images = sum(1 for k in _entries if k[2] != "sound")
+    sound_bytes = sum(_nbytes(e.value) for k, e in _entries.items() if k[2] == "sound")
+    return {
+        "images": images,
+        "sounds": len(_entries) - images,
+        "bytes": sum(_nbytes(e.value) for e in _entries.values()),
+        "sound_bytes": sound_bytes,
+        **counts(),
+    }
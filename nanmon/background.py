@@ -3,6 +3,7 @@
 from __future__ import annotations
 import pygame
 from typing import Sequence, Tuple
+from . import assets
 
 class ScrollingBackground:
     """
@@ -28,6 +29,12 @@ class ScrollingBackground:
         self.index = 0
         self.offset = 0.0
 
+    @staticmethod
+    def preload_assets(image_paths: Sequence[str], canvas_size: Tuple[int, int]) -> list[assets.Asset]:
+        """What `_load_image` will ask the registry for."""
+        return [assets.Asset(p, tuple(canvas_size), alpha=False, scope=assets.LEVEL)
+                for p in dict.fromkeys(image_paths) if p]
+
     def _load_image(self, index: int) -> pygame.Surface | None:
         """Lazily load an image at the given index."""
         if self.images[index] is not None:
@@ -38,8 +45,8 @@ class ScrollingBackground:
             return None
             
         try:
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.scale(img, (self.w, self.h))
+            # 背景整層不透明：用 convert()，貼圖時不需逐像素混色
+            img = assets.image(path, (self.w, self.h), alpha=False, scope=assets.LEVEL)
             self.images[index] = img
             return img
         except Exception:
@@ -0,0 +1,119 @@
+"""Offline asset bake: pre-scaled raw pixels for every sized image request.
+
+    python -m nanmon.bake
+
+Builds what the levels, the title menu and the finish screens ask the asset
+registry for (foods at each level's scale, heads and hats at MOUTH_SIZE,
+boss sprites and targets, backdrops, menu art, hat showcases) exactly as
+the game would, and writes the scaled pixels uncompressed to
+ASSET_BAKED_DIR: one pixels.raw blob plus an index.json giving each
+variant's offset, format and its source file's mtime and size. At runtime
+nanmon.assets maps the blob and builds those surfaces with frombuffer
+instead of decoding full-size PNGs and scaling them down.
+
+Re-run after changing art or sizes; until then the changed files are
+simply decoded as before. Unsized requests aren't baked.
+"""
+from __future__ import annotations
+import json
+import os
+import sys
+import time
+import pygame
+from . import assets, resources
+from .constants import WIDTH, HEIGHT, ASSET_BAKED_DIR
+from .levels import get_level
+from .unlocks import list_all_hats
+
+LEVELS = (1, 2, 3)
+
+
+def _collect() -> dict[tuple, pygame.Surface]:
+    """Load everything the game scales, level by level, and return it by key."""
+    from .preload import level_manifest
+    from .init_menu import InitMenu
+    from .clear_screen import FinishScreen, hat_showcase
+    from .models import EatenCounters
+
+    found: dict[tuple, pygame.Surface] = {}
+    hats = list_all_hats()
+    for level in LEVELS:
+        assets.set_level(level)
+        cfg = get_level(level)
+        for hat in [None] + hats:
+            for a in level_manifest(cfg, hat):
+                if a.size is None or a.sound:
+                    continue
+                try:
+                    assets.load(a)
+                except Exception:
+                    pass  # missing art: the game falls back on its own too
+        try:
+            FinishScreen(EatenCounters(), level, 0)
+        except Exception:
+            pass
+        found.update(assets.scaled_images())
+    try:
+        InitMenu()
+    except Exception:
+        pass
+    for hat in hats:
+        try:
+            hat_showcase(hat)
+        except Exception:
+            pass
+    found.update(assets.scaled_images())
+    assets.set_level(0)
+    return found
+
+
+def bake(out_dir: str = resources.resolve(ASSET_BAKED_DIR)) -> dict:
+    """Write the bake to `out_dir`; returns its index."""
+    entries = {}
+    os.makedirs(out_dir, exist_ok=True)
+    pixels = os.path.join(out_dir, "pixels.raw")
+    index_path = os.path.join(out_dir, "index.json")
+    # write beside and swap in, so a running game never maps a half-written blob
+    with open(pixels + ".tmp", "wb") as f:
+        for key, surf in sorted(_collect().items(), key=lambda kv: assets.bake_key(kv[0])):
+            mtime_ns, size = resources.stat(key[0])
+            fmt = "RGB" if key[2].startswith("opaque") else "RGBA"
+            data = pygame.image.tobytes(surf, fmt)
+            entries[assets.bake_key(key)] = {
+                "offset": f.tell(),
+                "length": len(data),
+                "format": fmt,
+                "mtime_ns": mtime_ns,
+                "file_size": size,
+            }
+            f.write(data)
+    index = {"version": assets.BAKE_VERSION, "pygame": pygame.version.ver, "entries": entries}
+    with open(index_path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(pixels + ".tmp", pixels)
+    os.replace(index_path + ".tmp", index_path)
+    return index
+
+
+def main() -> int:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+    try:
+        pygame.display.set_mode((WIDTH, HEIGHT))  # convert() needs a display
+        try:
+            pygame.mixer.init()
+        except Exception:
+            pass
+        t0 = time.perf_counter()
+        index = bake()
+        total = sum(e["length"] for e in index["entries"].values())
+        print(f"baked {len(index['entries'])} images, {total / (1024 * 1024):.1f} MB "
+              f"in {time.perf_counter() - t0:.1f}s -> {ASSET_BAKED_DIR}")
+    finally:
+        pygame.quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,482 @@
+"""Headless benchmark suite: fixed-seed scenarios, JSON results, baseline check.
+
+    python -m nanmon.bench                    # every scenario, JSON on stdout
+    python -m nanmon.bench -k coffin          # only names containing "coffin"
+    python -m nanmon.bench --out run.json     # also write the results to a file
+    python -m nanmon.bench --save-baseline    # make this run the baseline
+
+Scenarios drive the real Simulation and draw code one tick per frame with
+scripted input, so the same seed does the same work every run: each level's
+normal phase, the food cap held full, every Coffin and OrangePork attack
+pinned in turn, the finish-screen spew with a few hundred foods, and
+DisplayManager.present into 1080p and 4K windows. Each runs in a fresh
+interpreter (its own caches, its own peak RSS) and reports frames/sec,
+frame-time percentiles and peak RSS.
+
+The results are compared with BASELINE (a previous `--save-baseline` run
+on the same machine; timings don't carry across machines): fps down, or
+p99 or peak RSS up, by more than TOLERANCE is a regression, listed in the
+output and reflected in the exit status.
+"""
+from __future__ import annotations
+import argparse
+import dataclasses
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # stdout is the JSON
+import pygame
+from .constants import BG_COLOR, FPS, RNG_SEED, SIM_DT
+from .boss import Coffin, OrangePork
+from .perf import percentiles
+from .simulation import FrameInput
+from . import resources
+
+BASELINE = "nanmon/bench_baseline.json"
+TOLERANCE = 0.15  # relative change that counts as a regression
+WARMUP = 60  # frames run before timing starts
+FRAMES = 600
+NEVER = 1e9  # boss_spawn_time for runs that place the boss themselves
+
+# --stress: density goes up RAMP-fold every STEP_SECONDS until a frame's work
+# no longer fits BUDGET_MS; SHARES is what each subsystem may take of it
+BUDGET_MS = 1000.0 / FPS
+STEP_SECONDS = 2.0
+RAMP = 1.25
+MAX_STEPS = 40
+SUBSYSTEMS = {  # perf sections each subsystem is made of
+    "update": ("mouth", "foods", "boss", "sim"),
+    "collide": ("collisions",),
+    "draw": ("world", "hud"),
+    "present": ("present",),
+}
+SHARES = {"update": 0.35, "collide": 0.2, "draw": 0.3, "present": 0.15}
+STRESS_ATTACKS = {2: "s_curve", 3: "circle_spiral"}  # one steady pattern, so the mix can't swing the count
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    except ImportError:
+        pass
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class _Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        c = _Counters()
+        c.cb = ctypes.sizeof(c)
+        proc = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(proc, ctypes.byref(c), c.cb):
+            return round(c.PeakWorkingSetSize / (1024 * 1024), 1)
+    except Exception:
+        pass
+    return None
+
+
+def _script(tick: int):
+    """Scripted player input for `tick`: sweeps, drifts, switches mode every 2s."""
+    t = tick * SIM_DT
+    return FrameInput(math.sin(t * 1.3), 0.6 * math.sin(t * 0.7), 1 if tick % 120 == 119 else 0)
+
+
+def _session():
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from .session import GameSession
+    return GameSession(headless_seconds=0)
+
+
+def _level_sim(cfg, *, boss: bool = False):
+    """A Simulation of `cfg` with the level's art loaded (parry gate open),
+    optionally with its boss already in."""
+    from . import assets
+    from .preload import level_manifest
+    from .rng import reseed
+    from .simulation import Simulation
+
+    assets.set_level(cfg.level)
+    for a in level_manifest(cfg):
+        try:
+            assets.load(a)
+        except Exception:
+            pass
+    reseed(RNG_SEED)
+    sim = Simulation(cfg)
+    sim.l3_parry_done = True  # normal spawning in level 3 too
+    if boss:
+        sim.spawn_boss_now()
+    return sim
+
+
+def _tick(sim, tick: int) -> None:
+    """Step `sim` one tick of scripted play that never ends."""
+    sim.nausea = 0.0  # no game over
+    if sim.boss is not None:
+        sim.boss.lifetime = 0.0  # and no boss leaving
+    sim.step(SIM_DT, _script(tick))
+
+
+def _draw(sim, bg, dm, font) -> None:
+    """Draw the world and HUD as the game loop does, and present."""
+    from . import perf
+    from .hud import draw_hud
+    from .neck import draw_neck
+
+    frame = dm.get_logical_surface()
+    boss = sim.boss
+    bg.update(SIM_DT)
+    bg.draw(frame, BG_COLOR)
+    if boss is not None:
+        boss.draw(frame)
+    draw_neck(frame, sim.mouth.rect, sim.elapsed)
+    sim.foods.draw(frame)
+    sim.mouth.draw(frame)
+    sim.smoke.draw(frame)
+    sim.shake.update(SIM_DT)
+    sim.shake.apply(frame, sim.shake.offset(), dm.bg_color)
+    perf.lap("world")
+    draw_hud(frame, font, sim.mouth, sim.nausea, sim.eaten, int(sim.score), 0, False, False)
+    if boss is None:
+        sim.progress.draw(frame)
+    perf.lap("hud")
+    dm.present()
+    pygame.event.pump()
+    perf.lap("present")
+
+
+def _backdrop(cfg, dm):
+    from .background import ScrollingBackground
+    return ScrollingBackground(image_paths=cfg.bg_images, canvas_size=dm.logical.get_size(),
+                               speed_y=cfg.bg_scroll_speed)
+
+
+def _play(level: int, *, attack: str | None = None, saturate: bool = False, frames: int = FRAMES) -> list[float]:
+    """Gameplay frames: step one tick, draw the world and HUD, present."""
+    from .levels import get_level
+
+    session = _session()
+    try:
+        cfg = dataclasses.replace(get_level(level), boss_spawn_time=NEVER)
+        if saturate:
+            cfg = dataclasses.replace(cfg, spawn_interval_min=0.0, spawn_interval_max=SIM_DT)
+        sim = _level_sim(cfg, boss=attack is not None)
+        if attack is not None:
+            sim.boss.ATTACKS = (attack,)
+        bg = _backdrop(cfg, session.dm)
+        times = []
+        tick = 0
+        arrive = 600  # most ticks to wait for a boss to finish its entrance
+        warm = WARMUP
+        last = time.perf_counter()
+        while len(times) < frames:
+            _tick(sim, tick)
+            tick += 1
+            _draw(sim, bg, session.dm, session.font)
+            now = time.perf_counter()
+            if sim.boss is not None and not sim.boss.active and arrive > 0:
+                arrive -= 1
+            elif warm > 0:
+                warm -= 1
+            else:
+                times.append(now - last)
+            last = now
+        return times
+    finally:
+        session.close()
+
+
+class _Clock:
+    """Stands in for pygame's Clock in a screen's own loop: hands out a fixed
+    dt, times each frame, and posts QUIT after WARMUP + `frames`."""
+
+    def __init__(self, frames: int):
+        self.frames = frames
+        self.times: list[float] = []
+        self._n = 0
+        self._last = 0.0
+
+    def tick(self, framerate: int = 0) -> float:
+        now = time.perf_counter()
+        if self._n > WARMUP:
+            self.times.append(now - self._last)
+        self._last = now
+        self._n += 1
+        if len(self.times) >= self.frames:
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        return 1000.0 / 60
+
+
+def _finish(per_kind: int = 24, frames: int = 1500) -> list[float]:
+    """The finish screen spewing `per_kind` of every food."""
+    from .clear_screen import FinishScreen
+    from .models import EatenCounters, KINDS
+    from .rng import reseed
+
+    session = _session()
+    try:
+        reseed(RNG_SEED)
+        eaten = EatenCounters()
+        for k in KINDS:
+            if k not in ("DOG", "BREAD"):  # hotdog halves aren't eaten on their own
+                eaten.per_type[k] = per_kind
+        eaten.total = eaten.correct = sum(eaten.per_type.values())
+        clock = _Clock(frames)
+        FinishScreen(eaten, level=3, score=eaten.total * 10).loop(session.dm, clock)
+        return clock.times
+    finally:
+        session.close()
+
+
+def _present(size: tuple[int, int], frames: int = FRAMES) -> list[float]:
+    """DisplayManager.present scaling a full frame into a `size` window."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from .display_manager import DisplayManager
+    pygame.init()
+    try:
+        dm = DisplayManager(initial_size=size)
+        frame = dm.get_logical_surface()
+        w, h = frame.get_size()
+        for y in range(0, h, 30):
+            pygame.draw.rect(frame, (y % 255, 120, 255 - y % 255), (0, y, w, 30))
+        times = []
+        last = time.perf_counter()
+        for i in range(WARMUP + frames):
+            dm.present()
+            pygame.event.pump()
+            now = time.perf_counter()
+            if i >= WARMUP:
+                times.append(now - last)
+            last = now
+        return times
+    finally:
+        pygame.quit()
+
+
+SCENARIOS: dict[str, tuple] = {
+    "level1": (_play, {"level": 1}),
+    "level2": (_play, {"level": 2}),
+    "level3": (_play, {"level": 3}),
+    "saturation": (_play, {"level": 3, "saturate": True}),
+    **{f"coffin_{a}": (_play, {"level": 3, "attack": a}) for a in Coffin.ATTACKS},
+    **{f"orangepork_{a}": (_play, {"level": 2, "attack": a}) for a in OrangePork.ATTACKS},
+    "finish_spew": (_finish, {}),
+    "present_1080p": (_present, {"size": (1920, 1080)}),
+    "present_4k": (_present, {"size": (3840, 2160)}),
+}
+
+
+def run_one(name: str) -> dict:
+    """Run scenario `name` in this process and summarise it."""
+    fn, kw = SCENARIOS[name]
+    times = fn(**kw)
+    ms = [t * 1000.0 for t in times]
+    total = sum(times)
+    p50, p95, p99 = percentiles(ms)
+    return {
+        "frames": len(ms),
+        "fps": round(len(ms) / total, 1) if total > 0 else None,
+        "frame_ms": {
+            "mean": round(sum(ms) / len(ms), 3) if ms else None,
+            "p50": round(p50, 3),
+            "p95": round(p95, 3),
+            "p99": round(p99, 3),
+            "max": round(max(ms), 3) if ms else None,
+        },
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run(names: list[str]) -> dict:
+    """Each scenario in a child interpreter, so caches and peak RSS start clean."""
+    out = {}
+    for name in names:
+        proc = subprocess.run([sys.executable, "-m", "nanmon.bench", "--one", name],
+                              cwd=resources.ROOT, capture_output=True, text=True)
+        try:
+            out[name] = json.loads(proc.stdout.strip().splitlines()[-1])
+        except (IndexError, ValueError):
+            out[name] = {"error": (proc.stderr.strip().splitlines() or ["no output"])[-1]}
+        print(f"{name:<28}{out[name].get('fps', '-')!s:>8} fps", file=sys.stderr)
+    return out
+
+
+def regressions(results: dict, baseline: dict, tolerance: float = TOLERANCE) -> dict[str, list[str]]:
+    """What got worse than `baseline` by more than `tolerance`, per scenario."""
+    found = {}
+    for name, r in results.items():
+        b = baseline.get(name)
+        if not b or "error" in b:
+            continue
+        if "error" in r:
+            found[name] = [r["error"]]
+            continue
+        bad = []
+        if b.get("fps") and r.get("fps") is not None and r["fps"] < b["fps"] * (1 - tolerance):
+            bad.append(f"fps {r['fps']} < {b['fps']}")
+        bp99, rp99 = b["frame_ms"]["p99"], r["frame_ms"]["p99"]
+        if bp99 and rp99 > bp99 * (1 + tolerance):
+            bad.append(f"p99 {rp99} ms > {bp99} ms")
+        if b.get("peak_rss_mb") and r.get("peak_rss_mb") and r["peak_rss_mb"] > b["peak_rss_mb"] * (1 + tolerance):
+            bad.append(f"peak RSS {r['peak_rss_mb']} MB > {b['peak_rss_mb']} MB")
+        if bad:
+            found[name] = bad
+    return found
+
+
+def stress(level: int = 3) -> dict:
+    """Ramp `level` (boss in) until the frame budget breaks: foods arrive at
+    k times the level's usual rate, up to k times its cap, and the boss's
+    attack timers run k times as fast, k growing RAMP-fold every
+    STEP_SECONDS. The boss keeps to one attack (STRESS_ATTACKS) so the
+    count tracks k rather than its random pick. Returns the per-step curve
+    (entity counts are means over the step's frames) and, for each
+    subsystem, the most entities seen by the step where it first took more
+    than its share of BUDGET_MS; counts still wobble a little as patterns
+    cycle, so a crossing is never reported below an earlier step's count."""
+    from . import perf
+    from .food import make_food
+    from .levels import get_level
+
+    session = _session()
+    try:
+        cfg = dataclasses.replace(get_level(level), boss_spawn_time=NEVER)
+        sim = _level_sim(cfg, boss=True)
+        if level in STRESS_ATTACKS:
+            sim.boss.ATTACKS = (STRESS_ATTACKS[level],)
+        bg = _backdrop(cfg, session.dm)
+        rate = 2.0 / (cfg.spawn_interval_min + cfg.spawn_interval_max)  # foods/s
+        per_step = int(STEP_SECONDS / SIM_DT)
+        perf.toggle()
+        tick = 0
+        while sim.boss is not None and not sim.boss.active and tick < 600:
+            _tick(sim, tick)  # the entrance doesn't attack; skip it
+            tick += 1
+        k = 1.0
+        owed = 0.0
+        curve = []
+        crossed: dict[str, int | None] = dict.fromkeys(SUBSYSTEMS)
+        broke = None
+        peak = 0  # most entities any step so far averaged
+        for _ in range(MAX_STEPS):
+            cap = int(cfg.max_onscreen_food * k)
+            if sim.boss is not None:
+                sim.boss.fire_rate = k
+            foods, shots = [], []
+            for _ in range(per_step):
+                perf.frame()
+                owed += rate * k * SIM_DT
+                while owed >= 1.0:
+                    owed -= 1.0
+                    if len(sim.foods) < cap:
+                        sim.foods.add(make_food(sim.rng, cfg))
+                _tick(sim, tick)
+                tick += 1
+                _draw(sim, bg, session.dm, session.font)
+                foods.append(len(sim.foods))
+                shots.append(len(sim.boss.projectiles) if sim.boss is not None else 0)
+            perf.frame()  # file the step's last frame
+            frames = perf.history()[-per_step:]
+            n = max(1, len(frames))
+            work = sum(f[1] for f in frames) / n
+            split = {name: round(sum(f[2][s] for f in frames for s in secs) / n, 3)
+                     for name, secs in SUBSYSTEMS.items()}
+            food = sum(foods) / len(foods)
+            shot = sum(shots) / len(shots)
+            count = round(food + shot)
+            peak = max(peak, count)
+            curve.append({"k": round(k, 3), "entities": count, "foods": round(food),
+                          "projectiles": round(shot), "work_ms": round(work, 3),
+                          "split_ms": split})
+            for name, ms in split.items():
+                if crossed[name] is None and ms > SHARES[name] * BUDGET_MS:
+                    crossed[name] = peak
+            print(f"k {k:6.2f}  entities {count:5d}  work {work:6.2f} ms  "
+                  + "  ".join(f"{name} {ms:.2f}" for name, ms in split.items()), file=sys.stderr)
+            if work > BUDGET_MS:
+                broke = peak
+                break
+            k *= RAMP
+        perf.toggle()
+        return {
+            "level": level,
+            "budget_ms": round(BUDGET_MS, 2),
+            "shares": SHARES,
+            "broke_at_entities": broke,
+            "crossed_at_entities": crossed,
+            "curve": curve,
+        }
+    finally:
+        session.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m nanmon.bench")
+    parser.add_argument("-k", dest="match", default=None, help="Only run scenarios whose name contains this")
+    parser.add_argument("--list", action="store_true", help="List the scenarios and exit")
+    parser.add_argument("--out", metavar="FILE", default=None, help="Also write the results to FILE")
+    parser.add_argument("--baseline", metavar="FILE", default=resources.resolve(BASELINE))
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--stress", type=int, nargs="?", const=3, default=None, metavar="LEVEL",
+                        help="Ramp density on LEVEL (default 3) until the frame budget breaks")
+    parser.add_argument("--one", default=None, help=argparse.SUPPRESS)  # child process
+    args = parser.parse_args(argv)
+
+    if args.stress is not None:
+        report = {"python": platform.python_version(), "pygame": pygame.version.ver,
+                  "platform": platform.platform(), **stress(args.stress)}
+        text = json.dumps(report, indent=2)
+        print(text)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        return 0
+
+    if args.one:
+        print(json.dumps(run_one(args.one)))
+        return 0
+    if args.list:
+        print("\n".join(SCENARIOS))
+        return 0
+
+    names = [n for n in SCENARIOS if args.match is None or args.match in n]
+    report = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+        "seed": RNG_SEED,
+        "scenarios": run(names),
+    }
+    baseline = None
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["scenarios"]
+    except (OSError, ValueError, KeyError):
+        pass
+    if baseline is not None:
+        report["regressions"] = regressions(report["scenarios"], baseline, args.tolerance)
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    return 1 if report.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,7 @@ Level-aware: accepts an optional LevelConfig to tweak visuals, movement, attacks
 from __future__ import annotations
 
 import math
-import random
+import os
 import pygame
 
 from .constants import (
@@ -34,13 +34,48 @@ from .constants import (
     BOSS_BEAM_RATE,
     BOSS_BEAM_SPEED,
 )
-from .food import Food
+from .food import food_pool
+from .projectiles import make_group, BOSS_CULL
 from .target import Target
+from . import target as _target
 from .effects import Smoke
+from . import assets, resources, soundbank, trace
 from .levels import LevelConfig
+from .rng import stream
+
+_rng = stream("boss")
+_fx_rng = stream("boss_fx")  # draw-time jitter only
+
+_SOUND_DIR = os.path.join(os.path.dirname(__file__), 'assets', 'sounds')
+_SOUND_FILES = ('boss1_sounds.wav', 'boss1_hurt_sounds.wav', 'game_over_sounds.wav', 'level_clear_sounds.wav')
+
+DYING_TINT_STEPS = 8  # shades of the death-throes red ramp
+SHIELD_BREATH_STEP = 0.02  # Coffin shield brightness is snapped to this
+
+_SALTY_KINDS = frozenset({"DORITOS", "BURGERS", "FRIES", "FRIEDCHICKEN", "RIBS", "HOTDOG", "TAIWANBURGER", "STINKYTOFU"})
 
 
 class Boss(pygame.sprite.Sprite):
+    # Subclasses with their own art swap it in after the base sprite loads
+    SPRITE_PATH: str | None = None
+    SPRITE_SIZE: tuple[int, int] | None = None  # None: the level's boss size
+
+    @classmethod
+    def preload_assets(cls, level_cfg: LevelConfig | None = None) -> list[assets.Asset]:
+        """Sprites, weak-point targets and sounds loaded when this boss spawns."""
+        img_path, size = ASSET_BOSS_IMAGE, BOSS_SIZE
+        if level_cfg:
+            b = level_cfg.boss
+            if b.image_path:
+                img_path = b.image_path
+            size = b.size
+        out = [assets.Asset(img_path, size, scope=assets.LEVEL)]
+        if cls.SPRITE_PATH:
+            out.append(assets.Asset(cls.SPRITE_PATH, cls.SPRITE_SIZE or size, scope=assets.LEVEL))
+        out += _target.preload_assets()
+        out += [assets.Asset(os.path.join(_SOUND_DIR, f), sound=True) for f in _SOUND_FILES]
+        return out
+
     def play_boss_music(self):
         if self._boss_snd:
             self._boss_snd.play(-1)
@@ -62,8 +97,7 @@ class Boss(pygame.sprite.Sprite):
                 img_path = b.image_path
             size = b.size
         try:
-            raw = pygame.image.load(img_path).convert_alpha()
-            self.image = pygame.transform.scale(raw, size)
+            self.image = assets.image(img_path, size, scope=assets.LEVEL)
         except Exception:
             self.image = pygame.Surface(size, pygame.SRCALPHA)
             pygame.draw.rect(self.image, WHITE, self.image.get_rect(), 2)
@@ -75,41 +109,38 @@ class Boss(pygame.sprite.Sprite):
         self.left_bound = 40
         self.right_bound = WIDTH - 40
         self.shoot_cd = 0.0
-        self.projectiles = pygame.sprite.Group()
+        self.projectiles = make_group(BOSS_CULL)
         # 音效屬性
-        import os
-        boss_sound_path = os.path.join(os.path.dirname(__file__), 'assets', 'sounds', 'boss1_sounds.wav')
-        hurt_sound_path = os.path.join(os.path.dirname(__file__), 'assets', 'sounds', 'boss1_hurt_sounds.wav')
-        game_over_path = os.path.join(os.path.dirname(__file__), 'assets', 'sounds', 'game_over_sounds.wav')
-        level_clear_path = os.path.join(os.path.dirname(__file__), 'assets', 'sounds', 'level_clear_sounds.wav')
+        boss_sound_path, hurt_sound_path, game_over_path, level_clear_path = (
+            os.path.join(_SOUND_DIR, f) for f in _SOUND_FILES)
         try:
             if not pygame.mixer.get_init():
                 pygame.mixer.init()
-            if os.path.exists(boss_sound_path):
-                self._boss_snd = pygame.mixer.Sound(boss_sound_path)
+            if resources.exists(boss_sound_path):
+                self._boss_snd = soundbank.get(boss_sound_path)
                 self._boss_snd.set_volume(1.0)
             else:
                 self._boss_snd = None
         except Exception as e:
             self._boss_snd = None
         try:
-            if os.path.exists(hurt_sound_path):
-                self._hurt_snd = pygame.mixer.Sound(hurt_sound_path)
+            if resources.exists(hurt_sound_path):
+                self._hurt_snd = soundbank.get(hurt_sound_path)
                 self._hurt_snd.set_volume(1.0)
             else:
                 self._hurt_snd = None
         except Exception as e:
             self._hurt_snd = None
         try:
-            if os.path.exists(game_over_path):
-                self._game_over_snd = pygame.mixer.Sound(game_over_path)
+            if resources.exists(game_over_path):
+                self._game_over_snd = soundbank.get(game_over_path)
             else:
                 self._game_over_snd = None
         except Exception:
             self._game_over_snd = None
         try:
-            if os.path.exists(level_clear_path):
-                self._level_clear_snd = pygame.mixer.Sound(level_clear_path)
+            if resources.exists(level_clear_path):
+                self._level_clear_snd = soundbank.get(level_clear_path)
             else:
                 self._level_clear_snd = None
         except Exception:
@@ -151,11 +182,26 @@ class Boss(pygame.sprite.Sprite):
         self.dying = False
         self.death_timer = 0.0
         self._smoke_cd = 0.0
-        self._smoke = []
+        self._smoke = Smoke()
         # continuous fume while alive scales with damage
         self.fume_cd = 0.0
 
+        # Draw caches: (tint, composited) -> sprite variant, private copy for the spawn fade
+        self._tints: dict[tuple, pygame.Surface] = {}
+        self._fade_img: pygame.Surface | None = None
+        self._bake_todo: list | None = None
+        # Attack timers run this many times as fast (tools like --stress turn it up)
+        self.fire_rate = 1.0
+
+    def _advance_attacks(self, seconds: float) -> None:
+        """Run the attack cooldowns `seconds` further (see fire_rate)."""
+        self.shoot_cd -= seconds
+        self.ring_cd -= seconds
+        self.beam_cd -= seconds
+
     def update(self, dt: float, player_pos: tuple[int, int] | None = None):
+        if self.fire_rate != 1.0 and self.active:
+            self._advance_attacks((self.fire_rate - 1.0) * dt)
         # Handle spawn animation: slide in from top and fade in
         if self.spawning:
             self.spawn_timer -= dt
@@ -196,12 +242,9 @@ class Boss(pygame.sprite.Sprite):
             self.rect.y += int(220 * dt)
             self._smoke_cd -= dt
             if self._smoke_cd <= 0.0:
-                self._smoke.append(Smoke(self.rect.center))
+                self._smoke.puff(self.rect.center)
                 self._smoke_cd = 0.06
-            for s in list(self._smoke):
-                s.update(dt)
-                if not s.alive:
-                    self._smoke.remove(s)
+            self._smoke.update(dt)
             if self.death_timer <= 0.0:
                 self.dead = True
             return
@@ -218,18 +261,12 @@ class Boss(pygame.sprite.Sprite):
         if self.pause_timer > 0.0:
             self.pause_timer -= dt
             # Still update projectiles and weak point
-            for f in list(self.projectiles):
-                f.update(dt, (self.rect.centerx, self.rect.bottom))
-                if (
-                    f.rect.top > HEIGHT + 40
-                    or f.rect.right < -80
-                    or f.rect.left > WIDTH + 80
-                ):
-                    self.projectiles.remove(f)
+            self.projectiles.step(dt, (self.rect.centerx, self.rect.bottom))
             if self.target is None:
                 self.target_cd -= dt
                 if self.target_cd <= 0.0:
                     self.target = Target(self.rect)
+                    trace.instant("target_respawn")
                     # Boss 2: extend weak-point lifetime by +2s
                     try:
                         if self._lvl and getattr(self._lvl, 'level', 0) == 2:
@@ -331,10 +368,7 @@ class Boss(pygame.sprite.Sprite):
                     self.vy = -abs(self.vy)
 
         # Update existing smoke puffs even while alive
-        for s in list(self._smoke):
-            s.update(dt)
-            if not s.alive:
-                self._smoke.remove(s)
+        self._smoke.update(dt)
 
         # Emit fume that ramps up as boss takes hits
         bites_to_kill = (self._lvl.boss.bites_to_kill if self._lvl else BOSS_BITES_TO_KILL)
@@ -343,9 +377,9 @@ class Boss(pygame.sprite.Sprite):
         self.fume_cd -= dt
         if self.fume_cd <= 0.0 and not self.dying and self.active:
             # Spawn a small puff from the top area
-            fx = self.rect.centerx + random.randint(-self.rect.width // 5, self.rect.width // 5)
-            fy = self.rect.top + random.randint(0, 20)
-            self._smoke.append(Smoke((fx, fy)))
+            fx = self.rect.centerx + _rng.randint(-self.rect.width // 5, self.rect.width // 5)
+            fy = self.rect.top + _rng.randint(0, 20)
+            self._smoke.puff((fx, fy))
             # Faster as damage increases
             self.fume_cd = fume_interval
 
@@ -370,7 +404,7 @@ class Boss(pygame.sprite.Sprite):
                 else:
                     self._second_ring_pending = (cat, t)
             if self.ring_cd <= 0.0 and self._second_ring_pending is None:
-                first = random.choice(["SALTY", "SWEET"])
+                first = _rng.choice(["SALTY", "SWEET"])
                 second = "SWEET" if first == "SALTY" else "SALTY"
                 self.spawn_ring(first)
                 gap = (self._lvl.boss.ring_pair_gap if self._lvl else BOSS_RING_PAIR_GAP)
@@ -395,13 +429,12 @@ class Boss(pygame.sprite.Sprite):
                 while self.beam_emit_accum >= 1.0:
                     self.beam_emit_accum -= 1.0
                     kinds = (self._lvl.boss.beam_kinds if self._lvl else ["DORITOS", "SODA"])
-                    kind = self.beam_kind or random.choice(kinds)
-                    salty_set = {"DORITOS", "BURGERS", "FRIES", "FRIEDCHICKEN", "RIBS", "HOTDOG", "TAIWANBURGER", "STINKYTOFU"}
-                    category = "SALTY" if kind in salty_set else "SWEET"
+                    kind = self.beam_kind or _rng.choice(kinds)
+                    category = "SALTY" if kind in _SALTY_KINDS else "SWEET"
                     # Aim horizontally at player if provided
                     px = player_pos[0] if player_pos is not None else self.rect.centerx
                     x = px
-                    f = Food(
+                    f = food_pool.acquire(
                         kind,
                         category,
                         x,
@@ -410,34 +443,18 @@ class Boss(pygame.sprite.Sprite):
                         spawn_center_y=self.rect.bottom,
                     )
                     # small spread
-                    f.vx = random.uniform(-50, 50)
+                    f.vx = _rng.uniform(-50, 50)
                     self.projectiles.add(f)
             elif self.beam_cd <= 0.0:
                 # Start a new beam
                 kinds = (self._lvl.boss.beam_kinds if self._lvl else ["DORITOS", "SODA"])  # all same kind
-                self.beam_kind = random.choice(kinds)
+                self.beam_kind = _rng.choice(kinds)
                 self.beam_timer = (self._lvl.boss.beam_duration if self._lvl else BOSS_BEAM_DURATION)
                 self.beam_emit_accum = 0.0
                 self.beam_cd = beam_interval
 
-        # Update projectiles
-        for f in list(self.projectiles):
-            f.update(dt, (self.rect.centerx, self.rect.bottom))
-            # Allow boss HOTDOGs to split into DOG/BREAD like standard foods
-            spawn_kids = getattr(f, 'spawn_children', None)
-            if spawn_kids:
-                for ch in spawn_kids:
-                    self.projectiles.add(ch)
-                f.spawn_children = None
-                # Remove the now-split parent
-                self.projectiles.remove(f)
-                continue
-            if (
-                f.rect.top > HEIGHT + 40
-                or f.rect.right < -80
-                or f.rect.left > WIDTH + 80
-            ):
-                self.projectiles.remove(f)
+        # Update projectiles (boss HOTDOGs split into DOG/BREAD like standard foods)
+        self.projectiles.step(dt, (self.rect.centerx, self.rect.bottom))
 
         # Manage weak point target (optional per level)
         want_target = True
@@ -448,6 +465,7 @@ class Boss(pygame.sprite.Sprite):
                 self.target_cd -= dt
                 if self.target_cd <= 0.0:
                     self.target = Target(self.rect)
+                    trace.instant("target_respawn")
                     # Boss 2: extend weak-point lifetime by +2s
                     try:
                         if self._lvl and getattr(self._lvl, 'level', 0) == 2:
@@ -474,18 +492,17 @@ class Boss(pygame.sprite.Sprite):
                 pass
         foods = (self._lvl.boss.burst_foods if self._lvl else ["DORITOS", "FRIES", "SODA", "ICECREAM"])  # light burst
         for _ in range(2):
-            kind = random.choice(foods)
-            salty_set = {"DORITOS", "BURGERS", "FRIES", "FRIEDCHICKEN", "RIBS", "HOTDOG", "TAIWANBURGER", "STINKYTOFU"}
-            category = "SALTY" if kind in salty_set else "SWEET"
-            f = Food(
+            kind = _rng.choice(foods)
+            category = "SALTY" if kind in _SALTY_KINDS else "SWEET"
+            f = food_pool.acquire(
                 kind,
                 category,
-                self.rect.centerx + random.randint(-40, 40),
+                self.rect.centerx + _rng.randint(-40, 40),
                 speed_y=(self._lvl.boss.food_speed if self._lvl else BOSS_FOOD_SPEED),
                 homing=False,
                 spawn_center_y=self.rect.centery,
             )
-            f.vx = random.uniform(-90, 90)
+            f.vx = _rng.uniform(-90, 90)
             self.projectiles.add(f)
 
     def spawn_ring(self, category: str):
@@ -509,8 +526,8 @@ class Boss(pygame.sprite.Sprite):
             ang = 2 * math.pi * (i / n)
             vx = math.cos(ang) * speed
             vy = math.sin(ang) * speed
-            kind = random.choice(kinds)
-            f = Food(kind, category, cx, speed_y=vy, homing=False, spawn_center_y=cy)
+            kind = _rng.choice(kinds)
+            f = food_pool.acquire(kind, category, cx, speed_y=vy, homing=False, spawn_center_y=cy)
             f.vx = vx
             self.projectiles.add(f)
 
@@ -533,6 +550,73 @@ class Boss(pygame.sprite.Sprite):
             self.death_timer = 2.2
             self._smoke_cd = 0.0
 
+    def _faded(self, alpha: int) -> pygame.Surface:
+        # set_alpha on a private copy: self.image is shared through the registry
+        if self._fade_img is None:
+            self._fade_img = self.image.copy()
+        self._fade_img.set_alpha(alpha)
+        return self._fade_img
+
+    def _tinted(self, tint: tuple[int, int, int], over: bool = True) -> pygame.Surface:
+        """The sprite with `tint` added to its colour, built once per tint.
+
+        With `over` it is composited over the plain sprite (what drawing the
+        sprite and then the tinted copy on top gives) and premultiplied, so
+        one BLEND_PREMULTIPLIED blit replaces both.
+        """
+        key = (tint, over)
+        out = self._tints.get(key)
+        if out is None:
+            tinted = self._tints.get((tint, False))
+            if tinted is None:
+                tinted = self.image.copy()
+                tinted.fill(tint, special_flags=pygame.BLEND_RGB_ADD)
+                if not over:
+                    self._tints[key] = tinted
+            out = tinted
+            if over:
+                out = self.image.premul_alpha()
+                out.blit(tinted.premul_alpha(), (0, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+                self._tints[key] = out
+        return out
+
+    @staticmethod
+    def _hurt_tint(t: float, flash: bool) -> tuple[int, int, int]:
+        # `t` is the damage taken (0..1); a fresh hit brightens it
+        return (min(255, 70 + int(120 * t) + (18 if flash else 0)), 40, 40)
+
+    @staticmethod
+    def _dying_tint(step: int) -> tuple[int, int, int]:
+        return (140 + int(70 * step / DYING_TINT_STEPS), 40, 40)
+
+    def _damage_tint(self, bites: int, health_ratio: float) -> tuple[int, int, int] | None:
+        # Red tint as health drops, brighter on a hit, deepening while dying
+        if self.dying:
+            t = max(0.0, min(1.0, 1.0 - (self.death_timer / 2.2)))
+            return self._dying_tint(int(t * DYING_TINT_STEPS))
+        if self.hit_flash > 0 or bites > 0:
+            return self._hurt_tint(1.0 - health_ratio, self.hit_flash > 0)
+        return None
+
+    def _tint_ramp(self) -> list:
+        # Every shade draw() can ask for: each damage level short of death,
+        # plain then hit-flashed, then the death-throes steps
+        thresh = (self._lvl.boss.bites_to_kill if self._lvl else BOSS_BITES_TO_KILL)
+        levels = [1.0 - max(0.0, 1.0 - bites / max(1, thresh)) for bites in range(1, max(1, thresh))]
+        return ([self._hurt_tint(t, False) for t in levels] + [self._hurt_tint(t, True) for t in levels]
+                + [self._dying_tint(step) for step in range(DYING_TINT_STEPS + 1)])
+
+    def bake(self, limit: int | None = None) -> bool:
+        """Build up to `limit` (default: all) of the tint variants draw() will
+        need, ahead of the spawn; True once none are left."""
+        if self._bake_todo is None:
+            ramp = [t for t in dict.fromkeys(self._tint_ramp()) if t is not None]
+            self._bake_todo = ramp[::-1]
+        todo = self._bake_todo
+        for _ in range(len(todo) if limit is None else min(limit, len(todo))):
+            self._tinted(todo.pop())
+        return not todo
+
     def draw(self, surface: pygame.Surface):
         if self.dead:
             return
@@ -544,58 +628,41 @@ class Boss(pygame.sprite.Sprite):
         base_jitter = int((1.0 - health_ratio) * 3)
         if self.hit_flash > 0:
             jitter = base_jitter + 2
-            draw_rect.x += random.randint(-jitter, jitter)
-            draw_rect.y += random.randint(-jitter, jitter)
+            draw_rect.x += _fx_rng.randint(-jitter, jitter)
+            draw_rect.y += _fx_rng.randint(-jitter, jitter)
         if self.dying:
             jitter = 8
-            draw_rect.x += random.randint(-jitter, jitter)
-            draw_rect.y += random.randint(-jitter, jitter)
+            draw_rect.x += _fx_rng.randint(-jitter, jitter)
+            draw_rect.y += _fx_rng.randint(-jitter, jitter)
 
+        # Red tint masked to non-transparent pixels only
+        tint = self._damage_tint(bites, health_ratio)
         # Base sprite (fade-in during spawn)
         if getattr(self, 'spawning', False):
             # Compute alpha based on progress
             t = 1.0
             if getattr(self, 'spawn_total', 0) > 0:
                 t = max(0.0, min(1.0, 1.0 - (self.spawn_timer / self.spawn_total)))
-            img = self.image.copy()
-            img.set_alpha(int(255 * t))
-            surface.blit(img, draw_rect)
+            surface.blit(self._faded(int(255 * t)), draw_rect)
+            if tint is not None:
+                surface.blit(self._tinted(tint, over=False), draw_rect)
         else:
             # Apply subtle baseline vibration that increases with damage
             if bites > 0 and not self.dying:
                 vib = int((1.0 - health_ratio) * 2)
                 if vib > 0:
-                    draw_rect.x += random.randint(-vib, vib)
-                    draw_rect.y += random.randint(-vib, vib)
-            surface.blit(self.image, draw_rect)
-
-        # Red tint overlay masked to non-transparent pixels only
-        if self.hit_flash > 0 or self.dying or bites > 0:
-            if self.dying:
-                # While dying, intensify red instead of whitening
-                t = max(0.0, min(1.0, 1.0 - (self.death_timer / 2.2)))
-                tint = (140 + int(70 * t), 40, 40)
-                alpha = 120
+                    draw_rect.x += _fx_rng.randint(-vib, vib)
+                    draw_rect.y += _fx_rng.randint(-vib, vib)
+            if tint is None:
+                surface.blit(self.image, draw_rect)
             else:
-                t = 1.0 - health_ratio
-                # Stronger red with more damage; slight boost during brief hit_flash
-                r_boost = 18 if self.hit_flash > 0 else 0
-                tint = (min(255, 70 + int(120 * t) + r_boost), 40, 40)
-                alpha = 55 + int(70 * t)
-            if alpha > 0:
-                overlay = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-                overlay.fill((*tint, alpha))
-                tinted = self.image.copy()
-                tinted.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
-                surface.blit(tinted, draw_rect)
+                surface.blit(self._tinted(tint), draw_rect, special_flags=pygame.BLEND_PREMULTIPLIED)
 
         # smoke on top of boss sprite
-        for s in self._smoke:
-            s.draw(surface)
+        self._smoke.draw(surface)
         if self.target is not None and self.target.alive:
             self.target.draw(surface)
-        for f in self.projectiles:
-            f.draw(surface)
+        self.projectiles.draw(surface)
 
 
 class DandanBurger(Boss):
@@ -612,6 +679,9 @@ class DandanBurger(Boss):
 
 class OrangePork(Boss):
     """Level 2 boss: unique sprite; attacks disabled for now, keep weak point and animations."""
+    SPRITE_PATH = "nanmon/assets/boss/orange_pork.png"
+    ATTACKS = ('hotdog_cone', 'x_laser', 's_curve', 'down_beams')  # picked at random
+
     def __init__(self, level_cfg: LevelConfig | None = None):
         super().__init__(level_cfg)
         # Enforce attacks disabled
@@ -621,11 +691,10 @@ class OrangePork(Boss):
             except Exception:
                 pass
         # Enforce sprite to orange_pork.png if not already applied
-        img_path = "nanmon/assets/boss/orange_pork.png"
+        img_path = self.SPRITE_PATH
         try:
-            raw = pygame.image.load(img_path).convert_alpha()
             size = self._lvl.boss.size if self._lvl else self.image.get_size()
-            self.image = pygame.transform.scale(raw, size)
+            self.image = assets.image(img_path, size, scope=assets.LEVEL)
             # Keep current rect position and size
             prev = self.rect
             self.rect = self.image.get_rect(center=prev.center)
@@ -651,8 +720,14 @@ class OrangePork(Boss):
 
     
 
+    def _advance_attacks(self, seconds: float) -> None:
+        super()._advance_attacks(seconds)
+        self._op_cd -= seconds
+        if self._op_phase is not None and 'emit_cd' in self._op_phase[1]:
+            self._op_phase[1]['emit_cd'] -= seconds
+
     def _emit_food(self, kind: str, category: str, pos: tuple[int, int], vel: tuple[float, float], *, wobble=None):
-        f = Food(kind, category, pos[0], speed_y=vel[1], homing=False, spawn_center_y=pos[1])
+        f = food_pool.acquire(kind, category, pos[0], speed_y=vel[1], homing=False, spawn_center_y=pos[1])
         f.vx = vel[0]
         # Slightly shrink hitbox for fairness
         f.hitbox_scale = min(0.9, getattr(f, 'hitbox_scale', 1.0))
@@ -675,14 +750,14 @@ class OrangePork(Boss):
             if self._op_cd <= 0.0:
                 # Randomly choose a pattern
                 self._op_cd = 3.5
-                choice = random.choice(['hotdog_cone', 'x_laser', 's_curve', 'down_beams'])
+                choice = _rng.choice(self.ATTACKS)
                 if choice == 'hotdog_cone':
                     # 3 volleys, 1s apart, each emits 3 HOTDOGs in a cone
                     self._op_phase = ('hotdog_cone', {'volley': 0, 'timer': 0.0})
                 elif choice == 'x_laser':
                     self._op_phase = ('x_laser', {
                         'timer': 4.0,
-                        'angle': random.uniform(0.0, 2*math.pi),
+                        'angle': _rng.uniform(0.0, 2*math.pi),
                         'spin': math.pi,    # wheel-like rotation
                         'emit_cd': 0.0,
                         'emit_int': 0.14,   # slightly less dense
@@ -727,7 +802,7 @@ class OrangePork(Boss):
                     salty_pool = ['RIBS', 'FRIEDCHICKEN']
                 if not sweet_pool:
                     sweet_pool = ['ICECREAM', 'SODA']
-                self._op_x_foods = (random.choice(salty_pool), random.choice(sweet_pool))
+                self._op_x_foods = (_rng.choice(salty_pool), _rng.choice(sweet_pool))
             st['timer'] = max(0.0, st['timer'] - dt)
             st['emit_cd'] = st.get('emit_cd', 0.0) - dt
             st['angle'] = (st.get('angle', 0.0) + st.get('spin', math.pi) * dt) % (2*math.pi)
@@ -746,9 +821,8 @@ class OrangePork(Boss):
                     (math.cos(ang+math.pi/2), math.sin(ang+math.pi/2), kind_b),
                     (math.cos(ang+3*math.pi/2), math.sin(ang+3*math.pi/2), kind_b),
                 ]
-                salty_set = {"DORITOS", "BURGERS", "FRIES", "FRIEDCHICKEN", "RIBS", "HOTDOG", "TAIWANBURGER", "STINKYTOFU"}
                 for dx, dy, kind in dirs:
-                    category = 'SALTY' if kind in salty_set else 'SWEET'
+                    category = 'SALTY' if kind in _SALTY_KINDS else 'SWEET'
                     self._emit_food(kind, category, origin, (dx*base_speed, dy*base_speed))
             if st['timer'] <= 0.0:
                 self._op_phase = None
@@ -764,7 +838,7 @@ class OrangePork(Boss):
                 # Choose any one food from level
                 if self._lvl is not None and self._lvl.boss is not None:
                     # Exclude HOTDOG from the four-beam attack
-                    pool = [k for k in set(self._lvl.boss.ring_foods_salty + self._lvl.boss.ring_foods_sweet) if k != 'HOTDOG']
+                    pool = [k for k in dict.fromkeys(self._lvl.boss.ring_foods_salty + self._lvl.boss.ring_foods_sweet) if k != 'HOTDOG']
                 else:
                     pool = ['DORITOS', 'FRIES', 'ICECREAM', 'SODA']
                 # Aim roughly toward player horizontally
@@ -776,7 +850,7 @@ class OrangePork(Boss):
                 base_down = 160.0
                 # Spawn 4 with varied wobble and slight vx spread
                 for j, amp in enumerate((130.0, 165.0, 200.0, 235.0)):
-                    kind = random.choice(pool)
+                    kind = _rng.choice(pool)
                     category = 'SALTY' if kind in {'DORITOS','BURGERS','FRIES','FRIEDCHICKEN','RIBS','HOTDOG','TAIWANBURGER','STINKYTOFU'} else 'SWEET'
                     spread_vals = (-70.0, -23.0, 23.0, 70.0)
                     spread = spread_vals[j]
@@ -795,14 +869,13 @@ class OrangePork(Boss):
                 st['emit_cd'] = st.get('emit_int', 0.08)
                 # choose random kinds each tick
                 if self._lvl is not None and self._lvl.boss is not None:
-                    pool = list(set(self._lvl.boss.ring_foods_salty + self._lvl.boss.ring_foods_sweet))
+                    pool = list(dict.fromkeys(self._lvl.boss.ring_foods_salty + self._lvl.boss.ring_foods_sweet))
                 else:
                     pool = ['DORITOS', 'FRIES', 'ICECREAM', 'SODA']
                 x_positions = [int(WIDTH * frac) for frac in (0.09, 0.36, 0.73, 0.91)]
-                salty_set = {"DORITOS", "BURGERS", "FRIES", "FRIEDCHICKEN", "RIBS", "HOTDOG", "TAIWANBURGER", "STINKYTOFU"}
                 for x in x_positions:
-                    kind = random.choice(pool)
-                    category = 'SALTY' if kind in salty_set else 'SWEET'
+                    kind = _rng.choice(pool)
+                    category = 'SALTY' if kind in _SALTY_KINDS else 'SWEET'
                     # Spawn just above the visible area
                     self._emit_food(kind, category, (x, -20), (0.0, 560.0))
             if st['timer'] <= 0.0:
@@ -826,6 +899,10 @@ class Coffin(Boss):
           4) shotgun_bottom: fan from bottom offscreen (one kind per burst)
           5) square: perimeter square telegraph, then launch inward toward player
     """
+    SPRITE_PATH = "nanmon/assets/boss/coffin.png"
+    ATTACKS = ("circle_spiral", "grid", "shotgun_center", "shotgun_bottom", "square")  # picked at random
+    SPRITE_SIZE = (400, 360)  # same as Boss 2
+
     def __init__(self, level_cfg: LevelConfig | None = None):
         super().__init__(level_cfg)
         self.lifetime = 0.0
@@ -838,12 +915,9 @@ class Coffin(Boss):
                 pass
 
         # Sprite override
-        img_path = "nanmon/assets/boss/coffin.png"
+        img_path = self.SPRITE_PATH
         try:
-            raw = pygame.image.load(img_path).convert_alpha()
-            # Resize Coffin to the same size as Boss 2: (400, 360)
-            size2 = (400, 360)
-            self.image = pygame.transform.scale(raw, size2)
+            self.image = assets.image(img_path, self.SPRITE_SIZE, scope=assets.LEVEL)
             prev = self.rect
             self.rect = self.image.get_rect(center=prev.center)
             # Keep float centers aligned
@@ -895,6 +969,25 @@ class Coffin(Boss):
         # Reusable working list for attacks
         self._tmp_objs = []
 
+    @staticmethod
+    def _shield_tint(wave: float, flash: float) -> tuple[int, int, int] | None:
+        # `wave` is the breathing sine; a parry hit brightens it briefly
+        breath = 0.16 + 0.12 * (0.5 * (1.0 + wave))
+        if flash > 0.0:
+            k = min(1.0, flash / 0.18)
+            breath += 0.22 * k
+        if breath <= 0.01:
+            return None
+        breath = round(breath / SHIELD_BREATH_STEP) * SHIELD_BREATH_STEP
+        return (int(58 * breath), int(56 * breath), int(26 * breath))
+
+    def _tint_ramp(self) -> list:
+        # Every shade one breathing cycle reaches, then the same cycle while a
+        # parry flash decays, one flash step per SHIELD_BREATH_STEP of brightness
+        steps = round(0.22 / SHIELD_BREATH_STEP)
+        return [self._shield_tint(math.sin(i * math.tau / 256), 0.18 * k / steps)
+                for k in range(steps + 1) for i in range(256)]
+
     # ===== Helpers =====
     def register_parry_hit(self):
         """Called when a *player-parried* soup collides with the boss."""
@@ -909,20 +1002,26 @@ class Coffin(Boss):
                 snd.play()
         except Exception:
             pass
-        self._smoke.append(Smoke((self.rect.centerx + random.randint(-16, 16),
-                                  self.rect.top + random.randint(0, 18))))
+        self._smoke.puff((self.rect.centerx + _rng.randint(-16, 16),
+                          self.rect.top + _rng.randint(0, 18)))
         if self.parry_hits >= self.parry_to_kill:
             self.dying = True
             self.death_timer = 2.2
             self._smoke_cd = 0.0
 
     def _rand_kind(self):
-        if random.random() < 0.5:
-            return (random.choice(self._pool_salty), "SALTY")
-        return (random.choice(self._pool_sweet), "SWEET")
+        if _rng.random() < 0.5:
+            return (_rng.choice(self._pool_salty), "SALTY")
+        return (_rng.choice(self._pool_sweet), "SWEET")
+
+    def _advance_attacks(self, seconds: float) -> None:
+        super()._advance_attacks(seconds)
+        self._co_cd -= seconds
+        if self._co_phase is not None and "cd" in self._co_phase[1]:
+            self._co_phase[1]["cd"] -= seconds
 
     def _emit_food(self, kind: str, category: str, pos: tuple[int, int], vel: tuple[float, float], *, wobble=None, hold=False):
-        f = Food(kind, category, pos[0], speed_y=vel[1], homing=False, spawn_center_y=pos[1])
+        f = food_pool.acquire(kind, category, pos[0], speed_y=vel[1], homing=False, spawn_center_y=pos[1])
         f.vx = vel[0]
         f.hitbox_scale = min(0.92, getattr(f, 'hitbox_scale', 1.0))
         if wobble is not None:
@@ -938,9 +1037,9 @@ class Coffin(Boss):
         return f
 
     def _spawn_parry_soup(self):
-        x = random.randint(int(WIDTH * 0.22), int(WIDTH * 0.78))
-        f = Food("BEEFSOUP", "SALTY", x, speed_y=300.0, homing=False, spawn_center_y=-40)
-        f.vx = random.uniform(-55.0, 55.0)
+        x = _rng.randint(int(WIDTH * 0.22), int(WIDTH * 0.78))
+        f = food_pool.acquire("BEEFSOUP", "SALTY", x, speed_y=300.0, homing=False, spawn_center_y=-40)
+        f.vx = _rng.uniform(-55.0, 55.0)
         # explicit defaults
         setattr(f, "neutralized", False)
         setattr(f, "parried_by_player", False)
@@ -956,7 +1055,7 @@ class Coffin(Boss):
         self._co_attacks_done += 1
 
         self._co_cd = 2.2
-        choice = random.choice(["circle_spiral","grid","shotgun_center","shotgun_bottom","square"])
+        choice = _rng.choice(self.ATTACKS)
         if choice == "circle_spiral":
             # Less dense circle around player; 1s windup; then spiral release
             cx = player_pos[0] if player_pos else self.rect.centerx
@@ -970,7 +1069,7 @@ class Coffin(Boss):
                 y = int(cy + radius*math.sin(ang))
                 kind, cat = self._rand_kind()
                 f = self._emit_food(kind, cat, (x, y), (0.0, 0.0), hold=True)
-                items.append((f, ang))
+                items.append((f, f.serial, ang))
             self._co_phase = ("circle_spiral", {"items": items, "delay": 1.0, "idx": 0, "tick": 0.08})
         elif choice == "grid":
             # 3 vertical + 3 horizontal sweeping beams forming a grid
@@ -1075,8 +1174,9 @@ class Coffin(Boss):
             if st["delay"] <= 0.0:
                 st["tick"] -= dt
                 if st["tick"] <= 0.0 and st["idx"] < len(st["items"]):
-                    f, _ang = st["items"][st["idx"]]
-                    if hasattr(f, "hold_motion") and f.hold_motion and f in self.projectiles:
+                    f, serial, _ang = st["items"][st["idx"]]
+                    # eaten items may already be recycled into other shots
+                    if f.serial == serial and f.hold_motion and f in self.projectiles:
                         px = player_pos[0] if player_pos else self.rect.centerx
                         py = player_pos[1] if player_pos else self.rect.centery + 100
                         dx = px - f.rect.centerx
@@ -1194,33 +1294,51 @@ class Coffin(Boss):
         if self.dead:
             return
 
+        # Yellow/white breathing shield
+        tint = self._shield_tint(math.sin(self._breath_t * 2.4), self._shield_flash)
+
         if getattr(self, 'spawning', False):
             t = 1.0
             if getattr(self, 'spawn_total', 0) > 0:
                 t = max(0.0, min(1.0, 1.0 - (self.spawn_timer / self.spawn_total)))
-            img = self.image.copy()
-            img.set_alpha(int(255 * t))
-            surface.blit(img, self.rect)
-        else:
+            surface.blit(self._faded(int(255 * t)), self.rect)
+            if tint is not None:
+                surface.blit(self._tinted(tint, over=False), self.rect)
+        elif tint is None:
             surface.blit(self.image, self.rect)
-
-        # Yellow/white breathing shield
-        breath = 0.16 + 0.12 * (0.5 * (1.0 + math.sin(self._breath_t * 2.4)))
-        if self._shield_flash > 0.0:
-            k = min(1.0, self._shield_flash / 0.18)
-            breath += 0.22 * k
-        if breath > 0.01:
-            overlay = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-            y_r = int(58 * breath)
-            y_g = int(56 * breath)
-            y_b = int(26 * breath)
-            overlay.fill((y_r, y_g, y_b, 0))
-            tinted = self.image.copy()
-            tinted.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
-            surface.blit(tinted, self.rect)
+        else:
+            surface.blit(self._tinted(tint), self.rect, special_flags=pygame.BLEND_PREMULTIPLIED)
 
         # On-top smoke and projectiles
-        for s in self._smoke:
-            s.draw(surface)
-        for f in self.projectiles:
-            f.draw(surface)
+        self._smoke.draw(surface)
+        self.projectiles.draw(surface)
+
+
+# Which boss each level spawns
+LEVEL_BOSSES = {1: DandanBurger, 2: OrangePork, 3: Coffin}
+
+
+@trace.traced("make_boss", "boss")
+def make_boss(level_cfg: LevelConfig | None = None) -> Boss:
+    """The boss for `level_cfg`'s level, fully built: sprites, sounds, config."""
+    level = int(getattr(level_cfg, "level", 1))
+    return LEVEL_BOSSES.get(level, Boss)(level_cfg)
+
+
+def build_boss(level_cfg: LevelConfig | None = None):
+    """make_boss() a step at a time: a generator that fetches one sprite,
+    weak-point image or Sound per next() and finally returns the boss (as
+    StopIteration.value), whose constructor then only hits the caches."""
+    level = int(getattr(level_cfg, "level", 1))
+    cls = LEVEL_BOSSES.get(level, Boss)
+    for a in cls.preload_assets(level_cfg):
+        with trace.span("boss.warm", "boss", path=a.path):
+            try:
+                if not a.sound:
+                    assets.load(a)
+                elif pygame.mixer.get_init() and resources.exists(a.path):
+                    soundbank.get(a.path)
+            except Exception:
+                pass  # the constructor falls back as it always has
+        yield
+    return make_boss(level_cfg)
@@ -1,9 +1,8 @@
 from __future__ import annotations
 import os
-import random
 import math
 import pygame
-from .constants import WIDTH, HEIGHT, ASSET_FOOD_DIR, FOOD_SIZE, FONT_PATH, ASSET_HAT_DIR
+from .constants import WIDTH, HEIGHT, ASSET_FOOD_DIR, FOOD_SIZE, ASSET_HAT_DIR
 from .unlocks import (
     load_unlocked_hats,
     unlock_hat,
@@ -11,8 +10,26 @@ from .unlocks import (
     list_all_hats,
 )
 from .effects import Smoke
+from .particles import Particles, ParticleStyle, SQUARE
 from .models import KINDS, EatenCounters
 from .mouth import Mouth
+from .rng import stream
+from . import assets, perf, resources, soundbank, trace, xform
+from . import text as _text
+
+_rng = stream("finish")
+
+
+def hat_showcase(hat: str) -> pygame.Surface:
+    """`hat` scaled to the unlock reveal's showcase size."""
+    path = os.path.join(ASSET_HAT_DIR, hat)
+    img = assets.image(path)
+    max_w = int(WIDTH * 0.28)
+    max_h = int(HEIGHT * 0.18)
+    w, h = img.get_size()
+    scale = min(max_w / max(1, w), max_h / max(1, h), 1.5)
+    sw, sh = max(1, int(w * scale)), max(1, int(h * scale))
+    return assets.image(path, (sw, sh))
 
 FINISH_BG = pygame.Color(245, 245, 245)
 # Faster finish-screen physics
@@ -22,6 +39,8 @@ GROUND_FRICTION = 0.88
 SLEEP_SPEED = 12.0
 HITBOX_SCALE = 0.86
 SLIDE_SCALE = 0.22
+# Celebration confetti: falling, fading square tiles
+CONFETTI_STYLE = ParticleStyle(shape=SQUARE, gravity=GRAVITY * 0.4, drag_x=0.995)
 
 
 class SpewItem:
@@ -44,6 +63,7 @@ class SpewItem:
 
 class FinishScreen:
     def __init__(self, eaten: EatenCounters, level: int, score: int, hat: str | None = None):
+        trace.instant("finish_screen", level=level, eaten=int(eaten.total))
         # Sound placeholders
         self._drum_snd = None
         self._spit_out_snd = None
@@ -76,11 +96,12 @@ class FinishScreen:
         for k in KINDS:
             path = os.path.join(ASSET_FOOD_DIR, f"{k}.png")
             try:
-                img = pygame.image.load(path).convert_alpha()
+                # same entry the in-game foods use
+                img = assets.image(path, FOOD_SIZE)
             except Exception:
                 img = pygame.Surface(FOOD_SIZE, pygame.SRCALPHA)
                 pygame.draw.rect(img, pygame.Color(200, 200, 200), img.get_rect(), 2)
-            self.food_imgs[k] = pygame.transform.scale(img, FOOD_SIZE)
+            self.food_imgs[k] = img
 
         # Big mouth on right (moved upward)
         self.mouth = Mouth((int(WIDTH * 0.82), int(HEIGHT * 0.72) - self._y_offset))
@@ -112,11 +133,11 @@ class FinishScreen:
         self._spew_delay = 1.0
 
         # Fonts
-        self.font = pygame.font.Font(FONT_PATH, 28)
-        self.font_small = pygame.font.Font(FONT_PATH, 22)
-        self.font_big = pygame.font.Font(FONT_PATH, 96)
-        self.font_title = pygame.font.Font(FONT_PATH, 48)
-        self.font_list = pygame.font.Font(FONT_PATH, 34)
+        self.font = _text.font(28)
+        self.font_small = _text.font(22)
+        self.font_big = _text.font(96)
+        self.font_title = _text.font(48)
+        self.font_list = _text.font(34)
 
         # Grade reveal state and optional sounds
         self.show_grade = False
@@ -132,10 +153,10 @@ class FinishScreen:
 
         # Celebration state
         self._reveal_time = 0.0
-        self._confetti = []
+        self._confetti = Particles(CONFETTI_STYLE)
         self._confetti_trickle = 0.0
         self._confetti_accum = 0.0
-        self._smoke = []
+        self._smoke = Smoke()
         self._flash_time = 0.0
         self._impact_jitter_time = 0.0
         self._impact_jitter_mag = 0.0
@@ -171,23 +192,23 @@ class FinishScreen:
         self._active_mask = None   # mask used for collisions
         try:
             spit_path = os.path.join("nanmon", "assets", "sounds", "spit_out.wav")
-            if os.path.exists(spit_path):
-                self._spit_out_snd = pygame.mixer.Sound(spit_path)
+            if resources.exists(spit_path):
+                self._spit_out_snd = soundbank.get(spit_path)
             bgm_path = os.path.join("nanmon", "assets", "sounds", "final_screen_bg_sounds.wav")
-            if os.path.exists(bgm_path):
-                self._bgm_snd = pygame.mixer.Sound(bgm_path)
+            if resources.exists(bgm_path):
+                self._bgm_snd = soundbank.get(bgm_path)
 
             cymbal_path = os.path.join("nanmon", "assets", "sounds", "cymbal_sounds.wav")
-            if os.path.exists(cymbal_path):
-                self._cymbal_snd = pygame.mixer.Sound(cymbal_path)
+            if resources.exists(cymbal_path):
+                self._cymbal_snd = soundbank.get(cymbal_path)
                 self._cymbal_snd.set_volume(1.0)
             applause_path = os.path.join("nanmon", "assets", "sounds", "applause_sounds.wav")
-            if os.path.exists(applause_path):
-                self._applause_snd = pygame.mixer.Sound(applause_path)
+            if resources.exists(applause_path):
+                self._applause_snd = soundbank.get(applause_path)
                 self._applause_snd.set_volume(1.0)
             drum_path = os.path.join("nanmon", "assets", "sounds", "drum_sounds.wav")
-            if os.path.exists(drum_path):
-                self._drum_snd = pygame.mixer.Sound(drum_path)
+            if resources.exists(drum_path):
+                self._drum_snd = soundbank.get(drum_path)
                 self._drum_snd.set_volume(1.0)
         except Exception:
             pass
@@ -197,8 +218,8 @@ class FinishScreen:
                 pygame.mixer.init()
             for name, attr in (("drumroll.ogg", "_drum_snd"), ("cheer.ogg", "_cheer_snd"), ("spray.ogg", "_spray_snd"), ("pop.ogg", "_pop_snd"), ("pop.wav", "_pop_snd")):
                 p = os.path.join("nanmon", "assets", name)
-                if os.path.exists(p):
-                    setattr(self, attr, pygame.mixer.Sound(p))
+                if resources.exists(p):
+                    setattr(self, attr, soundbank.get(p))
         except Exception:
             self._drum_snd = None
 
@@ -206,11 +227,11 @@ class FinishScreen:
         for letter in ["S", "A", "B", "C", "D", "F"]:
             try:
                 p = os.path.join("nanmon", "assets", "clear_screen", f"{letter}.png")
-                img = pygame.image.load(p).convert_alpha()
+                img = assets.image(p)
                 h = max(1, img.get_height())
                 scale_h = max(24, self._rank_base_h)
                 scale_w = int(img.get_width() * (scale_h / h))
-                img = pygame.transform.scale(img, (scale_w, scale_h))
+                img = assets.image(p, (scale_w, scale_h))
                 self._rank_imgs[letter] = img
             except Exception:
                 pass
@@ -218,9 +239,9 @@ class FinishScreen:
         # Scoreboard
         for fname in ("score_board.png", "scoreboard.png"):
             p = os.path.join("nanmon", "assets", "clear_screen", fname)
-            if os.path.exists(p):
+            if resources.exists(p):
                 try:
-                    sb = pygame.image.load(p).convert_alpha()
+                    sb = assets.image(p)
                     self._scoreboard_img = sb
                     self._scoreboard_h = sb.get_height() or 0
                     break
@@ -229,13 +250,13 @@ class FinishScreen:
 
         # Plate (bottom)
         p = os.path.join("nanmon", "assets", "clear_screen", "plate.png")
-        if os.path.exists(p):
+        if resources.exists(p):
             try:
-                pl = pygame.image.load(p).convert_alpha()
+                pl = assets.image(p)
                 if pl.get_width() != WIDTH:
                     new_w = WIDTH
                     new_h = int(pl.get_height() * (new_w / max(1, pl.get_width())))
-                    pl = pygame.transform.scale(pl, (new_w, new_h))
+                    pl = assets.image(p, (new_w, new_h))
                 self._plate_img = pl
                 self._plate_h = pl.get_height() or 0
             except Exception:
@@ -244,9 +265,9 @@ class FinishScreen:
 
         # Container hitbox (mask) - not drawn; use as-is, no scaling
         p = os.path.join("nanmon", "assets", "clear_screen", "container_hitbox.png")
-        if os.path.exists(p):
+        if resources.exists(p):
             try:
-                cont = pygame.image.load(p).convert_alpha()
+                cont = assets.image(p)
                 # Use original size directly (expected WIDTH x HEIGHT)
                 self._container_img = cont
                 w, h = cont.get_size()
@@ -291,13 +312,13 @@ class FinishScreen:
 
         # Background
         p = os.path.join("nanmon", "assets", "clear_screen", "background.png")
-        if os.path.exists(p):
+        if resources.exists(p):
             try:
-                bg = pygame.image.load(p).convert()
+                bg = assets.image(p, alpha=False)
                 if bg.get_width() != WIDTH:
                     new_w = WIDTH
                     new_h = int(bg.get_height() * (new_w / max(1, bg.get_width())))
-                    bg = pygame.transform.scale(bg, (new_w, new_h))
+                    bg = assets.image(p, (new_w, new_h), alpha=False)
                 self._bg_img = bg
                 self._bg_h = bg.get_height()
                 self._bg_y = 0.0
@@ -307,34 +328,34 @@ class FinishScreen:
 
         # Clapping image
         p = os.path.join("nanmon", "assets", "clapping.png")
-        if not os.path.exists(p):
+        if not resources.exists(p):
             p = os.path.join("nanmon", "assets", "clear_screen", "clapping.png")
-        if os.path.exists(p):
+        if resources.exists(p):
             try:
-                cim = pygame.image.load(p).convert_alpha()
+                cim = assets.image(p)
                 cw = max(1, cim.get_width())
                 scale_w = WIDTH
                 scale_h = int(cim.get_height() * (scale_w / cw))
-                self._clap_img = pygame.transform.scale(cim, (scale_w, scale_h))
+                self._clap_img = assets.image(p, (scale_w, scale_h))
             except Exception:
                 self._clap_img = None
 
         # Mystery box and lighting assets (optional)
         try:
             p_box = os.path.join("nanmon", "assets", "clear_screen", "mystery_box.png")
-            if os.path.exists(p_box):
-                box = pygame.image.load(p_box).convert_alpha()
+            if resources.exists(p_box):
+                box = assets.image(p_box)
                 # scale box to ~30% width
                 target_w = int(WIDTH * 0.3)
                 scale = target_w / max(1, box.get_width())
                 target_h = max(1, int(box.get_height() * scale))
-                self._mystery_img = pygame.transform.scale(box, (target_w, target_h))
+                self._mystery_img = assets.image(p_box, (target_w, target_h))
         except Exception:
             self._mystery_img = None
         try:
             p_lt = os.path.join("nanmon", "assets", "clear_screen", "Lighting.png")
-            if os.path.exists(p_lt):
-                lt = pygame.image.load(p_lt).convert_alpha()
+            if resources.exists(p_lt):
+                lt = assets.image(p_lt)
                 # Keep original size; will draw at (0,0) without scaling
                 self._lighting_img = lt
         except Exception:
@@ -361,18 +382,9 @@ class FinishScreen:
             candidates = list(all_hats)
         if not candidates:
             candidates = list(all_hats)
-        pick = random.choice(candidates)
+        pick = _rng.choice(candidates)
         try:
-            path = os.path.join(ASSET_HAT_DIR, pick)
-            img = pygame.image.load(path).convert_alpha()
-            # scale hat to a nice showcase size
-            max_w = int(WIDTH * 0.28)
-            max_h = int(HEIGHT * 0.18)
-            w, h = img.get_size()
-            scale = min(max_w / max(1, w), max_h / max(1, h), 1.5)
-            sw, sh = max(1, int(w * scale)), max(1, int(h * scale))
-            simg = pygame.transform.scale(img, (sw, sh))
-            return (pick, simg)
+            return (pick, hat_showcase(pick))
         except Exception:
             return (pick, None)
 
@@ -385,7 +397,7 @@ class FinishScreen:
         self._unlock_hat_img = hat_img
 
         # Fresh confetti for unlock sequence
-        self._confetti = []
+        self._confetti.clear()
 
         t = 0.0                 # staged timing for reveal beats (can clamp)
         dur = 2.6               # staging window length
@@ -432,7 +444,7 @@ class FinishScreen:
                     # slight shake 0.6-1.6s
                     jitter_x = 0
                     if 0.6 <= t <= 1.6:
-                        jitter_x = random.randint(-3, 3)
+                        jitter_x = _rng.randint(-3, 3)
                     # strong rapid rotation while unlocking 0.6-1.6s
                     angle = 0.0
                     if 0.6 <= t <= 1.6:
@@ -440,10 +452,10 @@ class FinishScreen:
                         angle = 28.0 * math.sin(phase * 2 * math.pi * 8.0)
                     sbw, sbh = int(bw * scale), int(bh * scale)
                     sbw = max(1, sbw); sbh = max(1, sbh)
-                    scaled_box = pygame.transform.scale(box_img, (sbw, sbh))
+                    scaled_box = xform.scale(box_img, (sbw, sbh))
                     # rotate after scaling for crisper result
                     if angle != 0.0:
-                        scaled_box = pygame.transform.rotate(scaled_box, angle)
+                        scaled_box = xform.rotate(scaled_box, angle)
                     by = int(HEIGHT * 0.60)
                     rect = scaled_box.get_rect(center=(bx + jitter_x, by))
                     surf.blit(scaled_box, rect)
@@ -496,10 +508,10 @@ class FinishScreen:
                 hw, hh = hi.get_size()
                 sw = max(1, int(hw * 1.5))
                 sh = max(1, int(hh * 1.5))
-                scaled_hi = pygame.transform.scale(hi, (sw, sh))
+                scaled_hi = xform.scale(hi, (sw, sh))
                 # slow continuous rotation after reveal using unbounded elapsed
                 angle = max(0.0, (elapsed - 1.55)) * 60.0  # deg/sec
-                rotated_hi = pygame.transform.rotate(scaled_hi, angle)
+                rotated_hi = xform.rotate(scaled_hi, angle)
                 hr = rotated_hi.get_rect()
                 rise = min(1.0, (t - 1.55) / 0.7)
                 y = int(HEIGHT * 0.62) - int(160 * rise) + 130
@@ -516,13 +528,13 @@ class FinishScreen:
             # Texts (only after the hat starts to emerge), smaller and clamped to width
             if t >= 1.55:
                 # Title smaller
-                title_surf = self.font_list.render("New Hat Unlocked!", True, pygame.Color(255, 255, 0))
+                title_surf = _text.render(self.font_list, "New Hat Unlocked!", pygame.Color(255, 255, 0))
                 tx = (WIDTH - title_surf.get_width()) // 2
                 ty = int(HEIGHT * 0.16)
                 surf.blit(title_surf, (tx, ty))
 
                 if self._unlock_hat_name:
-                    name_surf = self.font.render(self._unlock_hat_name, True, pygame.Color(255, 255, 255))
+                    name_surf = _text.render(self.font, self._unlock_hat_name, pygame.Color(255, 255, 255))
                     # Clamp to 90% screen width if needed
                     max_w = int(WIDTH * 0.9)
                     if name_surf.get_width() > max_w:
@@ -545,8 +557,7 @@ class FinishScreen:
                     # blink at ~2Hz based on unbounded elapsed time
                     if (int(since_pop * 2) % 2) == 0:
                         prompt = "Press space to continue"
-                        pr = self.font_small.render(prompt, True, pygame.Color(255, 255, 255))
-                        px = (WIDTH - pr.get_width()) // 2
+                        px = (WIDTH - self.font_small.size(prompt)[0]) // 2
                         py = HEIGHT - max(28, int(self.font_small.get_linesize() * 1.6)) - 200
                         self._draw_text_outlined(surf, self.font_small, prompt, (px, py))
 
@@ -564,52 +575,27 @@ class FinishScreen:
     # --- Celebration helpers ---
     def _spawn_confetti(self, burst: int = 80):
         for _ in range(burst):
-            x = random.uniform(0, WIDTH)
-            y = random.uniform(0, HEIGHT)
-            vx = random.uniform(-160, 160)
-            vy = random.uniform(-120, 220)
-            size = random.randint(3, 6)
-            color = random.choice([
+            x = _rng.uniform(0, WIDTH)
+            y = _rng.uniform(0, HEIGHT)
+            vx = _rng.uniform(-160, 160)
+            vy = _rng.uniform(-120, 220)
+            size = _rng.randint(3, 6)
+            color = _rng.choice([
                 (255, 80, 80), (255, 200, 60), (120, 255, 120), (120, 180, 255), (220, 120, 255)
             ])
-            life = random.uniform(0.8, 1.8)
-            self._confetti.append({
-                "x": x, "y": y, "vx": vx, "vy": vy, "size": size, "color": color,
-                "life": life, "age": 0.0, "spin": random.uniform(-6, 6)
-            })
+            life = _rng.uniform(0.8, 1.8)
+            _rng.uniform(-6, 6)  # spin (unused); keeps the "finish" stream in step
+            self._confetti.emit(x, y, vx, vy, life, size, color)
 
     def _update_confetti(self, dt: float):
-        alive = []
-        for p in self._confetti:
-            p["age"] += dt
-            if p["age"] > p["life"]:
-                continue
-            p["vy"] += GRAVITY * 0.4 * dt
-            p["vx"] *= 0.995
-            p["x"] += p["vx"] * dt
-            p["y"] += p["vy"] * dt
-            alive.append(p)
-        self._confetti = alive
+        self._confetti.update(dt)
 
     def _draw_confetti(self, surf: pygame.Surface):
-        for p in self._confetti:
-            t = max(0.0, min(1.0, p["age"] / p["life"]))
-            alpha = int(255 * (1.0 - t))
-            s = max(1, int(p["size"]))
-            rect = pygame.Rect(int(p["x"]), int(p["y"]), s, s)
-            col = (*p["color"], alpha)
-            tile = pygame.Surface((s, s), pygame.SRCALPHA)
-            tile.fill(col)
-            surf.blit(tile, rect)
+        self._confetti.draw(surf)
 
     # --- Text helper: white text with black outline ---
     def _draw_text_outlined(self, surf: pygame.Surface, font: pygame.font.Font, text: str, pos: tuple[int, int]):
-        white = font.render(text, True, pygame.Color(255, 255, 255))
-        black = font.render(text, True, pygame.Color(0, 0, 0))
-        x, y = pos
-        for dx, dy in ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)):
-            surf.blit(black, (x + dx, y + dy))
-        surf.blit(white, pos)
+        _text.blit_outlined(surf, font, text, pos)
 
     # --- Mask helper: sample mask using screen coordinates ---
     def _mask_solid_at_screen(self, sx: float, sy: float) -> bool:
@@ -727,11 +713,11 @@ class FinishScreen:
         b = min(self.pile_right - margin, self.mouth.rect.centerx - margin - 140)
         if b <= a:
             b = a + 1
-        tx = int(random.triangular(a, b, a))
+        tx = int(_rng.triangular(a, b, a))
         ty = self.ground_y - img.get_height()
-        T = random.uniform(0.7, 1.1)  # 增加拋物線時間範圍
-        vx = (tx - x0) / T + random.uniform(-16, 16)  # 增加橫向隨機性
-        vy = (ty - y0 - 0.5 * GRAVITY * T * T) / T + random.uniform(-18, 6)  # 增加拋物線高度
+        T = _rng.uniform(0.7, 1.1)  # 增加拋物線時間範圍
+        vx = (tx - x0) / T + _rng.uniform(-16, 16)  # 增加橫向隨機性
+        vy = (ty - y0 - 0.5 * GRAVITY * T * T) / T + _rng.uniform(-18, 6)  # 增加拋物線高度
         self.flying.append(SpewItem(kind, img, x0, y0, vx, vy))
         # Play spit_out sound on spawn (if available)
         if self._spit_out_snd is not None:
@@ -748,7 +734,7 @@ class FinishScreen:
         b = min(self.pile_right - margin, self.mouth.rect.centerx - margin - 140)
         if b <= a:
             b = a + 1
-        tx = int(random.triangular(a, b, a))
+        tx = int(_rng.triangular(a, b, a))
         ty = self.ground_y - img.get_height()
         it = SpewItem(kind, img, float(tx), float(ty), 0.0, 0.0)
         it.asleep = True
@@ -846,6 +832,7 @@ class FinishScreen:
             return "D"
         return "F"
 
+    @trace.traced("FinishScreen.loop", "screen")
     def loop(self, dm, clock):
         # 結算畫面開始時強制停止boss音樂（避免殘留）
         try:
@@ -870,8 +857,8 @@ class FinishScreen:
             if not pygame.mixer.get_init():
                 pygame.mixer.init()
             pt_path = os.path.join("nanmon", "assets", "sounds", "page_turn.mp3")
-            if os.path.exists(pt_path):
-                turn_snd = pygame.mixer.Sound(pt_path)
+            if resources.exists(pt_path):
+                turn_snd = soundbank.get(pt_path)
         except Exception:
             turn_snd = None
         fixed_mouth_pos = (int(WIDTH * 0.82), int(HEIGHT * 0.72) - self._y_offset)
@@ -884,6 +871,7 @@ class FinishScreen:
                 except Exception:
                     pass
             dt = clock.tick(60) / 1000.0
+            perf.frame()
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     return
@@ -897,8 +885,8 @@ class FinishScreen:
                                 if not pygame.mixer.get_init():
                                     pygame.mixer.init()
                                 sound_path = os.path.join("nanmon", "assets", "sounds", "menu_select_sounds.ogg")
-                                if os.path.exists(sound_path):
-                                    pygame.mixer.Sound(sound_path).play()
+                                if resources.exists(sound_path):
+                                    soundbank.get(sound_path).play()
                         except Exception:
                             pass
                         return
@@ -916,8 +904,8 @@ class FinishScreen:
                                 if not pygame.mixer.get_init():
                                     pygame.mixer.init()
                                 sound_path = os.path.join("nanmon", "assets", "sounds", "menu_select_sounds.ogg")
-                                if os.path.exists(sound_path):
-                                    pygame.mixer.Sound(sound_path).play()
+                                if resources.exists(sound_path):
+                                    soundbank.get(sound_path).play()
                         except Exception:
                             pass
                         # If grade is A/S, play unlock sequence before exit
@@ -931,6 +919,7 @@ class FinishScreen:
                         # All ranks continue to next level
                         return ("NEXT_LEVEL", int(self.level) + 1, self._equipped_hat)
 
+            perf.lap("events")
             keys = pygame.key.get_pressed()
             self.mouth.update(dt, keys)
             self.mouth.rect.center = fixed_mouth_pos
@@ -1078,6 +1067,7 @@ class FinishScreen:
                     self.flying.remove(it)
                     self.settled.append(it)
 
+            perf.lap("sim")
             surf = dm.get_logical_surface()
             # Draw scrolling background (stacked tiles moving upward)
             if self._bg_img is not None and self._bg_h > 0:
@@ -1124,26 +1114,20 @@ class FinishScreen:
                     if self._impact_jitter_time > 0.0:
                         self._impact_jitter_time = max(0.0, self._impact_jitter_time - (1/60))
                         mag = self._impact_jitter_mag * (self._impact_jitter_time / 0.42)
-                        jx = int(random.uniform(-mag, mag))
-                        jy = int(random.uniform(-mag, mag))
+                        jx = int(_rng.uniform(-mag, mag))
+                        jy = int(_rng.uniform(-mag, mag))
                     jittered = rect.move(jx, jy)
 
                     if self._need_smoke_spawn:
                         cx, cy = jittered.center
                         for _ in range(10):
-                            px = cx + random.randint(-30, 30)
-                            py = cy + random.randint(-20, 20)
-                            self._smoke.append(Smoke((px, py)))
+                            px = cx + _rng.randint(-30, 30)
+                            py = cy + _rng.randint(-20, 20)
+                            self._smoke.puff((px, py))
                         self._need_smoke_spawn = False
 
-                    if self._smoke:
-                        alive_smoke = []
-                        for s in self._smoke:
-                            s.update(1/60)
-                            if s.alive:
-                                alive_smoke.append(s)
-                                s.draw(surf)
-                        self._smoke = alive_smoke
+                    self._smoke.update(1/60)
+                    self._smoke.draw(surf)
 
                     surf.blit(img, jittered)
                 self._draw_confetti(surf)
@@ -1225,5 +1209,7 @@ class FinishScreen:
                     white.fill((255, 255, 255, alpha))
                     surf.blit(white, (0, 0))
 
+            perf.lap("world")
             dm.present()
+            perf.lap("present")
             # end of frame
@@ -4,6 +4,9 @@ import pygame
 WIDTH, HEIGHT = 600, 900
 FPS = 60
 RNG_SEED = 42
+# Gameplay advances in fixed ticks; rendering interpolates between them
+SIM_DT = 1.0 / FPS
+MAX_SIM_STEPS = 5  # catch-up cap per rendered frame (avoids spiral of death)
 
 # Colors
 BG_COLOR = pygame.Color("#1E1E1E")
@@ -60,6 +63,18 @@ FOOD_HITBOX_SCALE = 0.8
 ASSET_HAT_DIR = "nanmon/assets/hats"
 # ---Teddy add---
 
+# Sound effects the gameplay screen itself plays
+ASSET_SOUND_DIR = "nanmon/assets/sounds"
+SFX_MENU_SELECT = f"{ASSET_SOUND_DIR}/menu_select_sounds.ogg"
+SFX_EAT = f"{ASSET_SOUND_DIR}/eat_sounds.wav"
+SFX_PAGE_TURN = f"{ASSET_SOUND_DIR}/page_turn.mp3"
+
+# Pre-scaled raw pixels written by `python -m nanmon.bake`
+ASSET_BAKED_DIR = "nanmon/assets/baked"
+# Loose asset folder, and the single-file pack `python -m nanmon.pack` makes of it
+ASSET_DIR = "nanmon/assets"
+ASSET_PACK = "nanmon/assets.pak"
+
 # Canonical food category mapping (single source of truth)
 # Use this everywhere to avoid scattered SALTY/SWEET declarations.
 FOOD_CATEGORY = {
@@ -128,6 +143,8 @@ BOSS_BITES_TO_KILL = 4
 
 # When to spawn the boss (seconds); used by Progress bar
 BOSS_SPAWN_TIME = 10.0
+# Build the boss this long before the bar fills, so its arrival is a handover
+BOSS_PREWARM_LEAD = 2.0
 
 # Target visuals that may appear on boss (optional for now)
 TARGET_SIZE = (44, 44)
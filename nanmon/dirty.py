@@ -0,0 +1,66 @@
+"""Opt-in dirty-rectangle bookkeeping for mostly static screens.
+
+Screens report what they drew this frame (`track` keeps the previous bounds
+per key, so moved things clear their old spot too) and hand `take()` to
+`DisplayManager.present()`. When too much changed, `take()` returns None and
+the frame goes out as a normal full present. Everything is in logical
+(WIDTH x HEIGHT) coordinates.
+"""
+from __future__ import annotations
+import pygame
+from .constants import WIDTH, HEIGHT
+
+
+class DirtyTracker:
+    def __init__(self, bounds: pygame.Rect | None = None, max_rects: int = 16, full_ratio: float = 0.6):
+        self.bounds = pygame.Rect(bounds) if bounds is not None else pygame.Rect(0, 0, WIDTH, HEIGHT)
+        self.max_rects = max_rects
+        self.full_ratio = full_ratio
+        self._prev: dict = {}
+        self._rects: list[pygame.Rect] = []
+        self.full = True  # first frame has nothing on screen yet
+
+    def mark(self, rect) -> None:
+        r = self.bounds.clip(pygame.Rect(rect))
+        if r.width > 0 and r.height > 0:
+            self._rects.append(r)
+
+    def mark_full(self) -> None:
+        self.full = True
+
+    def track(self, key, rect) -> None:
+        """Report `key`'s bounds this frame; its old bounds are redrawn too."""
+        rect = pygame.Rect(rect)
+        prev = self._prev.get(key)
+        if prev != rect:
+            if prev is not None:
+                self.mark(prev)
+            self._prev[key] = rect
+        self.mark(rect)
+
+    def forget(self, key) -> None:
+        prev = self._prev.pop(key, None)
+        if prev is not None:
+            self.mark(prev)
+
+    def take(self) -> list[pygame.Rect] | None:
+        """Merged rects for this frame, or None for a full present; resets."""
+        rects, self._rects = self._rects, []
+        if self.full:
+            self.full = False
+            return None
+        merged: list[pygame.Rect] = []
+        for r in rects:
+            # fold into anything it touches until it stands alone
+            i = 0
+            while i < len(merged):
+                if r.colliderect(merged[i].inflate(2, 2)):
+                    r = r.union(merged.pop(i))
+                    i = 0
+                else:
+                    i += 1
+            merged.append(r)
+        area = sum(r.width * r.height for r in merged)
+        if len(merged) > self.max_rects or area > self.full_ratio * self.bounds.width * self.bounds.height:
+            return None
+        return merged
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import math
 import sys
 import pygame
 from typing import Tuple
@@ -11,6 +12,11 @@ class DisplayManager:
     - Draw everything to the logical surface (LOGICAL_W x LOGICAL_H).
     - Call present() to scale and blit to a resizable window with aspect preserved.
     - Integer scaling by default for crisp pixel art; optional smooth scaling.
+    - present() allocates nothing: the scale target is created on resize and
+      reused, and the letterbox bars are only repainted after a resize.
+    - Opt-in dirty rects (`dirty_rects=True`): screens that track what they
+      changed pass those rects to present(), which then scales and pushes
+      only those window regions (see nanmon.dirty).
     """
 
     def __init__(
@@ -20,14 +26,12 @@ class DisplayManager:
         caption: str = "Game",
         bg_color: Tuple[int, int, int] = (LETTERBOX_COLOR.r, LETTERBOX_COLOR.g, LETTERBOX_COLOR.b),  # Light grey for letterbox
         initial_size: Tuple[int, int] | None = None,
+        dirty_rects: bool = False,
     ) -> None:
         self.margin = float(max(0.1, min(1.0, margin)))
         self.use_integer_scale = bool(use_integer_scale)
         self.bg_color = bg_color
-
-        # Logical surface the game renders into. Use SRCALPHA so it doesn't
-        # depend on a display mode being set (convert_alpha requires that).
-        self.logical = pygame.Surface((LOGICAL_W, LOGICAL_H), pygame.SRCALPHA)
+        self.dirty_rects = bool(dirty_rects)
 
         # Create a resizable window
         if initial_size is None:
@@ -37,8 +41,19 @@ class DisplayManager:
         self.window = pygame.display.set_mode(initial_size, pygame.RESIZABLE)
         pygame.display.set_caption(caption)
 
+        # Logical surface the game renders into. Every screen paints it edge
+        # to edge, so it is opaque and in the display format: layers blit
+        # onto it without blending and present() can scale it straight
+        # into the window.
+        self.logical = pygame.Surface((LOGICAL_W, LOGICAL_H)).convert()
+        self.logical.fill(self.bg_color)
+
         # Derived state
         self.dest_rect = pygame.Rect(0, 0, initial_size[0], initial_size[1])
+        self.scale = 1.0
+        self._scaled: pygame.Surface | None = None   # persistent scale target
+        self._window_key = None  # (size, pixel address) _scaled was built against
+        self._bars_dirty = True
         self._recompute_letterbox()
 
     def _compute_scale(self, w: int, h: int) -> float:
@@ -72,6 +87,41 @@ class DisplayManager:
         x = (w - out_w) // 2
         y = (h - out_h) // 2
         self.dest_rect = pygame.Rect(x, y, out_w, out_h)
+        self.scale = s
+        self._bars_dirty = True
+
+        # Scale target, rebuilt only here. 1:1 needs none (plain blit). When the
+        # logical surface matches the window's pixel format we scale straight
+        # into a window subsurface; otherwise into a reusable surface of the
+        # logical format (transform.scale wants matching formats).
+        self._scaled = None
+        self._window_key = self._key(self.window)
+        if (out_w, out_h) != (LOGICAL_W, LOGICAL_H) and out_w > 0 and out_h > 0:
+            if self._window_compatible():
+                self._scaled = self.window.subsurface(self.dest_rect)
+            else:
+                self._scaled = pygame.Surface((out_w, out_h), self.logical.get_flags() & pygame.SRCALPHA, self.logical)
+
+    @staticmethod
+    def _key(window: pygame.Surface):
+        return window.get_size(), getattr(window, "_pixels_address", None)
+
+    def _check_window(self) -> None:
+        # A subsurface scale target points into the window's pixels; if the
+        # window was re-created behind our back (set_mode elsewhere, or a
+        # resize nobody passed to handle_resize) rebuild before writing.
+        window = pygame.display.get_surface()
+        if window is None:
+            return
+        if window is not self.window or self._key(window) != self._window_key:
+            self.window = window
+            self._recompute_letterbox()
+
+    def _window_compatible(self) -> bool:
+        lg, win = self.logical, self.window
+        return (not (lg.get_flags() & pygame.SRCALPHA)
+                and lg.get_bitsize() == win.get_bitsize()
+                and lg.get_masks() == win.get_masks())
 
     def handle_resize(self, event: pygame.event.Event) -> None:
         # Handle window resize by recomputing letterbox
@@ -83,10 +133,70 @@ class DisplayManager:
     def get_logical_surface(self) -> pygame.Surface:
         return self.logical
 
-    def present(self) -> None:
-        # Fill letterbox bars
-        self.window.fill(self.bg_color)
-        # Scale logical surface to fit destination rectangle
-        scaled = pygame.transform.scale(self.logical, self.dest_rect.size)
-        self.window.blit(scaled, self.dest_rect.topleft)
+    def _window_rect(self, r: pygame.Rect) -> pygame.Rect:
+        """Window-space rect covering logical rect `r` (rounded outward)."""
+        s, dest = self.scale, self.dest_rect
+        x0 = dest.x + int(math.floor(r.left * s))
+        y0 = dest.y + int(math.floor(r.top * s))
+        x1 = dest.x + int(math.ceil(r.right * s))
+        y1 = dest.y + int(math.ceil(r.bottom * s))
+        return pygame.Rect(x0, y0, x1 - x0, y1 - y0).clip(dest)
+
+    def _present_dirty(self, dirty) -> None:
+        window, dest, lg = self.window, self.dest_rect, self.logical
+        translucent = bool(lg.get_flags() & pygame.SRCALPHA)
+        scaled = self._scaled
+        s = self.scale
+        whole = scaled is not None and float(s).is_integer()
+        if scaled is not None and not whole:
+            # Fractional scale: source pixels don't map to whole dest pixels,
+            # so rescale everything but still only push the changed regions
+            pygame.transform.scale(lg, dest.size, scaled)
+        out = []
+        for r in dirty:
+            wr = self._window_rect(r)
+            if wr.width <= 0 or wr.height <= 0:
+                continue
+            if translucent:
+                window.fill(self.bg_color, wr)
+            if scaled is None:
+                window.blit(lg, wr.topleft, r)
+            else:
+                local = wr.move(-dest.x, -dest.y)
+                if whole:
+                    # Nearest neighbour at an integer factor: a region scales
+                    # to exactly the pixels a full scale would produce
+                    pygame.transform.scale(lg.subsurface(r), local.size, scaled.subsurface(local))
+                if scaled.get_parent() is None:
+                    window.blit(scaled, wr.topleft, local)
+            out.append(wr)
+        if out:
+            pygame.display.update(out)
+
+    def present(self, dirty: list[pygame.Rect] | None = None) -> None:
+        """Show the logical surface. `dirty` (logical rects from a DirtyTracker)
+        limits the work to those regions; None means the whole frame."""
+        self._check_window()
+        if dirty is not None and self.dirty_rects and not self._bars_dirty:
+            self._present_dirty(dirty)
+            return
+        window, dest = self.window, self.dest_rect
+        # Letterbox bars only change when the window does
+        if self._bars_dirty:
+            window.fill(self.bg_color)
+            self._bars_dirty = False
+        elif self.logical.get_flags() & pygame.SRCALPHA:
+            # Translucent pixels must land on the letterbox colour, not last frame
+            window.fill(self.bg_color, dest)
+
+        scaled = self._scaled
+        if scaled is None:
+            # 1:1 fast path
+            window.blit(self.logical, dest.topleft)
+        else:
+            # Integer and fractional scales both scale in place (nearest
+            # neighbour), into the window itself when formats allow
+            pygame.transform.scale(self.logical, dest.size, scaled)
+            if scaled.get_parent() is None:
+                window.blit(scaled, dest.topleft)
         pygame.display.flip()
@@ -2,7 +2,16 @@ import pygame
 import os
 import math
 from .constants import WIDTH, HEIGHT
+from . import assets, trace, xform
 
+EARTH_IMG = os.path.join(os.path.dirname(__file__), 'assets', 'bg', 'earth_bg1.png')
+
+
+def preload_assets() -> list[assets.Asset]:
+    return [assets.Asset(EARTH_IMG, scope=assets.LEVEL)]
+
+
+@trace.traced("earth_bg_anim", "anim")
 def draw_earth_bg_anim(surface, anim_state):
     """
     Draw earth_bg.png animation: from above screen, slowly moves down to center, width=WIDTH, height scaled.
@@ -10,8 +19,7 @@ def draw_earth_bg_anim(surface, anim_state):
     """
     if anim_state.get('img_raw') is None:
         try:
-            img_path = os.path.join(os.path.dirname(__file__), 'assets', 'bg', 'earth_bg1.png')
-            img_raw = pygame.image.load(img_path).convert_alpha()
+            img_raw = assets.image(EARTH_IMG, scope=assets.LEVEL)
             anim_state['img_raw'] = img_raw
             # 固定大小，目標高度為畫面高度的2/3
             target_h = int(HEIGHT * (2/3))
@@ -35,7 +43,7 @@ def draw_earth_bg_anim(surface, anim_state):
         orig_w, orig_h = img_raw.get_width(), img_raw.get_height()
         cur_h = int(orig_h * scale)
         cur_w = int(orig_w * scale)
-        img = pygame.transform.scale(img_raw, (cur_w, cur_h))
+        img = xform.scale(img_raw, (cur_w, cur_h))
         # 飄動參數
         float_amplitude = 12  # 飄動幅度（像素）
         float_period = 2.5    # 完整上下週期（秒）
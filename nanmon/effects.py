@@ -1,41 +1,27 @@
 from __future__ import annotations
-import random
-import pygame
+from .particles import Particles, ParticleStyle
+from .rng import stream
 
+_smoke_rng = stream("smoke")
+_shake_rng = stream("shake")
 
-class Smoke:
-    """Simple expanding, fading smoke puff."""
-    def __init__(self, pos: tuple[int, int]):
-        self.x, self.y = pos
-        self.vx = random.uniform(-40, 40)
-        self.vy = random.uniform(-20, -60)
-        self.life = random.uniform(0.6, 1.2)
-        self.age = 0.0
-        self.base_r = random.randint(6, 12)
-        self.color = (200, 200, 200)
+# Expanding, fading grey puffs with gentle gravity
+SMOKE_STYLE = ParticleStyle(gravity=30.0, accel_first=False, alpha=180.0, grow=1.8)
+SMOKE_COLOR = (200, 200, 200)
 
-    @property
-    def alive(self) -> bool:
-        return self.age < self.life
 
-    def update(self, dt: float):
-        self.age += dt
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        # gentle gravity
-        self.vy += 30.0 * dt
+class Smoke(Particles):
+    """A cloud of smoke puffs; `puff()` adds one at a point."""
+    def __init__(self):
+        super().__init__(SMOKE_STYLE)
 
-    def draw(self, surface: pygame.Surface):
-        if not self.alive:
-            return
-        t = max(0.0, min(1.0, self.age / self.life))
-        alpha = int(180 * (1.0 - t))
-        radius = int(self.base_r * (1.0 + 1.8 * t))
-        if radius <= 0 or alpha <= 0:
-            return
-        puff = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
-        pygame.draw.circle(puff, (*self.color, alpha), (radius + 1, radius + 1), radius)
-        surface.blit(puff, (int(self.x - radius), int(self.y - radius)))
+    def puff(self, pos: tuple[int, int]):
+        x, y = pos
+        vx = _smoke_rng.uniform(-40, 40)
+        vy = _smoke_rng.uniform(-20, -60)
+        life = _smoke_rng.uniform(0.6, 1.2)
+        base_r = _smoke_rng.randint(6, 12)
+        self.emit(x, y, vx, vy, life, base_r, SMOKE_COLOR)
 
 
 class ScreenShake:
@@ -61,6 +47,24 @@ class ScreenShake:
         t = self.time / self.duration if self.duration > 0 else 0.0
         mag = self.magnitude * t
         return (
-            random.uniform(-mag, mag),
-            random.uniform(-mag, mag),
+            _shake_rng.uniform(-mag, mag),
+            _shake_rng.uniform(-mag, mag),
         )
+
+    @staticmethod
+    def apply(surface, offset: tuple[float, float], fill) -> None:
+        """Slide an already drawn layer by `offset` in place; the strip it
+        uncovers is filled with `fill`. A zero offset costs nothing."""
+        dx, dy = int(offset[0]), int(offset[1])
+        if not dx and not dy:
+            return
+        surface.scroll(dx, dy)
+        w, h = surface.get_size()
+        if dx > 0:
+            surface.fill(fill, (0, 0, dx, h))
+        elif dx < 0:
+            surface.fill(fill, (w + dx, 0, -dx, h))
+        if dy > 0:
+            surface.fill(fill, (0, 0, w, dy))
+        elif dy < 0:
+            surface.fill(fill, (0, h + dy, w, -dy))
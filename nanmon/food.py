@@ -1,4 +1,5 @@
 from __future__ import annotations
+import itertools
 import os
 import random
 from typing import Tuple
@@ -14,6 +15,11 @@ from .constants import (
     FOOD_CATEGORY,
 )
 from .levels import LevelConfig
+from .rng import stream
+from . import assets, resources
+
+_rng = stream("food")
+_serials = itertools.count(1)
 
 
 KINDS = [
@@ -59,34 +65,113 @@ FOOD_IMAGE_FILES = {
     "TAINANTOFUICE": "TAINANTOFUICE.png",
 }
 
+# Homing tuning per kind: (base strength, steer distance); hoisted out of update()
+_STRONG_HOMING = frozenset({"BURGERS", "CAKE", "DONUT", "RICEBOWLCAKE"})
+
+
+def homing_params(kind: str) -> tuple[float, float]:
+    base = HOMING_STRENGTH_STRONG if kind in _STRONG_HOMING else HOMING_STRENGTH_WEAK
+    # DONUT: very strong tracking
+    if kind == "DONUT":
+        base *= 2.2
+    # RICEBOWLCAKE: strongest tracking, tighter steer
+    if kind == "RICEBOWLCAKE":
+        return base * 3.4, 70.0
+    return base, 90.0
+
+
+_HOMING_PARAMS = {k: homing_params(k) for k in FOOD_IMAGE_FILES}
+
+
+class _MotionField:
+    """Float attribute that lives in a ProjectileStore column while attached."""
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.key = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is not None:
+            return float(getattr(store, self.name)[obj._slot])
+        return obj.__dict__[self.key]
+
+    def __set__(self, obj, value):
+        store = obj.__dict__.get("_store")
+        if store is not None:
+            getattr(store, self.name)[obj._slot] = value
+        else:
+            obj.__dict__[self.key] = value
+
+
+def _food_size(scale: float) -> tuple[int, int]:
+    base_w, base_h = FOOD_SIZE
+    return max(1, int(base_w * scale)), max(1, int(base_h * scale))
+
+
+_food_images: dict[tuple[str, tuple[int, int]], pygame.Surface | None] = {}
+
+
 def _load_food_image(kind: str, scale: float = 1.0) -> pygame.Surface | None:
-    """Try to load and scale the PNG; return None to fall back to geometry."""
+    """Try to load and scale the PNG; return None to fall back to geometry.
+
+    Results (misses too) are cached per kind and size, so spawning a food
+    that was seen before never goes near the disk.
+    """
+    size = _food_size(scale)
+    key = (kind, size)
+    if key in _food_images:
+        return _food_images[key]
+    img = None
     filename = FOOD_IMAGE_FILES.get(kind)
-    if not filename:
-        return None
-    path = os.path.join(ASSET_FOOD_DIR, filename)
-    if not os.path.exists(path):
-        return None
-    # Cache loaded/scaled images to avoid disk I/O and rescale cost during bursts
-    if not hasattr(_load_food_image, "_cache"):
-        _load_food_image._cache = {}
-    cache = _load_food_image._cache  # type: ignore[attr-defined]
-    
-    # Include scale in cache key so scaled versions are cached too
-    base_w, base_h = FOOD_SIZE
-    final_w = max(1, int(base_w * scale))
-    final_h = max(1, int(base_h * scale))
-    key = (path, final_w, final_h)
-    
-    if key in cache:
-        return cache[key]
-        
-    img = pygame.image.load(path).convert_alpha()
-    img = pygame.transform.scale(img, (final_w, final_h))
-    cache[key] = img
+    if filename:
+        path = os.path.join(ASSET_FOOD_DIR, filename)
+        if resources.exists(path):
+            img = assets.image(path, size)
+    _food_images[key] = img
     return img
 
+
+def preload_assets(scales=(1.0,), kinds=None) -> list[assets.Asset]:
+    """Food sprites (all kinds unless given) at each of `scales`."""
+    sizes = sorted({_food_size(s) for s in scales})
+    kinds = FOOD_IMAGE_FILES if kinds is None else kinds
+    return [assets.Asset(os.path.join(ASSET_FOOD_DIR, FOOD_IMAGE_FILES[k]), size)
+            for k in kinds if k in FOOD_IMAGE_FILES for size in sizes]
+
+
+_shape_cache: dict[tuple[str, int, int], pygame.Surface] = {}
+
+
+def _shape_image(category: str, scale: float = 1.0) -> pygame.Surface:
+    """Simple geometric fallback if an image is missing (cached per size)."""
+    base_w, base_h = FOOD_SIZE
+    if abs(scale - 1.0) > 1e-3:
+        base_w = max(1, int(base_w * scale))
+        base_h = max(1, int(base_h * scale))
+    key = (category, base_w, base_h)
+    s = _shape_cache.get(key)
+    if s is not None:
+        return s
+    s = pygame.Surface((base_w, base_h), pygame.SRCALPHA)
+    color = SALTY_COLOR if category == "SALTY" else SWEET_COLOR
+    w, h = s.get_size()
+    cx, cy = w // 2, h // 2
+    # ellipse + border
+    pygame.draw.ellipse(s, (*color[:3], 200), (2, 2, w - 4, h - 4))
+    pygame.draw.ellipse(s, (0, 0, 0, 180), (2, 2, w - 4, h - 4), 2)
+    # little highlight
+    pygame.draw.circle(s, (255, 255, 255, 120), (int(cx * 0.65), int(cy * 0.55)), max(2, w // 10))
+    _shape_cache[key] = s
+    return s
+
 class Food(pygame.sprite.Sprite):
+    fx = _MotionField()
+    fy = _MotionField()
+    vx = _MotionField()
+    vy = _MotionField()
+
     def __init__(
         self,
         kind: str,
@@ -100,50 +185,77 @@ class Food(pygame.sprite.Sprite):
         hitbox_scale: float | None = None
     ):
         super().__init__()
+        self._pooled = False
+        self._reset(kind, category, x, speed_y, homing, spawn_center_y=spawn_center_y,
+                    scale=scale, hitbox_scale=hitbox_scale)
+
+    def _reset(
+        self,
+        kind: str,
+        category: str,
+        x: int,
+        speed_y: float,
+        homing: bool,
+        *,
+        spawn_center_y: int | None = None,
+        scale: float = 1.0,
+        hitbox_scale: float | None = None
+    ):
+        """(Re)initialize every field; FoodPool calls this on recycled objects."""
+        # New identity on each (re)use; holders compare it to spot recycling
+        self.serial = next(_serials)
+        self._interp_prev = None
+        self._store = None  # set while a ProjectileStore owns the motion state
+        self._slot = -1
         self.kind = kind
         self.category = category
         self.homing = homing
-        self.vx = 0.0
-        self.vy = speed_y
+        self._vx = 0.0
+        self._vy = speed_y
         # When neutralized (e.g., defused soup), skip collisions and let it fly away
         self.neutralized = False
+        self.parried_by_player = False
+        self.boss_parry_soup = False
+        # Circle attacks freeze items until released
+        self.hold_motion = False
         # Hitbox scale (relative to current sprite size); defaults to constant
         self.hitbox_scale = float(FOOD_HITBOX_SCALE if hitbox_scale is None else hitbox_scale)
 
-        # try image first; fallback to geometry
+        # try image first; fallback to geometry. Both come from shared caches
+        # and are never drawn on, so every food of a kind blits the same surface.
         image = _load_food_image(kind, scale)
-        if image is not None:
-            # Image is already scaled to the correct size from cache
-            self.base_image = image
-            self.image = self.base_image.copy()
-        else:
-            base_w, base_h = FOOD_SIZE
-            if abs(scale - 1.0) > 1e-3:
-                base_w = max(1, int(base_w * scale))
-                base_h = max(1, int(base_h * scale))
-            self.base_image = pygame.Surface((base_w, base_h), pygame.SRCALPHA)
-            self.image = self.base_image.copy()
-            self._draw_shape()
+        if image is None:
+            image = _shape_image(category, scale)
+        self.base_image = image
+        self.image = image
 
         # Mark if this food originated from a boss emission (spawn_center_y provided)
         self.from_boss = (spawn_center_y is not None)
 
         if self.kind in ("SHAVEDICE", "TOFUPUDDING") and not self.from_boss:
-            self.vy = min(self.vy, 140.0)
+            self._vy = min(self._vy, 140.0)
 
         # HOTDOG: will split into DOG + BREAD after a short delay
-        self._split_timer = (random.uniform(0.4, 0.8) if self.kind == "HOTDOG" else None)
+        self._split_timer = (_rng.uniform(0.4, 0.8) if self.kind == "HOTDOG" else None)
         self.spawn_children = None
         self.remove_me = False
 
         # Spawn from top by default, or from a provided center Y (e.g., boss center)
+        rect = getattr(self, "rect", None)
+        if rect is None:
+            rect = self.rect = self.image.get_rect()
+        else:
+            rect.size = self.image.get_size()
         if spawn_center_y is None:
-            self.rect = self.image.get_rect(midtop=(x, -FOOD_SIZE[1]))
+            rect.midtop = (x, -FOOD_SIZE[1])
         else:
-            self.rect = self.image.get_rect(center=(x, spawn_center_y))
-        self.fx = float(self.rect.x)
-        self.fy = float(self.rect.y)
-        # Optional wobble state for S-shape trajectories
+            rect.center = (x, spawn_center_y)
+        self._fx = float(self.rect.x)
+        self._fy = float(self.rect.y)
+        # Optional wobble (S-shape trajectories); amp 0 disables it
+        self.wobble_amp = 0.0
+        self.wobble_freq = 4.0
+        self.wobble_phase = 0.0
         self._wobble_t = 0.0
         self._wobble_prev = 0.0
 
@@ -160,67 +272,38 @@ class Food(pygame.sprite.Sprite):
         r.center = self.rect.center
         return r
 
-    def _draw_shape(self):
-        # Simple geometric fallback if an image is missing
-        s = self.base_image
-        s.fill((0, 0, 0, 0))
-        salty = (self.category == "SALTY")
-        color = SALTY_COLOR if salty else SWEET_COLOR
-        w, h = s.get_size()
-        cx, cy = w // 2, h // 2
-        # ellipse + border
-        pygame.draw.ellipse(s, (*color[:3], 200), (2, 2, w - 4, h - 4))
-        pygame.draw.ellipse(s, (0, 0, 0, 180), (2, 2, w - 4, h - 4), 2)
-        # little highlight
-        pygame.draw.circle(s, (255, 255, 255, 120), (int(cx * 0.65), int(cy * 0.55)), max(2, w // 10))
-
     def update(self, dt: float, mouth_pos: Tuple[int, int]):
+        vx = self._vx
         # Homing only if enabled
         if self.homing and mouth_pos is not None:
             target_x = mouth_pos[0]
-            dx = target_x - (self.fx + self.rect.width / 2)
-
-            # Strong baseline for certain kinds; RICEBOWLCAKE is strongest by far
-            strong_set = {"BURGERS", "CAKE", "DONUT", "RICEBOWLCAKE"}
-            base = HOMING_STRENGTH_STRONG if self.kind in strong_set else HOMING_STRENGTH_WEAK
-
-            # DONUT: very strong tracking
-            if self.kind == "DONUT":
-                base *= 2.2
-
-            # RICEBOWLCAKE: strongest tracking
-            if self.kind == "RICEBOWLCAKE":
-                base *= 3.4  # beef this up hard
-                steer = max(-1.0, min(1.0, dx / 70.0))  # tighter steer
-            else:
-                steer = max(-1.0, min(1.0, dx / 90.0))
-
+            dx = target_x - (self._fx + self.rect.width / 2)
+            base, steer_div = _HOMING_PARAMS.get(self.kind) or homing_params(self.kind)
+            steer = max(-1.0, min(1.0, dx / steer_div))
             scale = min(1.0, abs(dx) / HOMING_RANGE_SCALE)
             strength = base * (0.3 + 0.7 * scale)
-            self.vx += strength * steer * 60 * dt
+            vx += strength * steer * 60 * dt
 
         # clamp horizontal speed
-        if self.vx > HOMING_MAX_VX:
-            self.vx = HOMING_MAX_VX
-        elif self.vx < -HOMING_MAX_VX:
-            self.vx = -HOMING_MAX_VX
+        if vx > HOMING_MAX_VX:
+            vx = HOMING_MAX_VX
+        elif vx < -HOMING_MAX_VX:
+            vx = -HOMING_MAX_VX
+        self._vx = vx
 
         # integrate
-        self.fx += self.vx * dt
-        self.fy += self.vy * dt
+        self._fx += vx * dt
+        self._fy += self._vy * dt
 
         # Optional horizontal wobble (S-shape)
-        if hasattr(self, 'wobble_amp') and getattr(self, 'wobble_amp'):
+        if self.wobble_amp:
             self._wobble_t += dt
-            freq = float(getattr(self, 'wobble_freq', 4.0))
-            phase = float(getattr(self, 'wobble_phase', 0.0))
-            amp = float(getattr(self, 'wobble_amp', 0.0))
-            off = amp * math.sin(self._wobble_t * freq + phase)
-            self.fx += (off - self._wobble_prev)
+            off = self.wobble_amp * math.sin(self._wobble_t * self.wobble_freq + self.wobble_phase)
+            self._fx += (off - self._wobble_prev)
             self._wobble_prev = off
 
-        self.rect.x = int(self.fx)
-        self.rect.y = int(self.fy)
+        self.rect.x = int(self._fx)
+        self.rect.y = int(self._fy)
 
         # HOTDOG split behavior: replace self with DOG and BREAD
         if self._split_timer is not None and not self.remove_me:
@@ -229,28 +312,76 @@ class Food(pygame.sprite.Sprite):
             if (self.rect.top >= HEIGHT - 220) and self.spawn_children is None:
                 self._split_timer = 0.0
             if self._split_timer <= 0 and self.spawn_children is None:
-                cx, cy = self.rect.center
+                self.spawn_children = self.split_children()
+                self.remove_me = True
 
-                # Horizontal speed based on fall speed (or a floor)
-                hspeed = max(260.0, abs(self.vy))
+    def split_children(self) -> list["Food"]:
+        """HOTDOG -> DOG + BREAD flying apart horizontally from our center."""
+        cx, cy = self.rect.center
+        # Horizontal speed based on fall speed (or a floor)
+        hspeed = max(260.0, abs(self.vy))
+        # Both parts are SALTY, no vertical drift, opposite horizontal speeds
+        dog = food_pool.acquire("DOG", "SALTY", cx - 10, 0.0, False, spawn_center_y=cy)
+        bread = food_pool.acquire("BREAD", "SALTY", cx + 10, 0.0, False, spawn_center_y=cy)
+        dog.vx = -hspeed
+        bread.vx = +hspeed
+        return [dog, bread]
 
-                # Both parts are SALTY, inherit 0 vertical speed and opposite horizontal speeds
-                dog = Food("DOG", "SALTY", cx - 10, 0.0, False, spawn_center_y=cy)
-                bread = Food("BREAD", "SALTY", cx + 10, 0.0, False, spawn_center_y=cy)
+    def draw(self, surface: pygame.Surface):
+        surface.blit(self.image, self.rect)
 
-                # Move purely horizontally in opposite directions
-                dog.vx = -hspeed
-                bread.vx = +hspeed
 
-                # No vertical drift
-                dog.vy = 0.0
-                bread.vy = 0.0
+class FoodPool:
+    """Recycles Food objects so dense boss phases don't allocate.
 
-                self.spawn_children = [dog, bread]
-                self.remove_me = True
+    Containers `retire()` foods as they drop them; `collect()` runs at the end
+    of each simulation step and frees the ones that are still outside every
+    container, so code later in the same step can keep using what it just
+    removed. Anything that holds a Food across steps should remember its
+    `serial` and compare before use -- a recycled object gets a new one.
+    """
+    def __init__(self, limit: int = 512):
+        self.limit = limit
+        self._free: list[Food] = []
+        self._retired: list[Food] = []
+        self.created = 0
+        self.reused = 0
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self, kind: str, category: str, x: int, speed_y: float, homing: bool, **kw) -> Food:
+        if self._free:
+            f = self._free.pop()
+            f._pooled = False
+            f._reset(kind, category, x, speed_y, homing, **kw)
+            self.reused += 1
+            return f
+        self.created += 1
+        return Food(kind, category, x, speed_y, homing, **kw)
+
+    def retire(self, f: Food):
+        self._retired.append(f)
+
+    def collect(self):
+        free, limit = self._free, self.limit
+        for f in self._retired:
+            # re-added somewhere (or already freed) since it was dropped
+            if f._pooled or f._store is not None or f.alive():
+                continue
+            if len(free) < limit:
+                f._pooled = True
+                f.spawn_children = None
+                free.append(f)
+        self._retired.clear()
+
+    def clear(self):
+        self._free.clear()
+        self._retired.clear()
+
+
+food_pool = FoodPool()
 
-    def draw(self, surface: pygame.Surface):
-        surface.blit(self.image, self.rect)
 
 def make_food(rng: random.Random, level_cfg: LevelConfig | None = None) -> Food:
     if level_cfg is None:
@@ -264,7 +395,7 @@ def make_food(rng: random.Random, level_cfg: LevelConfig | None = None) -> Food:
         speed_y = rng.uniform(*FOOD_FALL_SPEED_RANGE)
         x = rng.randint(20, WIDTH - 20)
         homing = (kind in ("BURGERS", "CAKE"))
-        return Food(kind, category, x, speed_y, homing)
+        return food_pool.acquire(kind, category, x, speed_y, homing)
     else:
         homing_choice = rng.random() < level_cfg.homing_fraction
         if homing_choice and level_cfg.foods_homing:
@@ -278,4 +409,4 @@ def make_food(rng: random.Random, level_cfg: LevelConfig | None = None) -> Food:
         homing = (kind in tuple(level_cfg.foods_homing))
         scale = getattr(level_cfg, "food_scale", 1.0)
         hitbox_scale = getattr(level_cfg, "food_hitbox_scale", None)
-        return Food(kind, category, x, speed_y, homing, scale=scale, hitbox_scale=hitbox_scale)
+        return food_pool.acquire(kind, category, x, speed_y, homing, scale=scale, hitbox_scale=hitbox_scale)
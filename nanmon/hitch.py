@@ -0,0 +1,134 @@
+"""Frame hitch detector: logs gameplay frames that blow the budget, with context.
+
+    python main.py                          # on, logging to LOG_NAME
+    python main.py --hitch-budget 3         # flag frames over 3x 1/FPS
+    python main.py --no-hitch-log           # off
+
+Once `start()`ed, perf times every gameplay frame's sections (as it does
+for the F3 overlay, minus the drawing), plus the level's music load, the
+finish screen's construction and its frames, and hands frames longer than
+`factor` x 1/FPS to `report()`. Each becomes one JSON line: when, how long,
+the per-section split and which section took the most, entity counts from
+the `watch()`ed callable, surfaces created that frame (lazy decodes and
+cache misses show up here) and the last few gameplay events
+(trace.recent: boss spawn, target respawn, finish screen, music load...).
+
+Lines go through a logging QueueListener, so the file is written on a
+background thread, never inside the frame being measured. The log rotates
+at MAX_BYTES, keeping BACKUPS older files, and is only created once
+something hitches.
+"""
+from __future__ import annotations
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+from .constants import FPS
+from . import resources, trace
+
+LOG_NAME = "hitches.jsonl"
+FACTOR = 2.0  # budget, in multiples of 1/FPS
+MAX_BYTES = 1024 * 1024
+BACKUPS = 3
+
+on = False
+budget_ms = FACTOR * 1000.0 / FPS
+_path: str | None = None
+_log: logging.Logger | None = None
+_listener: logging.handlers.QueueListener | None = None
+_watch = None  # () -> {name: count}, from the running level
+_counts = {"hitches": 0}
+
+
+def default_path() -> str:
+    """LOG_NAME beside the executable in a frozen build, else in the checkout."""
+    if getattr(sys, "frozen", False):
+        return os.path.join(os.path.dirname(sys.executable), LOG_NAME)
+    return resources.resolve(LOG_NAME)
+
+
+def start(path: str | None = None, factor: float = FACTOR) -> None:
+    """Flag frames over `factor` x 1/FPS, logging them to `path`."""
+    global on, budget_ms, _path
+    _path = path or default_path()
+    budget_ms = factor * 1000.0 / FPS
+    on = True
+
+
+def stop() -> None:
+    global on, _log, _listener
+    on = False
+    if _listener is not None:
+        _listener.stop()  # writes out whatever is still queued
+        for h in _listener.handlers:
+            h.close()
+        _listener = None
+        _log.handlers.clear()
+        _log = None
+
+
+def watch(counts) -> None:
+    """`counts()` gives the entity counts recorded with each hitch (None: none)."""
+    global _watch
+    _watch = counts
+
+
+def _logger() -> logging.Logger | None:
+    global _log, _listener
+    if _log is None:
+        try:
+            d = os.path.dirname(os.path.abspath(_path))
+            os.makedirs(d, exist_ok=True)
+            handler = logging.handlers.RotatingFileHandler(_path, maxBytes=MAX_BYTES, backupCount=BACKUPS,
+                                                           encoding="utf-8", delay=True)
+        except OSError:
+            return None  # nowhere to write; the game carries on
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        q = queue.SimpleQueue()
+        _listener = logging.handlers.QueueListener(q, handler)
+        _listener.start()
+        log = logging.getLogger("nanmon.hitch")
+        log.propagate = False
+        log.setLevel(logging.INFO)
+        log.addHandler(logging.handlers.QueueHandler(q))
+        _log = log
+        atexit.unregister(stop)
+        atexit.register(stop)
+    return _log
+
+
+def report(frame_ms: float, split_ms: dict[str, float], made: int) -> None:
+    """Log one over-budget frame (perf calls this)."""
+    if not on:
+        return
+    _counts["hitches"] += 1
+    work = sum(split_ms.values())
+    split = {k: round(v, 2) for k, v in split_ms.items() if v >= 0.05}
+    split["idle"] = round(max(0.0, frame_ms - work), 2)  # tick() wait, or time outside the laps
+    record = {
+        "t": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "frame_ms": round(frame_ms, 2),
+        "budget_ms": round(budget_ms, 2),
+        "worst": max(split, key=split.get),
+        "split_ms": split,
+        "new_surfaces": made,
+    }
+    if _watch is not None:
+        try:
+            record["counts"] = _watch()
+        except Exception:
+            pass
+    now = time.perf_counter()
+    record["recent"] = [{"name": name, "ago_ms": round((now - t) * 1000.0, 1), **(args or {})}
+                        for t, name, args in list(trace.recent)]
+    log = _logger()
+    if log is not None:
+        log.info(json.dumps(record, ensure_ascii=False))
+
+
+def stats() -> dict:
+    return {"on": on, "budget_ms": round(budget_ms, 2), "path": _path, **_counts}
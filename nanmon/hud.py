@@ -3,26 +3,39 @@ import pygame
 from .constants import WIDTH, HEIGHT, WHITE, BG_COLOR, NAUSEA_MAX, SALTY_COLOR, SWEET_COLOR, FONT_PATH
 from .mouth import Mouth
 from .models import EatenCounters
+from . import text
 
+BAR_W, BAR_H = 220, 16
+BAR_X = WIDTH - BAR_W - 12
+BAR_Y = 12
 
-def draw_hud(surface: pygame.Surface, font: pygame.font.Font, mouth: Mouth, nausea: float, eaten: EatenCounters, score: int, legend_alpha: int, level_cleared: bool, game_over: bool):
-    mode_text = f"Mode: {mouth.mode}"
-    txt = font.render(mode_text, True, WHITE)
-    surface.blit(txt, (12, 10))
-    swatch_col = SWEET_COLOR if mouth.mode == "SWEET" else SALTY_COLOR
-    pygame.draw.rect(surface, swatch_col, pygame.Rect(12 + txt.get_width() + 8, 14, 20, 12))
+# (font, mode) -> top strip with the mode label, swatch and nausea bar frame
+_chrome: dict[tuple, pygame.Surface] = {}
+
+
+def _chrome_layer(font: pygame.font.Font, mode: str) -> pygame.Surface:
+    layer = _chrome.get((font, mode))
+    if layer is None:
+        txt = text.render(font, f"Mode: {mode}", WHITE)
+        layer = pygame.Surface((WIDTH, max(BAR_Y + BAR_H + 2, 10 + txt.get_height())), pygame.SRCALPHA)
+        # RGBA_MAX onto the clear layer copies the glyph pixels as they are
+        layer.blit(txt, (12, 10), special_flags=pygame.BLEND_RGBA_MAX)
+        swatch_col = SWEET_COLOR if mode == "SWEET" else SALTY_COLOR
+        pygame.draw.rect(layer, swatch_col, pygame.Rect(12 + txt.get_width() + 8, 14, 20, 12))
+        pygame.draw.rect(layer, WHITE, pygame.Rect(BAR_X-2, BAR_Y-2, BAR_W+4, BAR_H+4), 2)
+        _chrome[(font, mode)] = layer
+    return layer
 
-    bar_w, bar_h = 220, 16
-    bar_x = WIDTH - bar_w - 12
-    bar_y = 12
-    pygame.draw.rect(surface, WHITE, pygame.Rect(bar_x-2, bar_y-2, bar_w+4, bar_h+4), 2)
-    fill_w = int(bar_w * max(0, min(1, nausea / NAUSEA_MAX)))
+
+def draw_hud(surface: pygame.Surface, font: pygame.font.Font, mouth: Mouth, nausea: float, eaten: EatenCounters, score: int, legend_alpha: int, level_cleared: bool, game_over: bool):
+    surface.blit(_chrome_layer(font, mouth.mode), (0, 0))
+    fill_w = int(BAR_W * max(0, min(1, nausea / NAUSEA_MAX)))
     fill_col = pygame.Color(255, 120, 120) if nausea >= NAUSEA_MAX else pygame.Color(200, 200, 50)
-    pygame.draw.rect(surface, fill_col, pygame.Rect(bar_x, bar_y, fill_w, bar_h))
+    pygame.draw.rect(surface, fill_col, pygame.Rect(BAR_X, BAR_Y, fill_w, BAR_H))
 
     if level_cleared:
-        msg = font.render("LEVEL CLEARED!", True, WHITE)
+        msg = text.render(font, "LEVEL CLEARED!", WHITE)
         surface.blit(msg, (WIDTH//2 - msg.get_width()//2, HEIGHT//2 - 30))
     elif game_over:
-        msg = font.render("GAME OVER!", True, WHITE)
+        msg = text.render(font, "GAME OVER!", WHITE)
         surface.blit(msg, (WIDTH//2 - msg.get_width()//2, HEIGHT//2 - 30))
@@ -2,9 +2,11 @@ from __future__ import annotations
 import os
 import math
 import pygame
-from .constants import WIDTH, HEIGHT, BG_COLOR, WHITE, FPS, FONT_PATH, ASSET_HAT_DIR
+from .constants import WIDTH, HEIGHT, BG_COLOR, WHITE, FPS, ASSET_HAT_DIR
 from .unlocks import load_unlocked_hats, is_debug_unlock_all, list_all_hats
 from .mouth import Mouth
+from .dirty import DirtyTracker
+from . import assets, resources, soundbank, text, trace, xform
 
 
 class InitMenu:
@@ -18,8 +20,7 @@ class InitMenu:
         self.images = []
         for path in (image_path_1, image_path_2):
             try:
-                img = pygame.image.load(path).convert_alpha()
-                img = pygame.transform.scale(img, (WIDTH, HEIGHT))
+                img = assets.image(path, (WIDTH, HEIGHT))
             except Exception:
                 img = pygame.Surface((WIDTH, HEIGHT))
                 img.fill((20, 20, 20))
@@ -36,7 +37,7 @@ class InitMenu:
         # --- Required art ---
         # Border 330x220; level previews 300x200
         try:
-            self.border_img = pygame.image.load("nanmon/assets/preview_boarder.png").convert_alpha()
+            self.border_img = assets.image("nanmon/assets/preview_boarder.png")
         except Exception:
             self.border_img = pygame.Surface((330, 220), pygame.SRCALPHA)
             pygame.draw.rect(self.border_img, (60, 60, 60), self.border_img.get_rect(), border_radius=12)
@@ -44,12 +45,12 @@ class InitMenu:
 
         def _load_level_preview(path: str) -> pygame.Surface:
             try:
-                img = pygame.image.load(path).convert_alpha()
+                img = assets.image(path)
+                if img.get_size() != (300, 200):
+                    img = assets.image(path, (300, 200), smooth=True)
             except Exception:
                 img = pygame.Surface((300, 200), pygame.SRCALPHA)
                 img.fill((40, 40, 40, 255))
-            if img.get_size() != (300, 200):
-                img = pygame.transform.smoothscale(img, (300, 200))
             return img
 
         self.level_previews = {
@@ -74,16 +75,16 @@ class InitMenu:
         self._fade_duration = 0.6
 
         # Fonts (smaller title per request)
-        self.font_title = pygame.font.Font(FONT_PATH, 30)
-        self.font_hint = pygame.font.Font(FONT_PATH, 16)
-        self.font_label = pygame.font.Font(FONT_PATH, 26)
+        self.font_title = text.font(30)
+        self.font_hint = text.font(16)
+        self.font_label = text.font(26)
 
         # Sounds (only use menu_select_sounds)
         self.menu_sound = None
         try:
             sp = os.path.join("nanmon", "assets", "sounds", "menu_select_sounds.ogg")
-            if os.path.exists(sp):
-                self.menu_sound = pygame.mixer.Sound(sp)
+            if resources.exists(sp):
+                self.menu_sound = soundbank.get(sp)
         except Exception:
             self.menu_sound = None
 
@@ -91,9 +92,10 @@ class InitMenu:
         self.bg_music_playing = False
         try:
             mp = os.path.join("nanmon", "assets", "sounds", "init_menu_background_sounds.wav")
-            if os.path.exists(mp):
-                pygame.mixer.music.load(mp)
-                pygame.mixer.music.play(-1)
+            if resources.exists(mp):
+                with trace.span("music.load", "mixer", path=mp):
+                    pygame.mixer.music.load(resources.source(mp), mp)
+                    pygame.mixer.music.play(-1)
                 self.bg_music_playing = True
         except Exception:
             self.bg_music_playing = False
@@ -112,6 +114,10 @@ class InitMenu:
         self._level_flash_t = 0.0
         self._level_flash_dur = 0.35
 
+        # Dirty-rect mode: draw() reports the animated parts here (set by loop)
+        self._dirty: DirtyTracker | None = None
+        self._dirty_state = None
+
     # ---------- Discovery ----------
     def _discover_hats(self):
         try:
@@ -119,7 +125,7 @@ class InitMenu:
                 items = list_all_hats()
             else:
                 unlocked = load_unlocked_hats()
-                items = [fn for fn in unlocked if isinstance(fn, str) and os.path.exists(os.path.join(ASSET_HAT_DIR, fn))]
+                items = [fn for fn in unlocked if isinstance(fn, str) and resources.exists(os.path.join(ASSET_HAT_DIR, fn))]
             items.sort()
             return [None] + items
         except Exception:
@@ -269,16 +275,20 @@ class InitMenu:
         # Smaller title, moved down; subtle pulse only
         scale = 1.0 + 0.02 * math.sin(self.t * 2.6)
         title_text = "Salty / Sweet"
-        title_s = self.font_title.render(title_text, True, WHITE)
+        title_s = text.render(self.font_title, title_text, WHITE)
         tw, th = title_s.get_width(), title_s.get_height()
-        title_scaled = pygame.transform.smoothscale(title_s, (int(tw * scale), int(th * scale)))
+        title_scaled = xform.smoothscale(title_s, (int(tw * scale), int(th * scale)))
         tx = WIDTH // 2 - title_scaled.get_width() // 2
         ty = HEIGHT // 2 - 60  # moved down
-        surface.blit(title_scaled, (tx, ty))
+        drawn = surface.blit(title_scaled, (tx, ty))
+        if self._dirty is not None:
+            self._dirty.track("title", drawn)
 
         # Minimal hint with mobile support
-        hint_s = self.font_hint.render("Arrows/WASD/Swipe to navigate • SPACE/Touch start", True, WHITE)
-        surface.blit(hint_s, (WIDTH//2 - hint_s.get_width()//2, ty + title_scaled.get_height() + 6))
+        hint_s = text.render(self.font_hint, "Arrows/WASD/Swipe to navigate • SPACE/Touch start", WHITE)
+        drawn = surface.blit(hint_s, (WIDTH//2 - hint_s.get_width()//2, ty + title_scaled.get_height() + 6))
+        if self._dirty is not None:
+            self._dirty.track("hint", drawn)  # follows the title's height
 
         # Selector rows
         y0 = HEIGHT//2 - 6 + 36  # slightly lower than title
@@ -291,23 +301,26 @@ class InitMenu:
     def _draw_selector_row(self, surface: pygame.Surface, label: str, value: str, y: int, active: bool):
         color = (255, 255, 0) if active else WHITE
         pulse = 1.0 + (0.035 * math.sin(self.t * 6.0)) if active else 1.0
-        label_s = self.font_label.render(f"{label}:", True, color)
-        value_s = self.font_label.render(value, True, color)
+        label_s = text.render(self.font_label, f"{label}:", color)
+        value_s = text.render(self.font_label, value, color)
         if pulse != 1.0:
-            label_s = pygame.transform.smoothscale(label_s, (int(label_s.get_width()*pulse), int(label_s.get_height()*pulse)))
-            value_s = pygame.transform.smoothscale(value_s, (int(value_s.get_width()*pulse), int(value_s.get_height()*pulse)))
+            label_s = xform.smoothscale(label_s, (int(label_s.get_width()*pulse), int(label_s.get_height()*pulse)))
+            value_s = xform.smoothscale(value_s, (int(value_s.get_width()*pulse), int(value_s.get_height()*pulse)))
         x_center = WIDTH // 2
         gap = 10
         x = x_center - (label_s.get_width() + gap + value_s.get_width()) // 2
-        surface.blit(label_s, (x, y))
-        surface.blit(value_s, (x + label_s.get_width() + gap, y))
+        drawn = surface.blit(label_s, (x, y))
+        drawn.union_ip(surface.blit(value_s, (x + label_s.get_width() + gap, y)))
 
         if active:
             wig = int(2 * math.sin(self.t * 8.0))
-            left = self.font_label.render("<", True, color)
-            right = self.font_label.render(">", True, color)
-            surface.blit(left, (x - 24 + wig, y))
-            surface.blit(right, (x + label_s.get_width() + gap + value_s.get_width() + 8 - wig, y))
+            left = text.render(self.font_label, "<", color)
+            right = text.render(self.font_label, ">", color)
+            drawn.union_ip(surface.blit(left, (x - 24 + wig, y)))
+            drawn.union_ip(surface.blit(right, (x + label_s.get_width() + gap + value_s.get_width() + 8 - wig, y)))
+        if self._dirty is not None and active:
+            # inactive rows are static; a focus change repaints everything
+            self._dirty.track(label, drawn)
 
     def _draw_preview(self, surface: pygame.Surface):
         # Compute a working region but don't draw any background/card.
@@ -327,8 +340,8 @@ class InitMenu:
 
             # Label (small shadow for legibility over any bg)
             lab_text = f"Level {self.selected_level}"
-            lab = self.font_hint.render(lab_text, True, (240, 240, 240))
-            lab_sh = self.font_hint.render(lab_text, True, (0, 0, 0))
+            lab = text.render(self.font_hint, lab_text, (240, 240, 240))
+            lab_sh = text.render(self.font_hint, lab_text, (0, 0, 0))
             lx = tile.centerx - lab.get_width() // 2
             ly = tile.bottom + 6
             surface.blit(lab_sh, (lx + 1, ly + 1))
@@ -345,24 +358,41 @@ class InitMenu:
             pos = (area.centerx, area.centery + 10)
             self.preview_mouth.rect.center = pos
             try:
-                self.preview_mouth.draw_scaled(surface, pos, scale=2.25)
+                drawn = self.preview_mouth.draw_scaled(surface, pos, scale=2.25)
             except Exception:
                 self.preview_mouth.draw(surface)
+                drawn = area
+            if self._dirty is not None:
+                self._dirty.track("preview", drawn)
 
 
     # ---------- Main loop ----------
-    def loop(self, screen_or_dm, clock: pygame.time.Clock, input_manager=None):
+    @trace.traced("InitMenu.loop", "screen")
+    def loop(self, screen_or_dm, clock: pygame.time.Clock, input_manager=None, on_start=None):
+        """Run the menu; `on_start(level, hat)` is called once as the closing wipe begins."""
         try:
             pygame.mixer.stop()
         except Exception:
             pass
+        use_dirty = bool(getattr(screen_or_dm, "dirty_rects", False))
+        self._dirty = DirtyTracker() if use_dirty else None
         while self.running:
             dt = clock.tick(FPS) / 1000.0
             for event in pygame.event.get():
                 self.handle_event(event, input_manager)
             self.update(dt)
+            if self._fade_out and on_start is not None:
+                on_start(self.selected_level, self.selected_hat)
+                on_start = None
 
             if hasattr(screen_or_dm, "get_logical_surface") and hasattr(screen_or_dm, "present"):
+                dirty = self._dirty
+                if dirty is not None:
+                    # Background frame, focus or a selection changed: whole screen
+                    state = (self.index, self.focus, self.selected_level, self.hat_index)
+                    if state != self._dirty_state:
+                        self._dirty_state = state
+                        dirty.mark_full()
                 frame = screen_or_dm.get_logical_surface()
                 frame.fill(BG_COLOR)
                 self.draw(frame)
@@ -372,9 +402,14 @@ class InitMenu:
                     wipe_w = int(WIDTH * t)
                     if wipe_w > 0:
                         pygame.draw.rect(frame, (0, 0, 0), pygame.Rect(0, 0, wipe_w, HEIGHT))
+                        if dirty is not None:
+                            dirty.mark((0, 0, wipe_w, HEIGHT))
                     if t >= 1.0:
                         self.running = False
-                screen_or_dm.present()
+                if dirty is not None:
+                    screen_or_dm.present(dirty.take())
+                else:
+                    screen_or_dm.present()
             else:
                 screen = screen_or_dm
                 self.draw(screen)
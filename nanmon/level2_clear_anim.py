@@ -2,12 +2,27 @@
 from __future__ import annotations
 import os, math, pygame
 from .constants import WIDTH, HEIGHT
+from . import assets, resources, soundbank, trace, xform
+from . import text as _text
+
+_BG_DIR = os.path.join("nanmon", "assets", "bg")
+_SND_DIR = os.path.join("nanmon", "assets", "sounds")
+TAIWAN_IMG = os.path.join(_BG_DIR, "TAIWAN.png")
+FIRE_IMG = os.path.join(_BG_DIR, "FIRE.png")
+LEVEL_CLEAR_SND = os.path.join(_SND_DIR, "level_clear_sounds.wav")
+WIND_SND = os.path.join(_SND_DIR, "wind_sounds.wav")
+FIREBALL_SND = os.path.join(_SND_DIR, "fireball_sounds.wav")
+
+
+def preload_assets() -> list[assets.Asset]:
+    imgs = [assets.Asset(p, scope=assets.LEVEL) for p in (TAIWAN_IMG, FIRE_IMG)]
+    return imgs + [assets.Asset(p, scope=assets.LEVEL, sound=True) for p in (LEVEL_CLEAR_SND, WIND_SND, FIREBALL_SND)]
 
 # ===== Helpers =====
 def _load_img(path: str, fallback_color=(255, 0, 255, 180)) -> pygame.Surface:
     try:
-        if path and os.path.exists(path):
-            return pygame.image.load(path).convert_alpha()
+        if path and resources.exists(path):
+            return assets.image(path, scope=assets.LEVEL)
     except Exception:
         pass
     s = pygame.Surface((64, 64), pygame.SRCALPHA)
@@ -28,10 +43,10 @@ def _blit_center(surface: pygame.Surface, img: pygame.Surface, center: tuple[int
     surface.blit(img, img.get_rect(center=center))
 
 def _draw_text(surface: pygame.Surface, font: pygame.font.Font, text: str, line: int = 0):
-    txt = font.render(text, True, (255, 255, 255))
+    txt = _text.render(font, text, (255, 255, 255))
     x = WIDTH // 2 - txt.get_width() // 2
     y = int(HEIGHT * 0.08) + line * (txt.get_height() + 8)
-    shadow = font.render(text, True, (50, 50, 50))
+    shadow = _text.render(font, text, (50, 50, 50))
     surface.blit(shadow, (x + 2, y + 2))
     surface.blit(txt, (x, y))
 
@@ -46,6 +61,7 @@ def rotate_about_anchor(img: pygame.Surface, angle_deg: float, anchor_offset: tu
     return rot_img, (anchor_rot_x, anchor_rot_y)
 
 # ===== Main =====
+@trace.traced("level2_clear_anim", "anim")
 def draw_level2_clear_anim(surface: pygame.Surface, state: dict) -> bool:
     """Level 2 Clear 動畫（含音效邏輯）：
        Phase 1: Taiwan 放大淡入 2s (無文字)
@@ -59,8 +75,8 @@ def draw_level2_clear_anim(surface: pygame.Surface, state: dict) -> bool:
         state["dt"] = state.get("dt", 1/60)
 
         # 圖片路徑（bg）
-        state["taiwan_img"]  = _load_img(os.path.join("nanmon", "assets", "bg", "TAIWAN.png"))
-        state["fire_img"]    = _load_img(os.path.join("nanmon", "assets", "bg", "FIRE.png"))
+        state["taiwan_img"]  = _load_img(TAIWAN_IMG)
+        state["fire_img"]    = _load_img(FIRE_IMG)
 
         # 時長
         state["dur_grow"] = 2.0
@@ -83,7 +99,7 @@ def draw_level2_clear_anim(surface: pygame.Surface, state: dict) -> bool:
         # 字型：Pixel Emulator
         pixel_font_path = os.path.join("nanmon", "assets", "Pixel Emulator.otf")
         try:
-            state["font"] = pygame.font.Font(pixel_font_path, 28)
+            state["font"] = _text.font(28, pixel_font_path)
         except Exception:
             state["font"] = pygame.font.SysFont("arial", 24)
 
@@ -97,15 +113,14 @@ def draw_level2_clear_anim(surface: pygame.Surface, state: dict) -> bool:
         def _load_snd(p):
             try:
                 _safe_init_mixer()
-                if os.path.exists(p):
-                    return pygame.mixer.Sound(p)
+                if resources.exists(p):
+                    return soundbank.get(p, scope=assets.LEVEL)
             except Exception:
                 pass
             return None
-        snd_base = os.path.join("nanmon", "assets", "sounds")
-        state["snd_level_clear"] = _load_snd(os.path.join(snd_base, "level_clear_sounds.wav"))
-        state["snd_wind"]        = _load_snd(os.path.join(snd_base, "wind_sounds.wav"))
-        state["snd_fireball"]    = _load_snd(os.path.join(snd_base, "fireball_sounds.wav"))
+        state["snd_level_clear"] = _load_snd(LEVEL_CLEAR_SND)
+        state["snd_wind"]        = _load_snd(WIND_SND)
+        state["snd_fireball"]    = _load_snd(FIREBALL_SND)
         state["wind_playing"]    = False
         state["fireball_played"] = False
 
@@ -148,7 +163,7 @@ def draw_level2_clear_anim(surface: pygame.Surface, state: dict) -> bool:
         # 背景：Taiwan 以 0.7× cover 固定顯示（全彩、不透明）
         s = state["taiwan_scale_end"]
         w0, h0 = state["taiwan_img"].get_width(), state["taiwan_img"].get_height()
-        _blit_center(surface, pygame.transform.scale(state["taiwan_img"], (int(w0*s), int(h0*s))),
+        _blit_center(surface, xform.scale(state["taiwan_img"], (int(w0*s), int(h0*s))),
                      (WIDTH//2, HEIGHT//2))
 
         # 火球狀態
@@ -217,7 +232,7 @@ def draw_level2_clear_anim(surface: pygame.Surface, state: dict) -> bool:
     else:
         s = state["taiwan_scale_end"]
         w0, h0 = state["taiwan_img"].get_width(), state["taiwan_img"].get_height()
-        _blit_center(surface, pygame.transform.scale(state["taiwan_img"], (int(w0*s), int(h0*s))),
+        _blit_center(surface, xform.scale(state["taiwan_img"], (int(w0*s), int(h0*s))),
                      (WIDTH//2, HEIGHT//2))
         _draw_text(surface, state["font"], "We have arrived in Taiwan!", line=0)
         _draw_text(surface, state["font"], "Press space to continue.", line=1)
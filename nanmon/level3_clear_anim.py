@@ -1,45 +1,41 @@
 from __future__ import annotations
 import os
 import math
-import random
 import pygame
 from .constants import WIDTH, HEIGHT
+from .particles import Particles, ParticleStyle, SQUARE
+from .rng import stream
+from . import assets, resources, soundbank, trace
+
+_rng = stream("clear_fx")
+
+_BG_DIR = os.path.join("nanmon", "assets", "bg")
+_CHAR_DIR = os.path.join("nanmon", "assets", "char")
+_SND_DIR = os.path.join("nanmon", "assets", "sounds")
+SCHOOL_IMG = os.path.join(_BG_DIR, "SCHOOL.png")
+MOUTH_STANDING_IMG = os.path.join(_BG_DIR, "MOUTH_STANDING.png")
+BLUE_OPEN_IMG = os.path.join(_CHAR_DIR, "head_blue_left.png")
+# Optional SFX: first file that exists wins
+LAND_SNDS = ("thump.wav", "land.wav", "hit_wood.wav", "thud.wav")
+ENTER_SNDS = ("whoosh.wav", "pop.wav", "door.wav", "enter.wav")
+
+
+def preload_assets() -> list[assets.Asset]:
+    imgs = [assets.Asset(p, scope=assets.LEVEL) for p in (SCHOOL_IMG, MOUTH_STANDING_IMG, BLUE_OPEN_IMG)]
+    return imgs + [assets.Asset(os.path.join(_SND_DIR, f), scope=assets.LEVEL, sound=True)
+                   for f in LAND_SNDS + ENTER_SNDS]
 
 # ----------------------------- Helpers & Particles -----------------------------
 
-class _Particle:
-    __slots__ = ("x", "y", "vx", "vy", "life", "color", "size", "kind")
-    def __init__(self, x, y, vx, vy, life, color, size, kind="dust"):
-        self.x, self.y = float(x), float(y)
-        self.vx, self.vy = float(vx), float(vy)
-        self.life = float(life)
-        self.color = color
-        self.size = int(size)
-        self.kind = kind
-
-    def update(self, dt: float):
-        self.life = max(0.0, self.life - dt)
-        if self.kind == "dust":
-            self.vx *= 0.98
-            self.vy += 850.0 * dt
-        elif self.kind == "confetti":
-            self.vy += 400.0 * dt
-            self.vx += math.sin(self.y * 0.05) * 12.0 * dt
-        elif self.kind == "spark":
-            self.vx *= 0.99
-            self.vy *= 0.99
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-
-    @property
-    def alive(self):
-        return self.life > 0.0
+# Ground dust kicked up by landings, and the little sparks at the doorway
+DUST_STYLE = ParticleStyle(gravity=850.0, drag_x=0.98, fade=0.7)
+SPARK_STYLE = ParticleStyle(shape=SQUARE, drag_x=0.99, drag_y=0.99, fade=0.6)
 
 
 def _load_img(path: str, fallback_size=(64, 64), color=(200, 60, 200, 200)) -> pygame.Surface:
     try:
-        if path and os.path.exists(path):
-            return pygame.image.load(path).convert_alpha()
+        if path and resources.exists(path):
+            return assets.image(path, scope=assets.LEVEL)
     except Exception:
         pass
     s = pygame.Surface(fallback_size, pygame.SRCALPHA)
@@ -67,6 +63,7 @@ def _draw_circle_alpha(surf: pygame.Surface, color, center, radius: int, alpha:
     surf.blit(tmp, (center[0] - radius - 1, center[1] - radius - 1))
 
 
+@trace.traced("level3_clear_anim", "anim")
 def draw_level3_clear_anim(surface: pygame.Surface, state: dict) -> bool:
     """
     Level 3 clear animation (fixed):
@@ -84,10 +81,7 @@ def draw_level3_clear_anim(surface: pygame.Surface, state: dict) -> bool:
         state["phase"] = 1
 
         # Load assets
-        bg_dir = os.path.join("nanmon", "assets", "bg")
-        char_dir = os.path.join("nanmon", "assets", "char")
-
-        school_img = _load_img(os.path.join(bg_dir, "SCHOOL.png"), (360, 240))
+        school_img = _load_img(SCHOOL_IMG, (360, 240))
         scale = _fit_scale_cover(school_img, int(WIDTH * 0.7), int(HEIGHT * 0.55))
         if scale != 1.0:
             school_img = pygame.transform.smoothscale(
@@ -97,19 +91,23 @@ def draw_level3_clear_anim(surface: pygame.Surface, state: dict) -> bool:
         state["school_img"] = school_img
 
         # Standing mouth (quarter size)
-        mouth_standing_full = _load_img(os.path.join(bg_dir, "MOUTH_STANDING.png"), (160, 160), (70, 180, 255, 220))
+        mouth_standing_full = _load_img(MOUTH_STANDING_IMG, (160, 160), (70, 180, 255, 220))
         mw, mh = mouth_standing_full.get_width(), mouth_standing_full.get_height()
         mouth_standing = pygame.transform.smoothscale(mouth_standing_full, (max(1, mw // 4), max(1, mh // 4)))
         state["mouth_img"] = mouth_standing
 
         # Blue-open (start of crossfade)
-        blue_open = _load_img(os.path.join(char_dir, "head_blue_left.png"), (120, 120), (120, 200, 255, 220))
+        blue_open = _load_img(BLUE_OPEN_IMG, (120, 120), (120, 200, 255, 220))
         bw, bh = blue_open.get_width(), blue_open.get_height()
         state["blue_open_img"] = pygame.transform.smoothscale(blue_open, (max(1, bw // 4), max(1, bh // 4)))
 
         # Ground reference
         state["ground_y"] = int(HEIGHT - 78)  # top-left y where the mouth stands on ground
         state["occlusion_y"] = state["ground_y"] - 2  # doorway line to hide the sprite on enter
+        # Faint ground line, blended over the scene (the frame itself is opaque)
+        line = pygame.Surface((WIDTH, 1), pygame.SRCALPHA)
+        line.fill((255, 255, 255, 80))
+        state["ground_line"] = line
 
         # School physics
         sch = state["school_img"]
@@ -135,7 +133,8 @@ def draw_level3_clear_anim(surface: pygame.Surface, state: dict) -> bool:
         state["enter_gravity"] = 1700.0
 
         # FX
-        state["particles"] = []
+        state["dust"] = Particles(DUST_STYLE)
+        state["sparks"] = Particles(SPARK_STYLE)
         state["light_pulse_t"] = 0.0
         state["light_pulse_on"] = False
 
@@ -149,22 +148,21 @@ def draw_level3_clear_anim(surface: pygame.Surface, state: dict) -> bool:
         def _load_snd(path: str):
             try:
                 _safe_init_mixer()
-                if os.path.exists(path):
-                    return pygame.mixer.Sound(path)
+                if resources.exists(path):
+                    return soundbank.get(path, scope=assets.LEVEL)
             except Exception:
                 return None
             return None
 
-        sdir = os.path.join("nanmon", "assets", "sounds")
         land_snd = None
-        for candidate in ("thump.wav", "land.wav", "hit_wood.wav", "thud.wav"):
-            s = _load_snd(os.path.join(sdir, candidate))
+        for candidate in LAND_SNDS:
+            s = _load_snd(os.path.join(_SND_DIR, candidate))
             if s:
                 land_snd = s
                 break
         enter_snd = None
-        for candidate in ("whoosh.wav", "pop.wav", "door.wav", "enter.wav"):
-            s = _load_snd(os.path.join(sdir, candidate))
+        for candidate in ENTER_SNDS:
+            s = _load_snd(os.path.join(_SND_DIR, candidate))
             if s:
                 enter_snd = s
                 break
@@ -177,14 +175,13 @@ def draw_level3_clear_anim(surface: pygame.Surface, state: dict) -> bool:
     phase = int(state.get("phase", 1))
 
     # Update particles
-    particles: list[_Particle] = state["particles"]
-    for p in list(particles):
-        p.update(dt)
-        if not p.alive:
-            particles.remove(p)
+    dust: Particles = state["dust"]
+    sparks: Particles = state["sparks"]
+    dust.update(dt)
+    sparks.update(dt)
 
     # Ground line
-    pygame.draw.line(surface, (255, 255, 255, 80), (0, state["ground_y"]), (WIDTH, state["ground_y"]))
+    surface.blit(state["ground_line"], (0, state["ground_y"]))
 
     # ------------------------------ Phases -------------------------------------
 
@@ -202,29 +199,25 @@ def draw_level3_clear_anim(surface: pygame.Surface, state: dict) -> bool:
                     # Dust burst
                     left = rect.left + 16; right = rect.right - 16
                     for _ in range(12):
-                        x = random.uniform(left, right)
-                        vx = random.uniform(-240, 240)
-                        vy = random.uniform(-520, -240)
-                        size = random.randint(6, 11)
-                        life = random.uniform(0.35, 0.7)
-                        particles.append(_Particle(x, state["ground_y"] - 6, vx, vy, life, (210, 200, 190, 200), size, "dust"))
+                        x = _rng.uniform(left, right)
+                        vx = _rng.uniform(-240, 240)
+                        vy = _rng.uniform(-520, -240)
+                        size = _rng.randint(6, 11)
+                        life = _rng.uniform(0.35, 0.7)
+                        dust.emit(x, state["ground_y"] - 6, vx, vy, life, size, (210, 200, 190))
                 else:
                     state["settled"] = True
                     for _ in range(8):
-                        x = random.uniform(rect.left + 18, rect.right - 18)
-                        vx = random.uniform(-120, 120)
-                        vy = random.uniform(-260, -140)
-                        size = random.randint(5, 9)
-                        life = random.uniform(0.35, 0.6)
-                        particles.append(_Particle(x, state["ground_y"] - 6, vx, vy, life, (220, 210, 200, 200), size, "dust"))
+                        x = _rng.uniform(rect.left + 18, rect.right - 18)
+                        vx = _rng.uniform(-120, 120)
+                        vy = _rng.uniform(-260, -140)
+                        size = _rng.randint(5, 9)
+                        life = _rng.uniform(0.35, 0.6)
+                        dust.emit(x, state["ground_y"] - 6, vx, vy, life, size, (220, 210, 200))
 
         surface.blit(state["school_img"], rect)
 
-        for p in particles:
-            if p.kind == "dust":
-                alpha = max(0, min(255, int(255 * min(1.0, p.life / 0.7))))
-                c = (*p.color[:3], alpha)
-                pygame.draw.circle(surface, c, (int(p.x), int(p.y)), max(1, p.size))
+        dust.draw(surface)
 
         if state["settled"] and state["timer"] >= 0.50:
             state["phase"] = 2
@@ -266,12 +259,12 @@ def draw_level3_clear_anim(surface: pygame.Surface, state: dict) -> bool:
             door_left = state["school_rect"].centerx - mimg.get_width() // 2
             door_right = state["school_rect"].centerx + mimg.get_width() // 2
             for _ in range(10):
-                x = random.uniform(door_left, door_right)
-                vx = random.uniform(-180, 180)
-                vy = random.uniform(-380, -180)
-                size = random.randint(4, 8)
-                life = random.uniform(0.3, 0.6)
-                particles.append(_Particle(x, state["ground_y"] - 6, vx, vy, life, (220, 210, 200, 200), size, "dust"))
+                x = _rng.uniform(door_left, door_right)
+                vx = _rng.uniform(-180, 180)
+                vy = _rng.uniform(-380, -180)
+                size = _rng.randint(4, 8)
+                life = _rng.uniform(0.3, 0.6)
+                dust.emit(x, state["ground_y"] - 6, vx, vy, life, size, (220, 210, 200))
             s = state.get("land_snd")
             if s:
                 try: s.play()
@@ -333,28 +326,21 @@ def draw_level3_clear_anim(surface: pygame.Surface, state: dict) -> bool:
             center_x = state["school_rect"].centerx
             base_y = state["ground_y"] - 6
             for _ in range(12):
-                ang = random.uniform(-math.pi, 0.0)
-                spd = random.uniform(220, 420)
+                ang = _rng.uniform(-math.pi, 0.0)
+                spd = _rng.uniform(220, 420)
                 vx = math.cos(ang) * spd
                 vy = math.sin(ang) * spd
-                color = random.choice([(255, 240, 120, 240), (160, 240, 255, 240), (255, 140, 220, 240)])
-                particles.append(_Particle(center_x, base_y, vx, vy, random.uniform(0.25, 0.45), color, random.randint(3, 5), "spark"))
+                color = _rng.choice([(255, 240, 120), (160, 240, 255), (255, 140, 220)])
+                life = _rng.uniform(0.25, 0.45)
+                sparks.emit(center_x, base_y, vx, vy, life, _rng.randint(3, 5), color)
             state["phase"] = 5
             state["timer"] = 0.0
 
     # Phase 5: Hold static scene briefly, then done
     else:
         surface.blit(state["school_img"], state["school_rect"])
-        for p in particles:
-            if p.kind == "dust":
-                alpha = max(0, min(255, int(255 * min(1.0, p.life / 0.7))))
-                c = (*p.color[:3], alpha)
-                pygame.draw.circle(surface, c, (int(p.x), int(p.y)), max(1, p.size))
-            else:
-                alpha = max(0, min(255, int(255 * min(1.0, p.life / 0.6))))
-                sfc = pygame.Surface((p.size, p.size), pygame.SRCALPHA)
-                sfc.fill((*p.color[:3], alpha))
-                surface.blit(sfc, (int(p.x), int(p.y)))
+        dust.draw(surface)
+        sparks.draw(surface)
         if state["timer"] >= 0.45:
             return True
 
@@ -1,6 +1,5 @@
 from __future__ import annotations
 import os
-import random
 import pygame
 from typing import Tuple
 from .effects import Smoke
@@ -19,10 +18,70 @@ from .constants import (
     MOUTH_BITE_DURATION,
     ASSET_HAT_DIR,
 )
+from .rng import stream
+from . import assets, xform
+
+_fx_rng = stream("mouth_fx")  # cosmetic jitter only, never gameplay
 
 HAT_SCALE = 1.509  # 1.0 = same as mouth; tweak to taste (slightly bigger)
 
+BITE_SCALE = 1.22
+BITE_STATES = ("OPEN", "BITE1", "BITE2", "BITE3")
+# Additive tints (BLEND_RGB_ADD); flash only shows on the open mouth
+FLASH_TINTS = {True: (180, 255, 180, 90), False: (255, 120, 120, 105)}
+COLD_TINT = (120, 180, 255, 140)
+DYING_TINT = (255, 60, 60, 120)
+
+_HEAD_DIR = os.path.join("nanmon", "assets", "char")
+# (mode, facing, bite state) -> head sprite; RIGHT is the LEFT art mirrored
+_HEAD_FILES = {
+    ("SALTY", "LEFT",  "OPEN"): "head_blue_left.png",
+    ("SALTY", "LEFT",  "BITE1"): "head_blue_left_bite_1.png",
+    ("SALTY", "LEFT",  "BITE2"): "head_blue_left_bite_2.png",
+    ("SALTY", "LEFT",  "BITE3"): "head_blue_left_bite_3.png",
+    ("SALTY", "RIGHT", "OPEN"): "head_blue_left.png",
+    ("SALTY", "RIGHT", "BITE1"): "head_blue_left_bite_1.png",
+    ("SALTY", "RIGHT", "BITE2"): "head_blue_left_bite_2.png",
+    ("SALTY", "RIGHT", "BITE3"): "head_blue_left_bite_3.png",
+    ("SWEET", "LEFT",  "OPEN"): "head_pink_left.png",
+    ("SWEET", "LEFT",  "BITE1"): "head_pink_left_bite_1.png",
+    ("SWEET", "LEFT",  "BITE2"): "head_pink_left_bite_2.png",
+    ("SWEET", "LEFT",  "BITE3"): "head_pink_left_bite_3.png",
+    ("SWEET", "RIGHT", "OPEN"): "head_pink_left.png",
+    ("SWEET", "RIGHT", "BITE1"): "head_pink_left_bite_1.png",
+    ("SWEET", "RIGHT", "BITE2"): "head_pink_left_bite_2.png",
+    ("SWEET", "RIGHT", "BITE3"): "head_pink_left_bite_3.png",
+}
+
+
+def _hat_size() -> tuple[int, int]:
+    bw, bh = MOUTH_SIZE
+    return max(1, int(round(bw * HAT_SCALE))), max(1, int(round(bh * HAT_SCALE)))
+
+
+def preload_assets(hat: str | None = None) -> list[assets.Asset]:
+    """Head sprites, plus the hat if one is worn."""
+    out = [assets.Asset(os.path.join(_HEAD_DIR, f), MOUTH_SIZE) for f in dict.fromkeys(_HEAD_FILES.values())]
+    if hat:
+        out.append(assets.Asset(os.path.join(ASSET_HAT_DIR, hat), _hat_size()))
+    return out
+
+
+def _tinted(img: pygame.Surface, rgba) -> pygame.Surface:
+    out = img.copy()
+    overlay = pygame.Surface(out.get_size(), pygame.SRCALPHA)
+    overlay.fill(rgba)
+    out.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+    return out
+
+
 class Mouth(pygame.sprite.Sprite):
+    # Every look the player sprite can have, rendered once and shared by all
+    # mouths: (mode, facing, bite_state, flash good/bad/None, cold) -> surface.
+    # _dying_variants holds the red tint drawn over each one while dying.
+    _variants: dict | None = None
+    _dying_variants: dict | None = None
+
     def __init__(self, pos: Tuple[int, int]):
         super().__init__()
         # Facing offsets for hats
@@ -34,9 +93,15 @@ class Mouth(pygame.sprite.Sprite):
         # Basic state
         self.mode = "SALTY"  # SALTY -> blue sprites, SWEET -> pink sprites
         self.facing = "RIGHT"  # LEFT/RIGHT
-        self._sprites = self._load_sprites()
-        self.image = self._sprites[("SALTY", "RIGHT", "OPEN")].copy()
+        if Mouth._variants is None:
+            Mouth._variants, Mouth._dying_variants = self._build_variants(self._load_sprites())
+        self._variant_key = ("SALTY", "RIGHT", "OPEN", None, False)
+        self.image = self._variants[self._variant_key]
         self.rect = self.image.get_rect(center=pos)
+        # Bite jitter: image blit offset and the raw random shake behind it
+        self._bite_offset = (0, 0)
+        self._bite_area = None
+        self._bite_jitter = 0
         self.flash_timer = 0.0
         self.bite_timer = 0.0
         self.bite_total = MOUTH_BITE_DURATION
@@ -49,7 +114,7 @@ class Mouth(pygame.sprite.Sprite):
         self.dying = False
         self.death_timer = 0.0
         self._smoke_cd = 0.0
-        self._smoke: list[Smoke] = []
+        self._smoke = Smoke()
         self.stagger_timer = 0.0
 
         # Status effects
@@ -74,41 +139,43 @@ class Mouth(pygame.sprite.Sprite):
 
     # --- sprite loading ---
     def _load_sprites(self):
-        base = os.path.join("nanmon", "assets", "char")
-        mapping = {
-            ("SALTY", "LEFT",  "OPEN"): "head_blue_left.png",
-            ("SALTY", "LEFT",  "BITE1"): "head_blue_left_bite_1.png",
-            ("SALTY", "LEFT",  "BITE2"): "head_blue_left_bite_2.png",
-            ("SALTY", "LEFT",  "BITE3"): "head_blue_left_bite_3.png",
-            ("SALTY", "RIGHT", "OPEN"): "head_blue_left.png",
-            ("SALTY", "RIGHT", "BITE1"): "head_blue_left_bite_1.png",
-            ("SALTY", "RIGHT", "BITE2"): "head_blue_left_bite_2.png",
-            ("SALTY", "RIGHT", "BITE3"): "head_blue_left_bite_3.png",
-            ("SWEET", "LEFT",  "OPEN"): "head_pink_left.png",
-            ("SWEET", "LEFT",  "BITE1"): "head_pink_left_bite_1.png",
-            ("SWEET", "LEFT",  "BITE2"): "head_pink_left_bite_2.png",
-            ("SWEET", "LEFT",  "BITE3"): "head_pink_left_bite_3.png",
-            ("SWEET", "RIGHT", "OPEN"): "head_pink_left.png",
-            ("SWEET", "RIGHT", "BITE1"): "head_pink_left_bite_1.png",
-            ("SWEET", "RIGHT", "BITE2"): "head_pink_left_bite_2.png",
-            ("SWEET", "RIGHT", "BITE3"): "head_pink_left_bite_3.png",
-        }
         sprites: dict[tuple[str, str, str], pygame.Surface] = {}
-        for key, fname in mapping.items():
-            path = os.path.join(base, fname)
+        for key, fname in _HEAD_FILES.items():
+            path = os.path.join(_HEAD_DIR, fname)
             try:
-                img = pygame.image.load(path).convert_alpha()
+                img = assets.image(path, MOUTH_SIZE)
             except Exception:
                 img = pygame.Surface(MOUTH_SIZE, pygame.SRCALPHA)
                 color = SALTY_COLOR if key[0] == "SALTY" else SWEET_COLOR
                 pygame.draw.circle(img, color, (MOUTH_SIZE[0]//2, MOUTH_SIZE[1]//2), min(MOUTH_SIZE)//2)
-            img = pygame.transform.scale(img, MOUTH_SIZE)
             if key[1] == "RIGHT":
                 img = pygame.transform.flip(img, True, False)
             sprites[key] = img
         return sprites
 
-    def update(self, dt: float, keys=None, input_manager=None):
+    @staticmethod
+    def _build_variants(sprites):
+        variants: dict = {}
+        dying: dict = {}
+        fallback = next(iter(sprites.values()))
+        for mode in ("SALTY", "SWEET"):
+            for facing in ("LEFT", "RIGHT"):
+                for bite_state in BITE_STATES:
+                    img = sprites.get((mode, facing, bite_state), fallback)
+                    if bite_state != "OPEN":
+                        w, h = img.get_width(), img.get_height()
+                        img = pygame.transform.scale(img, (int(w * BITE_SCALE), int(h * BITE_SCALE)))
+                    flashes = (None, True, False) if bite_state == "OPEN" else (None,)
+                    for good in flashes:
+                        flashed = _tinted(img, FLASH_TINTS[good]) if good is not None else img
+                        for cold in (False, True):
+                            v = _tinted(flashed, COLD_TINT) if cold else flashed
+                            key = (mode, facing, bite_state, good, cold)
+                            variants[key] = v
+                            dying[key] = _tinted(v, DYING_TINT)
+        return variants, dying
+
+    def update(self, dt: float, keys=None, input_manager=None, move: Tuple[float, float] | None = None):
         if self.dying:
             self.update_dying(dt)
             if self.flash_timer > 0:
@@ -131,8 +198,10 @@ class Mouth(pygame.sprite.Sprite):
         # Movement handling - support both keyboard and mobile input
         pos = pygame.Vector2(self.rect.center)
         
-        # Get movement input
-        if input_manager:
+        # Get movement input (a pre-sampled vector wins, e.g. from the fixed-step loop)
+        if move is not None:
+            move_x, move_y = move
+        elif input_manager:
             # Use new input manager for unified mobile/PC input
             move_x, move_y = input_manager.get_movement_input((pos.x, pos.y))
         else:
@@ -225,57 +294,38 @@ class Mouth(pygame.sprite.Sprite):
         else:
             bite_state = "OPEN"
 
-        key = (self.mode, self.facing, bite_state)
-        base_img = self._sprites.get(key)
-        if base_img is None:
-            base_img = next(iter(self._sprites.values()))
-        img = base_img.copy()
-
-        if bite_state.startswith("BITE"):
-            scale = 1.22
-            w, h = img.get_width(), img.get_height()
-            img = pygame.transform.scale(img, (int(w*scale), int(h*scale)))
-            jitter_y = random.randint(-12, 12)
-            pad = abs(jitter_y)
-            surf_h = img.get_height() + pad
-            img_jitter = pygame.Surface((img.get_width(), surf_h), pygame.SRCALPHA)
-            base_y = (surf_h - img.get_height()) // 2 + jitter_y
-            img_jitter.blit(img, (0, base_y))
-            img = img_jitter
-
-        # Flash overlay
+        if bite_state != "OPEN":
+            # Bite shake: a blit offset plus source area, giving the same
+            # pixels the old (|j|-padded, edge-clipping) jitter surface did
+            jitter_y = _fx_rng.randint(-12, 12)
+            w, h = self._variants[(self.mode, self.facing, bite_state, None, False)].get_size()
+            base_y = abs(jitter_y) // 2 + jitter_y
+            top = max(0, -base_y)
+            bottom = min(h, h + abs(jitter_y) - base_y)
+            self._bite_jitter = jitter_y
+            self._bite_offset = (0, base_y + top)
+            self._bite_area = (0, top, w, bottom - top)
+        else:
+            self._bite_jitter = 0
+            self._bite_offset = (0, 0)
+            self._bite_area = None
+
+        # Flash overlay (open mouth only); cold overlay always visible while cold
+        good = None
         if self.flash_timer > 0 and bite_state == "OPEN":
             good = getattr(self, "_flash_good", None)
-            if good is True:
-                tint = pygame.Color(180, 255, 180, 90)
-            elif good is False:
-                tint = pygame.Color(255, 120, 120, 105)
-            else:
-                tint = pygame.Color(255, 255, 255, 0)
-            if tint.a > 0:
-                overlay = pygame.Surface(img.get_size(), pygame.SRCALPHA)
-                overlay.fill((tint.r, tint.g, tint.b, tint.a))
-                img.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
-
-        # Cold status overlay (always visible while cold)
-        if self.cold_timer > 0.0:
-            overlay2 = pygame.Surface(img.get_size(), pygame.SRCALPHA)
-            overlay2.fill((120, 180, 255, 140))
-            img.blit(overlay2, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
-
-        self.image = img
+        key = (self.mode, self.facing, bite_state, good, self.cold_timer > 0.0)
+        self._variant_key = key
+        self.image = self._variants[key]
 
     def draw(self, surface: pygame.Surface):
-        for s in list(self._smoke):
-            s.draw(surface)
-            if not s.alive:
-                self._smoke.remove(s)
+        self._smoke.draw(surface)
 
-        draw_rect = self.rect.copy()
+        x, y = self.rect.topleft
         if self.dying:
             jitter = 6
-            draw_rect.x += random.randint(-jitter, jitter)
-            draw_rect.y += random.randint(-jitter, jitter)
+            x += _fx_rng.randint(-jitter, jitter)
+            y += _fx_rng.randint(-jitter, jitter)
 
 
         # Blink while invincible (about 10 Hz)
@@ -288,46 +338,58 @@ class Mouth(pygame.sprite.Sprite):
                 # Skip drawing the base sprite & hat this frame.
                 return
 
-        surface.blit(self.image, draw_rect)
+        bx, by = self._bite_offset
+        surface.blit(self.image, (x + bx, y + by), self._bite_area)
 
         if self.dying:
-            overlay = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-            overlay.fill((255, 60, 60, 120))
-            tinted = self.image.copy()
-            tinted.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
-            surface.blit(tinted, draw_rect)
+            surface.blit(self._dying_variants[self._variant_key], (x + bx, y + by), self._bite_area)
 
         # Hat
         hat_img = self._hat_img_right if self.facing == "RIGHT" else self._hat_img_left
         ox, oy = (self._hat_offset_right if self.facing == "RIGHT" else self._hat_offset_left)
-        jitter_y = random.randint(-12, 12) if self.bite_timer > 0 else 0
+        jitter_y = _fx_rng.randint(-12, 12) if self.bite_timer > 0 else 0
         if hat_img is not None:
-            hx = draw_rect.centerx + int(ox)
-            hy = draw_rect.centery + int(oy) + jitter_y
+            hx = x + self.rect.width // 2 + int(ox)
+            hy = y + self.rect.height // 2 + int(oy) + jitter_y
             surface.blit(hat_img, (hx, hy))
 
-    def draw_scaled(self, surface: pygame.Surface, center: Tuple[int, int], scale: float = 1.0):
-        base_img = self.image
-        bw, bh = base_img.get_size()
-        sw = max(1, int(bw * scale))
-        sh = max(1, int(bh * scale))
-        scaled_mouth = pygame.transform.scale(base_img, (sw, sh))
+    def _scaled_image(self, img: pygame.Surface, scale: float, jitter: int = 0) -> pygame.Surface:
+        """Scaled copy of a variant/hat surface, from the shared transform cache.
+
+        A bite `jitter` is baked into a padded surface first, as the large
+        mouth has always been drawn from one.
+        """
+        bw, bh = img.get_size()
+        if jitter:
+            bh += abs(jitter)
+        size = (max(1, int(bw * scale)), max(1, int(bh * scale)))
+        if not jitter:
+            return xform.scale(img, size)
+
+        def make():
+            src = pygame.Surface((bw, bh), pygame.SRCALPHA)
+            src.blit(img, (0, self._bite_offset[1] - self._bite_area[1]))
+            return pygame.transform.scale(src, size)
+
+        return xform.get(img, "bite", (jitter, size), make)
+
+    def draw_scaled(self, surface: pygame.Surface, center: Tuple[int, int], scale: float = 1.0) -> pygame.Rect:
+        """Draw mouth + hat scaled around `center`; returns the area touched."""
+        scaled_mouth = self._scaled_image(self.image, scale, self._bite_jitter)
         mouth_rect = scaled_mouth.get_rect(center=center)
-        surface.blit(scaled_mouth, mouth_rect)
+        drawn = surface.blit(scaled_mouth, mouth_rect)
 
         hat_img = self._hat_img_right if self.facing == "RIGHT" else self._hat_img_left
         if hat_img is not None:
-            hw, hh = hat_img.get_size()
-            hsw = max(1, int(hw * scale))
-            hsh = max(1, int(hh * scale))
-            scaled_hat = pygame.transform.scale(hat_img, (hsw, hsh))
+            scaled_hat = self._scaled_image(hat_img, scale)
             ox, oy = self._hat_offset_right if self.facing == "RIGHT" else self._hat_offset_left
             sox = int(ox * scale)
             soy = int(oy * scale)
-            jitter_y = random.randint(-12, 12) if self.bite_timer > 0 else 0
+            jitter_y = _fx_rng.randint(-12, 12) if self.bite_timer > 0 else 0
             hx = mouth_rect.centerx + sox
             hy = mouth_rect.centery + soy + jitter_y
-            surface.blit(scaled_hat, (hx, hy))
+            drawn.union_ip(surface.blit(scaled_hat, (hx, hy)))
+        return drawn
 
     def circle_hit(self, point: tuple[int, int], radius: int = 0) -> bool:
         cx, cy = self.rect.center
@@ -344,12 +406,9 @@ class Mouth(pygame.sprite.Sprite):
         self.death_timer -= dt
         self._smoke_cd -= dt
         if self._smoke_cd <= 0.0:
-            self._smoke.append(Smoke(self.rect.center))
+            self._smoke.puff(self.rect.center)
             self._smoke_cd = 0.07
-        for s in list(self._smoke):
-            s.update(dt)
-            if not s.alive:
-                self._smoke.remove(s)
+        self._smoke.update(dt)
 
     # --- Hats API ---
     def set_hat(self, hat_name: str | None):
@@ -367,11 +426,7 @@ class Mouth(pygame.sprite.Sprite):
 
         path = os.path.join(ASSET_HAT_DIR, hat_name)
         try:
-            img = pygame.image.load(path).convert_alpha()
-            bw, bh = MOUTH_SIZE
-            target_w = max(1, int(round(bw * HAT_SCALE)))
-            target_h = max(1, int(round(bh * HAT_SCALE)))
-            hat_base = pygame.transform.scale(img, (target_w, target_h))
+            hat_base = assets.image(path, _hat_size())
             self._hat_src_left = hat_base
             self._hat_src_right = pygame.transform.flip(hat_base, True, False)
             self._hat_img_left = self._hat_src_left
@@ -0,0 +1,102 @@
+"""Single-file asset pack: every file under ASSET_DIR in one mapped blob.
+
+    python -m nanmon.pack
+
+Layout: a 16-byte header (magic, version, index length), a JSON index
+{name: [offset, length, mtime_ns]} keyed by the files' root-relative paths
+("nanmon/assets/food/CAKE.png"), then the files back to back, each aligned
+to 16 bytes; offsets count from the first file. `Pack` maps it read-only
+and hands out zero-copy views, so nothing is unpacked to disk;
+nanmon.resources reads from it when the loose asset folder isn't there
+(the PyInstaller build ships only the pack, beside the executable).
+
+Run `python -m nanmon.bake` first if the pack should carry the baked pixels.
+"""
+from __future__ import annotations
+import json
+import mmap
+import os
+import struct
+import sys
+from .constants import ASSET_DIR, ASSET_PACK
+
+MAGIC = b"NMPK"
+VERSION = 1
+_HEADER = struct.Struct("<4sIQ")  # magic, version, index bytes
+_ALIGN = 16
+
+
+def _pad(n: int) -> int:
+    return -n % _ALIGN
+
+
+class Pack:
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n = _HEADER.unpack_from(self._mm)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a v{VERSION} asset pack")
+        start = _HEADER.size
+        self.files: dict[str, list[int]] = json.loads(self._mm[start:start + n])
+        self.path = path
+        self._base = start + n + _pad(start + n)
+        # what each folder holds, for exists()/listdir()
+        self.dirs: dict[str, set[str]] = {}
+        for name in self.files:
+            parent, _, leaf = name.rpartition("/")
+            while parent:
+                self.dirs.setdefault(parent, set()).add(leaf)
+                parent, _, leaf = parent.rpartition("/")
+
+    def view(self, name: str) -> memoryview:
+        """`name`'s bytes, straight out of the mapping (KeyError if absent)."""
+        off, length, _ = self.files[name]
+        off += self._base
+        return memoryview(self._mm)[off:off + length]
+
+    def stat(self, name: str) -> tuple[int, int]:
+        """(mtime_ns, size) of the file when it was packed."""
+        _, length, mtime_ns = self.files[name]
+        return mtime_ns, length
+
+
+def build(root: str, out: str) -> dict:
+    """Pack everything under root/ASSET_DIR into `out`; returns the index."""
+    names = []
+    for dirpath, dirnames, filenames in os.walk(os.path.join(root, ASSET_DIR)):
+        dirnames.sort()
+        for fn in sorted(filenames):
+            full = os.path.join(dirpath, fn)
+            rel = os.path.relpath(full, root)
+            names.append((rel.replace(os.sep, "/"), full))
+    index, off = {}, 0
+    for name, full in names:
+        st = os.stat(full)
+        index[name] = [off, st.st_size, st.st_mtime_ns]
+        off += st.st_size + _pad(st.st_size)
+    blob = json.dumps(index, separators=(",", ":")).encode()
+    tmp = out + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(blob)))
+        f.write(blob)
+        f.write(b"\0" * _pad(f.tell()))
+        for name, full in names:
+            with open(full, "rb") as src:
+                data = src.read()
+            f.write(data)
+            f.write(b"\0" * _pad(len(data)))
+    os.replace(tmp, out)  # never leave a half-written pack where the game looks
+    return index
+
+
+def main() -> int:
+    from .resources import ROOT
+    out = os.path.join(ROOT, ASSET_PACK)
+    index = build(ROOT, out)
+    print(f"packed {len(index)} files, {os.path.getsize(out) / (1024 * 1024):.1f} MB -> {ASSET_PACK}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""Batched particles shared by smoke, finish-screen confetti and clear FX.
+
+A `Particles` emitter keeps its particles as parallel columns instead of one
+object (and one throwaway Surface) each. `update()` advances and culls them
+in a single pass, and `draw()` blits them with one `Surface.blits` call from
+pre-rendered stamps. Stamps are cached per (shape, size, color, alpha
+bucket), so a steady effect stops allocating after its first few frames.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+import pygame
+
+CIRCLE = "circle"
+SQUARE = "square"
+
+ALPHA_STEP = 8  # stamp alpha is rounded to this many levels of 0..255
+_STAMP_LIMIT = 2048
+
+_stamps: dict[tuple, pygame.Surface] = {}
+_counts = {"stamps": 0}  # stamp surfaces made so far
+
+
+def stamp(shape: str, size: int, color: tuple[int, int, int], alpha: int) -> pygame.Surface:
+    """Cached sprite for one particle look.
+
+    Circles are (2r+2) square with the disc centred at (r+1, r+1); squares
+    are `size` wide and filled.
+    """
+    key = (shape, size, color, alpha)
+    s = _stamps.get(key)
+    if s is None:
+        if len(_stamps) >= _STAMP_LIMIT:
+            _stamps.clear()
+        if shape == CIRCLE:
+            s = pygame.Surface((size * 2 + 2, size * 2 + 2), pygame.SRCALPHA)
+            pygame.draw.circle(s, (*color, alpha), (size + 1, size + 1), size)
+        else:
+            s = pygame.Surface((size, size), pygame.SRCALPHA)
+            s.fill((*color, alpha))
+        _stamps[key] = s
+        _counts["stamps"] += 1
+    return s
+
+
+def stats() -> dict:
+    return {"cached": len(_stamps), **_counts}
+
+
+def _bucket(alpha: float) -> int:
+    a = int(alpha)
+    if a <= 0:
+        return 0
+    return min(255, (a + ALPHA_STEP // 2) // ALPHA_STEP * ALPHA_STEP)
+
+
+@dataclass(frozen=True)
+class ParticleStyle:
+    """How one kind of particle moves and fades.
+
+    Each step: velocity is scaled by drag, gravity is added to vy (before
+    or after moving, per `accel_first`), and position integrates. Alpha is
+    `alpha` times min(1, remaining life / fade), where fade defaults to the
+    full life (a linear fade). Circle radius grows to size * (1 + grow).
+    """
+    shape: str = CIRCLE
+    gravity: float = 0.0
+    drag_x: float = 1.0
+    drag_y: float = 1.0
+    accel_first: bool = True
+    alpha: float = 255.0
+    fade: float | None = None
+    grow: float = 0.0
+
+
+class Particles:
+    _COLUMNS = ("_x", "_y", "_vx", "_vy", "_age", "_life", "_size", "_color")
+
+    def __init__(self, style: ParticleStyle):
+        self.style = style
+        for name in self._COLUMNS:
+            setattr(self, name, [])
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    def __bool__(self) -> bool:
+        return bool(self._x)
+
+    def emit(self, x: float, y: float, vx: float, vy: float, life: float, size: int,
+             color: tuple[int, int, int]):
+        self._x.append(float(x))
+        self._y.append(float(y))
+        self._vx.append(float(vx))
+        self._vy.append(float(vy))
+        self._age.append(0.0)
+        self._life.append(float(life))
+        self._size.append(int(size))
+        self._color.append(tuple(color[:3]))
+
+    def clear(self):
+        for name in self._COLUMNS:
+            getattr(self, name).clear()
+
+    def update(self, dt: float):
+        """Advance every particle and drop the expired ones (order kept)."""
+        st = self.style
+        g = st.gravity * dt
+        dx, dy, first = st.drag_x, st.drag_y, st.accel_first
+        xs, ys, vxs, vys = self._x, self._y, self._vx, self._vy
+        ages, lives = self._age, self._life
+        sizes, colors = self._size, self._color
+        j = 0
+        for i in range(len(xs)):
+            age = ages[i] + dt
+            if age >= lives[i]:
+                continue
+            vx = vxs[i] * dx
+            vy = vys[i] * dy
+            if first:
+                vy += g
+                xs[j] = xs[i] + vx * dt
+                ys[j] = ys[i] + vy * dt
+            else:
+                xs[j] = xs[i] + vx * dt
+                ys[j] = ys[i] + vy * dt
+                vy += g
+            vxs[j], vys[j], ages[j] = vx, vy, age
+            lives[j], sizes[j], colors[j] = lives[i], sizes[i], colors[i]
+            j += 1
+        if j < len(xs):
+            for name in self._COLUMNS:
+                del getattr(self, name)[j:]
+
+    def draw(self, surface: pygame.Surface, offset: tuple[int, int] = (0, 0)):
+        if not self._x:
+            return
+        st = self.style
+        circle = st.shape == CIRCLE
+        ox, oy = offset
+        seq = []
+        for x, y, age, life, size, color in zip(self._x, self._y, self._age, self._life,
+                                                  self._size, self._color):
+            left = life - age
+            fade = st.fade or life
+            a = _bucket(st.alpha * (left / fade if left < fade else 1.0))
+            if a <= 0:
+                continue
+            if circle:
+                t = age / life
+                r = int(size * (1.0 + st.grow * t)) if st.grow else size
+                if r <= 0:
+                    continue
+                seq.append((stamp(CIRCLE, r, color, a), (int(x) - r - 1 + ox, int(y) - r - 1 + oy)))
+            else:
+                seq.append((stamp(SQUARE, max(1, size), color, a), (int(x) + ox, int(y) + oy)))
+        surface.blits(seq, doreturn=False)
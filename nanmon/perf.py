@@ -0,0 +1,178 @@
+"""Per-frame timing breakdown and the F3 performance overlay.
+
+The game loop and Simulation call `lap(section)` as they go; each call
+charges the time since the previous one to `section`, so the SECTIONS add
+up to the frame's work. `frame()` at the top of the loop closes the previous
+frame (its full begin-to-begin time, sleep included, plus the laps) and
+starts the next. While the overlay is off a lap is one flag test; while on
+it is a perf_counter() and a dict update, cheap enough for playtests.
+With nanmon.trace recording, frames and laps are also written there as
+spans, overlay or not, and with nanmon.hitch on, frames over its budget are
+handed to it with their split.
+
+`Overlay` draws the last HISTORY frames: frame and work time p50/p95/p99, a
+rolling bar graph against the FPS budget, the average split per section,
+and live counts (foods, projectiles, smoke puffs, surfaces made that frame).
+The text panel is redrawn every REFRESH seconds, not every frame.
+"""
+from __future__ import annotations
+import time
+from collections import deque
+import pygame
+from .constants import HEIGHT, FPS
+from . import assets, hitch, particles, text, trace, xform
+
+SECTIONS = ("events", "mouth", "foods", "boss", "collisions", "sim", "world", "hud", "present", "other")
+HISTORY = 240  # frames kept for percentiles and the graph
+REFRESH = 0.25  # seconds between panel redraws
+
+_on = False
+_start = 0.0  # this frame's frame() call
+_last = 0.0  # previous lap
+_laps = dict.fromkeys(SECTIONS, 0.0)
+_made = 0  # surface counter total at frame start
+# (frame ms, work ms, {section: ms}, surfaces made), oldest first
+_frames: deque[tuple[float, float, dict, int]] = deque(maxlen=HISTORY)
+
+
+def enabled() -> bool:
+    return _on
+
+
+def toggle() -> bool:
+    """Switch timing and the overlay on/off; returns the new state."""
+    global _on, _start
+    _on = not _on
+    _frames.clear()
+    _start = 0.0
+    return _on
+
+
+def _surfaces_made() -> int:
+    # New Surfaces come out of the shared caches; count their misses
+    return (xform.stats()["misses"] + text.stats()["renders"]
+            + particles.stats()["stamps"] + assets.counts()["loads"])
+
+
+def frame() -> None:
+    """File the previous frame and start timing this one."""
+    global _start, _last, _made
+    if not (_on or trace.on or hitch.on):
+        return
+    now = time.perf_counter()
+    if _start:
+        trace.complete("frame", _start, now, cat="frame")
+    if _on or hitch.on:
+        made = _surfaces_made()
+        if _start:
+            frame_ms = (now - _start) * 1000.0
+            if _on or frame_ms > hitch.budget_ms:
+                ms = {k: v * 1000.0 for k, v in _laps.items()}
+                if _on:
+                    _frames.append((frame_ms, sum(ms.values()), ms, made - _made))
+                if hitch.on and frame_ms > hitch.budget_ms:
+                    hitch.report(frame_ms, ms, made - _made)
+        for k in _laps:
+            _laps[k] = 0.0
+        _made = made
+    _start = _last = now
+
+
+def pause() -> None:
+    """Stop timing until the next frame() (the loop is being left)."""
+    global _start
+    _start = 0.0
+
+
+def lap(section: str) -> None:
+    """Charge the time since the last lap to `section`."""
+    global _last
+    if not (_on or trace.on or hitch.on) or not _start:
+        return  # (nothing to time against outside the game loop)
+    now = time.perf_counter()
+    if _on or hitch.on:
+        _laps[section] += now - _last
+    trace.complete(section, _last, now, cat="frame")
+    _last = now
+
+
+def history() -> list[tuple[float, float, dict, int]]:
+    """Filed frames, oldest first: (frame ms, work ms, {section: ms}, surfaces made)."""
+    return list(_frames)
+
+
+def percentiles(values, qs=(50, 95, 99)) -> list[float]:
+    s = sorted(values)
+    if not s:
+        return [0.0 for _ in qs]
+    return [s[min(len(s) - 1, int(len(s) * q / 100.0))] for q in qs]
+
+
+class Overlay:
+    """The F3 panel (only drawn while timing is on)."""
+    W = HISTORY + 12
+    GRAPH_H = 48
+
+    def __init__(self):
+        self.font = text.font(10)
+        # three header lines, graph, one line per section, two count lines
+        self.H = 14 + self.GRAPH_H + (len(SECTIONS) + 5) * self.font.get_linesize()
+        self._panel: pygame.Surface | None = None
+        self._age = REFRESH
+
+    def draw(self, surface: pygame.Surface, dt: float, counts: dict) -> None:
+        self._age += dt
+        if self._panel is None or self._age >= REFRESH:
+            self._panel = self._render(counts)
+            self._age = 0.0
+        surface.blit(self._panel, (6, HEIGHT - self.H - 6))
+
+    def _render(self, counts: dict) -> pygame.Surface:
+        panel = pygame.Surface((self.W, self.H), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        frames = list(_frames)
+        budget = 1000.0 / FPS
+        f = self.font
+        y = 4
+
+        def line(s: str, color=(255, 255, 255)):
+            nonlocal y
+            panel.blit(f.render(s, True, color), (6, y))
+            y += f.get_linesize()
+
+        frame_ms = [fr[0] for fr in frames]
+        work_ms = [fr[1] for fr in frames]
+        p50, p95, p99 = percentiles(frame_ms)
+        last = frames[-1] if frames else (0.0, 0.0, {}, 0)
+        line(f"frame {last[0]:5.1f} ms  work {last[1]:5.1f} ms")
+        line(f"p50 {p50:4.1f}  p95 {p95:4.1f}  p99 {p99:4.1f}",
+             (255, 120, 120) if p99 > budget * 1.5 else (255, 255, 255))
+        w50, w95, w99 = percentiles(work_ms)
+        line(f"work p50 {w50:4.1f}  p95 {w95:4.1f}  p99 {w99:4.1f}",
+             (255, 120, 120) if w99 > budget else (255, 255, 255))
+
+        # rolling graph: one bar per frame, work time solid over the frame time
+        gy, gh = y + 2, self.GRAPH_H
+        scale = gh / (budget * 2.0)
+        x0 = self.W - 6 - len(frames)
+        for i, (fm, wm, _, _) in enumerate(frames):
+            x = x0 + i
+            h = min(gh, int(fm * scale))
+            col = (220, 80, 80) if fm > budget * 1.5 else (90, 90, 90)
+            pygame.draw.line(panel, col, (x, gy + gh), (x, gy + gh - h))
+            h = min(gh, int(wm * scale))
+            pygame.draw.line(panel, (110, 200, 110), (x, gy + gh), (x, gy + gh - h))
+        pygame.draw.line(panel, (200, 200, 60), (6, gy + gh // 2), (self.W - 6, gy + gh // 2))  # budget
+        y = gy + gh + 4
+
+        # average split over the window
+        n = max(1, len(frames))
+        avg = {k: sum(fr[2].get(k, 0.0) for fr in frames) / n for k in SECTIONS}
+        for k in SECTIONS:
+            v = avg[k]
+            panel.fill((110, 160, 230), pygame.Rect(150, y + 3, min(self.W - 156, int(v * 20)), 5))
+            line(f"{k:<11}{v:5.2f}")
+        line(f"foods {counts.get('foods', 0)}  proj {counts.get('projectiles', 0)}  "
+             f"smoke {counts.get('smoke', 0)}")
+        line(f"new surfaces {last[3]}")
+        return panel
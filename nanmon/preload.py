@@ -0,0 +1,120 @@
+"""Decode a level's images and sounds before gameplay needs them.
+
+`level_manifest()` lists every registry request a level can make (player and
+foods, backdrop, boss, clear animation, sounds), most urgent first. A
+`Preloader` reads and decodes those files on worker threads and hands each
+result to the registry (`assets.expect`). `pump()` then converts and scales
+the finished ones on the main thread, a few per frame within a time budget.
+Anything requested before it has been pumped waits on its own decode rather
+than reading the file again, so once a level is under way no gameplay frame
+touches the disk. (Level music still streams through mixer.music, and
+long clips through nanmon.soundbank, straight from the mapped file.)
+"""
+from __future__ import annotations
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+import pygame
+from . import assets, resources, soundbank
+from . import food, mouth, earth_bg_anim, level2_clear_anim, level3_clear_anim
+from .background import ScrollingBackground
+from .boss import Boss, LEVEL_BOSSES
+from .constants import WIDTH, HEIGHT, SFX_MENU_SELECT, SFX_EAT, SFX_PAGE_TURN
+from .levels import LevelConfig
+
+# Level-clear animation per level (anything else uses the earth fly-in)
+_CLEAR_ANIMS = {2: level2_clear_anim, 3: level3_clear_anim}
+
+
+def startup_assets(cfg: LevelConfig, hat: str | None = None) -> list[assets.Asset]:
+    """What the first gameplay frame uses: player, backdrop, the level's own foods."""
+    kinds = list(dict.fromkeys(cfg.foods_light + cfg.foods_homing))
+    out = mouth.preload_assets(hat)
+    out += ScrollingBackground.preload_assets(cfg.bg_images, (WIDTH, HEIGHT))
+    out += food.preload_assets((cfg.food_scale,), kinds)
+    out += [assets.Asset(p, sound=True) for p in (SFX_EAT, SFX_MENU_SELECT, SFX_PAGE_TURN)]
+    return out
+
+
+def level_manifest(cfg: LevelConfig, hat: str | None = None) -> list[assets.Asset]:
+    """Everything the level can load, most urgent first, without repeats."""
+    out = startup_assets(cfg, hat)
+    # boss shots and HOTDOG halves spawn at scale 1.0
+    out += food.preload_assets(sorted({1.0, cfg.food_scale}))
+    out += LEVEL_BOSSES.get(cfg.level, Boss).preload_assets(cfg)
+    out += _CLEAR_ANIMS.get(cfg.level, earth_bg_anim).preload_assets()
+    return list(dict.fromkeys(out))
+
+
+class Preloader:
+    def __init__(self, manifest: list[assets.Asset], workers: int = 2):
+        mixer = pygame.mixer.get_init() is not None
+        # Files that don't exist are the callers' business (they check first);
+        # long clips stream from the file when played, so aren't decoded here
+        todo = [a for a in dict.fromkeys(manifest)
+                if not assets.cached(a) and (mixer or not a.sound) and resources.exists(a.path)
+                and not (a.sound and soundbank.streams(a.path))]
+        self._todo = deque(todo)
+        self.total = len(todo)
+        self._futures: dict[str, Future] = {}
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preload")
+        for a in todo:
+            # baked variants map their pixels on the main thread; no file to read
+            if a.path not in self._futures and not assets.baked(a):
+                fut = self._pool.submit(assets.decode, a)
+                self._futures[a.path] = fut
+                assets.expect(a.path, fut)
+
+    @property
+    def done(self) -> bool:
+        return not self._todo
+
+    @property
+    def progress(self) -> float:
+        return 1.0 - len(self._todo) / self.total if self.total else 1.0
+
+    def pump(self, budget: float = 0.003) -> bool:
+        """Move finished decodes into the registry for up to `budget` seconds
+        without waiting on any; True once everything is in."""
+        end = time.perf_counter() + budget
+        todo = self._todo
+        while todo and self._ready(todo[0]):
+            self._load(todo.popleft())
+            if time.perf_counter() >= end:
+                break
+        if not todo:
+            self.close()
+        return not todo
+
+    def finish(self, manifest: list[assets.Asset] | None = None) -> None:
+        """Load `manifest` (default: everything left) now, waiting on its decodes."""
+        if manifest is None:
+            now, later = list(self._todo), []
+        else:
+            want = set(manifest)
+            now = [a for a in self._todo if a in want]
+            later = [a for a in self._todo if a not in want]
+        self._todo = deque(later)
+        for a in now:
+            self._load(a)
+        if not self._todo:
+            self.close()
+
+    def _ready(self, a: assets.Asset) -> bool:
+        fut = self._futures.get(a.path)
+        return fut is None or fut.done()
+
+    @staticmethod
+    def _load(a: assets.Asset) -> None:
+        try:
+            assets.load(a)
+        except Exception:
+            pass  # the owner falls back on its own when it asks
+
+    def close(self) -> None:
+        """Stop early; anything not loaded yet is read on demand as before."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        for path in self._futures:
+            assets.forget(path)
+        self._futures.clear()
+        self._todo.clear()
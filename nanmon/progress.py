@@ -1,7 +1,8 @@
 # nanmon/progress.py
 from __future__ import annotations
 import pygame
-from .constants import WIDTH, WHITE, FONT_PATH
+from .constants import WIDTH, WHITE
+from . import text
 import os 
 
 class Progress:
@@ -21,11 +22,22 @@ class Progress:
         self.y = top
 
         # 小字體；你也可改成自訂字體檔
-        self.font = pygame.font.Font(FONT_PATH, 18)
-        self.label = self.font.render("progrss", True, WHITE)
+        self.font = text.font(18)
+        self.label = text.render(self.font, "progrss", WHITE)
         # 轉成垂直擺放
         self.label_rot = pygame.transform.rotate(self.label, 90)
 
+        # 靜態圖層：外框 + 文字只畫一次，draw() 時整張貼上
+        border_rect = pygame.Rect(self.x - 2, self.y - 2, self.w + 4, self.h + 4)
+        label_rect = self.label_rot.get_rect()
+        label_rect.centery = self.y + self.h // 2
+        label_rect.right = self.x - 6  # 與條之間留點距離
+        self.static_rect = border_rect.union(label_rect)
+        self._static = pygame.Surface(self.static_rect.size, pygame.SRCALPHA)
+        ox, oy = self.static_rect.topleft
+        pygame.draw.rect(self._static, WHITE, border_rect.move(-ox, -oy), 1)
+        self._static.blit(self.label_rot, label_rect.move(-ox, -oy))
+
     def update(self, dt: float):
         self.elapsed = min(self.boss_time, self.elapsed + dt)
 
@@ -34,19 +46,12 @@ class Progress:
         return self.elapsed >= self.boss_time
 
     def draw(self, surface: pygame.Surface):
-        # 外框
-        border_rect = pygame.Rect(self.x - 2, self.y - 2, self.w + 4, self.h + 4)
-        pygame.draw.rect(surface, WHITE, border_rect, 1)
+        # 外框 + 文字（預先畫好的靜態圖層）
+        surface.blit(self._static, self.static_rect)
 
         # 由下往上填滿
         ratio = (self.elapsed / self.boss_time) if self.boss_time > 0 else 1.0
         fill_h = int(self.h * max(0.0, min(1.0, ratio)))
         if fill_h > 0:
             fill_rect = pygame.Rect(self.x, self.y + (self.h - fill_h), self.w, fill_h)
-            pygame.draw.rect(surface, WHITE, fill_rect)
-
-        # 文字：貼在進度條左側置中（垂直字）
-        label_rect = self.label_rot.get_rect()
-        label_rect.centery = self.y + self.h // 2
-        label_rect.right = self.x - 6  # 與條之間留點距離
-        surface.blit(self.label_rot, label_rect)
\ No newline at end of file
+            pygame.draw.rect(surface, WHITE, fill_rect)
\ No newline at end of file
@@ -0,0 +1,293 @@
+"""Containers that own and step falling foods / boss projectiles.
+
+`FoodGroup` is the default: a sprite Group whose members move themselves
+with `Food.update`. `ProjectileStore` is the optional array engine: the hot
+per-item numbers (position, velocity, size, homing and wobble params, split
+timers) live in NumPy columns, so integration, homing, clamping and culling
+are each one vectorized pass. Food objects stay as thin handles for the
+gameplay flags, collisions and drawing.
+
+Both expose the same small API (add/remove/iterate/len/in, step, draw,
+query), so callers pick one with `make_group()` and don't care which they
+got. Each keeps a `SpatialHash` of its members current as they move, which
+`query()` uses as the collision broadphase.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterator
+import pygame
+from .constants import WIDTH, HEIGHT, HOMING_RANGE_SCALE, HOMING_MAX_VX
+from .food import Food, food_pool, homing_params
+from .spatial import SpatialHash
+
+try:
+    import numpy as np
+except ImportError:  # the array store is optional
+    np = None
+
+
+@dataclass(frozen=True)
+class Cull:
+    """Off-screen limits; an item is dropped once it passes any of them."""
+    top_below: float = HEIGHT + 10
+    right_before: float = -50
+    left_after: float = WIDTH + 50
+    bottom_above: float | None = -50
+
+
+# World foods also leave upward (defused soup); boss shots get a wider margin
+# and no upper limit so parried soups can travel back to the boss.
+WORLD_CULL = Cull()
+BOSS_CULL = Cull(top_below=HEIGHT + 40, right_before=-80, left_after=WIDTH + 80, bottom_above=None)
+
+_use_arrays = False
+
+
+def use_array_store(enabled: bool = True) -> bool:
+    """Switch new groups to the NumPy store; returns whether it is active."""
+    global _use_arrays
+    _use_arrays = bool(enabled) and np is not None
+    return _use_arrays
+
+
+def array_store_enabled() -> bool:
+    return _use_arrays
+
+
+def make_group(cull: Cull = WORLD_CULL):
+    return ProjectileStore(cull) if _use_arrays else FoodGroup(cull)
+
+
+def _offscreen(r: pygame.Rect, cull: Cull) -> bool:
+    return (r.top > cull.top_below or r.right < cull.right_before or r.left > cull.left_after
+            or (cull.bottom_above is not None and r.bottom < cull.bottom_above))
+
+
+class FoodGroup(pygame.sprite.Group):
+    """Per-object stepping (the original behaviour)."""
+    def __init__(self, cull: Cull = WORLD_CULL):
+        self.cull = cull
+        self.grid = SpatialHash()
+        super().__init__()
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.grid.insert(sprite, sprite.rect)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.grid.remove(sprite)
+        food_pool.retire(sprite)
+
+    def query(self, rect: pygame.Rect) -> list[Food]:
+        return self.grid.query(rect)
+
+    def step(self, dt: float, target_pos) -> None:
+        grid = self.grid
+        for f in list(self):
+            f.update(dt, target_pos)
+            grid.move(f, f.rect)
+            # If HOTDOG split produced children, add them and remove the parent
+            kids = f.spawn_children
+            if kids:
+                self.add(*kids)
+                f.spawn_children = None
+            if f.remove_me or _offscreen(f.rect, self.cull):
+                self.remove(f)
+
+
+class ProjectileStore:
+    """Struct-of-arrays food store (requires NumPy)."""
+    _COLUMNS = ("fx", "fy", "vx", "vy", "w", "h", "base", "steer",
+                "wob_amp", "wob_freq", "wob_phase", "wob_t", "wob_prev", "split")
+    _SPAN_COLUMNS = ("gx0", "gy0", "gx1", "gy1")  # grid cells each item covers
+
+    def __init__(self, cull: Cull = WORLD_CULL, capacity: int = 64):
+        if np is None:
+            raise RuntimeError("ProjectileStore needs numpy")
+        self.cull = cull
+        self.n = 0
+        self._items: list[Food] = []
+        self._dead = 0
+        self.grid = SpatialHash()
+        for name in self._COLUMNS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        for name in self._SPAN_COLUMNS:
+            setattr(self, name, np.zeros(capacity, dtype=np.int64))
+        self.homing = np.zeros(capacity, dtype=bool)
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    # --- Group-like API ---
+    def __len__(self) -> int:
+        return self.n - self._dead
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[Food]:
+        self._compact()
+        return iter(list(self._items))
+
+    def __contains__(self, f) -> bool:
+        return getattr(f, "_store", None) is self
+
+    def sprites(self) -> list[Food]:
+        return list(self)
+
+    def query(self, rect: pygame.Rect) -> list[Food]:
+        return self.grid.query(rect)
+
+    def _grow(self, need: int):
+        cap = len(self.fx)
+        if need <= cap:
+            return
+        while cap < need:
+            cap *= 2
+        for name in self._COLUMNS + self._SPAN_COLUMNS + ("homing", "alive"):
+            old = getattr(self, name)
+            new = np.zeros(cap, dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+    def add(self, *foods: Food):
+        for f in foods:
+            if f._store is self:
+                continue
+            if f._store is not None:
+                f._store.remove(f)
+            i = self.n
+            self._grow(i + 1)
+            self.fx[i] = f._fx
+            self.fy[i] = f._fy
+            self.vx[i] = f._vx
+            self.vy[i] = f._vy
+            self.w[i] = f.rect.width
+            self.h[i] = f.rect.height
+            self.homing[i] = bool(f.homing)
+            self.base[i], self.steer[i] = homing_params(f.kind)
+            self.wob_amp[i] = f.wobble_amp or 0.0
+            self.wob_freq[i] = f.wobble_freq
+            self.wob_phase[i] = f.wobble_phase
+            self.wob_t[i] = f._wobble_t
+            self.wob_prev[i] = f._wobble_prev
+            self.split[i] = np.nan if (f._split_timer is None or f.remove_me) else f._split_timer
+            self.alive[i] = True
+            sp = self.grid.span(f.rect)
+            self.gx0[i], self.gy0[i], self.gx1[i], self.gy1[i] = sp
+            self.grid.insert(f, f.rect)
+            f._store, f._slot = self, i
+            self._items.append(f)
+            self.n += 1
+
+    def remove(self, *foods: Food):
+        for f in foods:
+            if f._store is not self:
+                continue
+            i = f._slot
+            # hand the motion state back so the handle stays readable
+            f._store = None
+            f._fx, f._fy = float(self.fx[i]), float(self.fy[i])
+            f._vx, f._vy = float(self.vx[i]), float(self.vy[i])
+            f._slot = -1
+            self.alive[i] = False
+            self.grid.remove(f)
+            food_pool.retire(f)
+            self._dead += 1
+
+    def empty(self):
+        self.remove(*self._items)
+        self._compact()
+
+    def _compact(self):
+        if not self._dead:
+            return
+        keep = self.alive[:self.n]
+        m = int(keep.sum())
+        for name in self._COLUMNS + self._SPAN_COLUMNS + ("homing", "alive"):
+            arr = getattr(self, name)
+            arr[:m] = arr[:self.n][keep]
+        self._items = [f for f in self._items if f._store is self]
+        for i, f in enumerate(self._items):
+            f._slot = i
+        self.alive[m:self.n] = False
+        self.n = m
+        self._dead = 0
+
+    # --- stepping ---
+    def step(self, dt: float, target_pos) -> None:
+        self._compact()
+        n = self.n
+        if n == 0:
+            return
+        fx, fy, vx, vy = self.fx[:n], self.fy[:n], self.vx[:n], self.vy[:n]
+
+        # Homing steer toward target x (same arithmetic as Food.update)
+        if target_pos is not None:
+            h = self.homing[:n]
+            if h.any():
+                dx = target_pos[0] - (fx[h] + self.w[:n][h] / 2)
+                steer = np.clip(dx / self.steer[:n][h], -1.0, 1.0)
+                scale = np.minimum(1.0, np.abs(dx) / HOMING_RANGE_SCALE)
+                strength = self.base[:n][h] * (0.3 + 0.7 * scale)
+                vx[h] += strength * steer * 60 * dt
+
+        np.clip(vx, -HOMING_MAX_VX, HOMING_MAX_VX, out=vx)
+        fx += vx * dt
+        fy += vy * dt
+
+        # Optional horizontal wobble (S-shape)
+        wob = self.wob_amp[:n] != 0.0
+        if wob.any():
+            t = self.wob_t[:n]
+            t[wob] += dt
+            off = self.wob_amp[:n][wob] * np.sin(t[wob] * self.wob_freq[:n][wob] + self.wob_phase[:n][wob])
+            fx[wob] += off - self.wob_prev[:n][wob]
+            self.wob_prev[:n][wob] = off
+
+        xs = np.trunc(fx).astype(np.int64)
+        ys = np.trunc(fy).astype(np.int64)
+        items = self._items
+        for f, x, y in zip(items, xs.tolist(), ys.tolist()):
+            f.rect.topleft = (x, y)
+
+        # Broadphase upkeep: only items whose cell span changed touch the grid
+        grid = self.grid
+        c = grid.cell
+        wi = self.w[:n].astype(np.int64)
+        hi = self.h[:n].astype(np.int64)
+        gx0 = np.clip(xs // c, 0, grid.cols - 1)
+        gy0 = np.clip(ys // c, 0, grid.rows - 1)
+        gx1 = np.clip((xs + wi - 1) // c, gx0, grid.cols - 1)
+        gy1 = np.clip((ys + hi - 1) // c, gy0, grid.rows - 1)
+        moved = ((gx0 != self.gx0[:n]) | (gy0 != self.gy0[:n]) |
+                 (gx1 != self.gx1[:n]) | (gy1 != self.gy1[:n])) & self.alive[:n]
+        if moved.any():
+            for i in np.flatnonzero(moved).tolist():
+                grid.move_span(items[i], (int(gx0[i]), int(gy0[i]), int(gx1[i]), int(gy1[i])))
+            self.gx0[:n], self.gy0[:n], self.gx1[:n], self.gy1[:n] = gx0, gy0, gx1, gy1
+
+        # HOTDOG split: count down; force it near the bottom so it's visible
+        split = self.split[:n]
+        pending = ~np.isnan(split)
+        if pending.any():
+            split[pending] -= dt
+            split[pending & (ys >= HEIGHT - 220)] = 0.0
+            for i in np.flatnonzero(pending & (split <= 0.0)).tolist():
+                f = items[i]
+                kids = f.split_children()
+                f.remove_me = True
+                self.remove(f)
+                self.add(*kids)
+
+        # Off-screen culling
+        c = self.cull
+        w, hgt = self.w[:n], self.h[:n]
+        gone = (ys > c.top_below) | (xs + w < c.right_before) | (xs > c.left_after)
+        if c.bottom_above is not None:
+            gone |= (ys + hgt < c.bottom_above)
+        gone &= self.alive[:n]
+        for i in np.flatnonzero(gone).tolist():
+            self.remove(items[i])
+
+    def draw(self, surface: pygame.Surface):
+        surface.blits([(f.image, f.rect) for f in self._items if f._store is self], doreturn=False)
@@ -0,0 +1,124 @@
+"""Deterministic input recording and headless replay.
+
+A recording is a small header (level, seed, hat) followed by one 3-byte
+record per simulation tick: quantized movement x/y and a flags byte
+(mode toggles in the low nibble, skip in bit 4). Because every RNG stream
+is reseeded from the header seed, replaying the file reproduces the run
+tick for tick -- handy for checking that an optimization didn't change
+gameplay.
+"""
+from __future__ import annotations
+import json
+import os
+import struct
+import time
+from typing import Iterator
+from .constants import WIDTH, HEIGHT, RNG_SEED, SIM_DT
+from .simulation import FrameInput
+
+_MAGIC = b"NMRP"
+_VERSION = 1
+_HEADER = struct.Struct("<4sHHq")   # magic, version, level, seed
+_TICK = struct.Struct("<bbB")       # move_x, move_y, flags
+_SKIP_BIT = 0x10
+
+
+def _q(v: float) -> int:
+    return max(-127, min(127, int(round(float(v) * 127.0))))
+
+
+def quantize(inp: FrameInput) -> FrameInput:
+    """Snap input to what the file can store, so live and replay agree."""
+    return FrameInput(_q(inp.move_x) / 127.0, _q(inp.move_y) / 127.0,
+                      min(15, max(0, int(inp.toggles))), bool(inp.skip))
+
+
+class InputRecorder:
+    def __init__(self, path: str, *, level: int, seed: int = RNG_SEED, hat: str | None = None):
+        self.path = path
+        self.ticks = 0
+        d = os.path.dirname(os.path.abspath(path))
+        os.makedirs(d, exist_ok=True)
+        self._fh = open(path, "wb")
+        self._fh.write(_HEADER.pack(_MAGIC, _VERSION, int(level), int(seed)))
+        name = (hat or "").encode("utf-8")
+        self._fh.write(struct.pack("<H", len(name)) + name)
+
+    def record(self, inp: FrameInput) -> FrameInput:
+        """Write one tick and return the quantized input the sim should use."""
+        q = quantize(inp)
+        flags = q.toggles | (_SKIP_BIT if q.skip else 0)
+        self._fh.write(_TICK.pack(_q(q.move_x), _q(q.move_y), flags))
+        self.ticks += 1
+        return q
+
+    def close(self):
+        if self._fh is not None and not self._fh.closed:
+            self._fh.close()
+
+
+class InputReplay:
+    def __init__(self, path: str):
+        with open(path, "rb") as fh:
+            data = fh.read()
+        magic, version, level, seed = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path}: not a nanmon replay (v{_VERSION})")
+        off = _HEADER.size
+        (n,) = struct.unpack_from("<H", data, off)
+        off += 2
+        self.level = int(level)
+        self.seed = int(seed)
+        self.hat = data[off:off + n].decode("utf-8") or None
+        self._body = memoryview(data)[off + n:]
+
+    def __len__(self) -> int:
+        return len(self._body) // _TICK.size
+
+    def __iter__(self) -> Iterator[FrameInput]:
+        for mx, my, flags in _TICK.iter_unpack(self._body[:len(self) * _TICK.size]):
+            yield FrameInput(mx / 127.0, my / 127.0, flags & 0x0F, bool(flags & _SKIP_BIT))
+
+
+def run_replay(path: str) -> dict:
+    """Play a recording back headless as fast as possible; return a summary."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    import pygame
+    from .levels import get_level
+    from .rng import reseed
+    from .simulation import Simulation
+
+    rep = InputReplay(path)
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    try:
+        reseed(rep.seed)
+        sim = Simulation(get_level(rep.level), hat=rep.hat)
+        t0 = time.perf_counter()
+        for inp in rep:
+            sim.step(SIM_DT, inp)
+        wall = time.perf_counter() - t0
+        return {
+            "file": path,
+            "level": rep.level,
+            "seed": rep.seed,
+            "ticks": sim.ticks,
+            "sim_seconds": round(sim.elapsed, 3),
+            "wall_seconds": round(wall, 3),
+            "ticks_per_sec": round(sim.ticks / wall, 1) if wall > 0 else None,
+            "score": sim.score,
+            "nausea": round(sim.nausea, 4),
+            "eaten": sim.eaten.total,
+            "correct": sim.eaten.correct,
+            "level_cleared": sim.level_cleared,
+            "game_over": sim.game_over,
+            "digest": sim.state_digest(),
+        }
+    finally:
+        pygame.quit()
+
+
+def main(path: str) -> int:
+    print(json.dumps(run_replay(path), indent=2))
+    return 0
@@ -0,0 +1,117 @@
+"""Find asset files whatever the cwd, loose or inside the asset pack.
+
+Code names assets by root-relative paths ("nanmon/assets/food/CAKE.png").
+`resolve()` anchors them at the install root (the checkout, or the
+PyInstaller bundle) rather than the current directory, so the game runs
+from anywhere. When the loose ASSET_DIR isn't there, files come out of the
+single-file pack (nanmon.pack) instead: looked for beside the executable
+first, then in the bundle. Nothing is extracted; pygame reads straight
+from the mapped pack.
+
+Use `exists`/`listdir` instead of os.path and hand `source(path)` to
+pygame's loaders (image.load, mixer.Sound, mixer.music.load, font.Font).
+"""
+from __future__ import annotations
+import io
+import mmap
+import os
+import sys
+from .constants import ASSET_DIR, ASSET_PACK
+
+ROOT = getattr(sys, "_MEIPASS", None) or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_pack = None  # Pack, or False when reading loose files
+
+
+def resolve(path: str) -> str:
+    """`path` as an absolute on-disk path (relative ones are under ROOT)."""
+    return os.path.normpath(os.path.join(ROOT, path))
+
+
+def name(path: str) -> str:
+    """`path`'s root-relative, '/'-separated name (as the pack keys it)."""
+    return os.path.relpath(resolve(path), ROOT).replace(os.sep, "/")
+
+
+def pack():
+    """The asset pack in use, or None when the loose folder is there."""
+    global _pack
+    if _pack is None:
+        _pack = False
+        if not os.path.isdir(resolve(ASSET_DIR)):
+            from .pack import Pack
+            spots = [resolve(ASSET_PACK)]
+            if getattr(sys, "frozen", False):
+                spots.insert(0, os.path.join(os.path.dirname(sys.executable), ASSET_PACK))
+            for spot in spots:
+                try:
+                    _pack = Pack(spot)
+                    break
+                except Exception:
+                    pass
+    return _pack or None
+
+
+def exists(path: str) -> bool:
+    p = pack()
+    if p is None:
+        return os.path.exists(resolve(path))
+    n = name(path)
+    return n in p.files or n in p.dirs
+
+
+def listdir(path: str) -> list[str]:
+    p = pack()
+    if p is None:
+        return os.listdir(resolve(path))
+    try:
+        return sorted(p.dirs[name(path)])
+    except KeyError:
+        raise FileNotFoundError(path) from None
+
+
+def source(path: str):
+    """Something pygame's loaders take for `path`: the file's path, or a
+    file object over its bytes in the pack (FileNotFoundError if absent)."""
+    p = pack()
+    if p is None:
+        return resolve(path)
+    try:
+        return io.BytesIO(p.view(name(path)))
+    except KeyError:
+        raise FileNotFoundError(path) from None
+
+
+def view(path: str) -> memoryview:
+    """`path`'s bytes, mapped read-only rather than read."""
+    p = pack()
+    if p is not None:
+        try:
+            return p.view(name(path))
+        except KeyError:
+            raise FileNotFoundError(path) from None
+    with open(resolve(path), "rb") as f:
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def read(path: str) -> bytes:
+    p = pack()
+    if p is None:
+        with open(resolve(path), "rb") as f:
+            return f.read()
+    try:
+        return bytes(p.view(name(path)))
+    except KeyError:
+        raise FileNotFoundError(path) from None
+
+
+def stat(path: str) -> tuple[int, int]:
+    """(mtime_ns, size) of `path` (as packed, when reading the pack)."""
+    p = pack()
+    if p is None:
+        st = os.stat(resolve(path))
+        return st.st_mtime_ns, st.st_size
+    try:
+        return p.stat(name(path))
+    except KeyError:
+        raise FileNotFoundError(path) from None
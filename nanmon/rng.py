@@ -0,0 +1,36 @@
+from __future__ import annotations
+import random
+from .constants import RNG_SEED
+
+# Named random streams, one per subsystem, all derived from a single seed.
+# Keeping them apart means cosmetic draws (shake, jitter) never shift the
+# gameplay sequence, so a recorded input file replays identically.
+
+_seed = RNG_SEED
+_streams: dict[str, random.Random] = {}
+
+
+def _derive(name: str) -> str:
+    # str seeds hash through sha512 -> stable across runs and platforms
+    return f"nanmon:{_seed}:{name}"
+
+
+def stream(name: str) -> random.Random:
+    """Return the stream for `name`; the same object survives reseed()."""
+    r = _streams.get(name)
+    if r is None:
+        r = random.Random(_derive(name))
+        _streams[name] = r
+    return r
+
+
+def reseed(seed: int = RNG_SEED) -> None:
+    """Restart every stream from `seed` (call before building a level)."""
+    global _seed
+    _seed = int(seed)
+    for name, r in _streams.items():
+        r.seed(_derive(name))
+
+
+def current_seed() -> int:
+    return _seed
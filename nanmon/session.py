@@ -0,0 +1,53 @@
+"""Process-long game session: one window, mixer and font set for every level.
+
+`GameSession` initialises pygame and opens the window once; levels are
+played on top of it with `nanmon.game.play_level` and leave it running, so
+RESTART and NEXT_LEVEL reuse the window, the mixer and everything the
+asset registry already holds. `close()` shuts pygame down at the end.
+"""
+from __future__ import annotations
+import os
+import pygame
+from .constants import LETTERBOX_COLOR
+from .display_manager import DisplayManager
+from . import text
+
+
+class GameSession:
+    def __init__(self, headless_seconds: float | None = None, smooth_scale: bool = False,
+                 margin: float = 0.95, dirty_rects: bool = False):
+        self.headless_seconds = headless_seconds
+        if headless_seconds is not None:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+        pygame.init()
+        # Create DPI-safe, resizable window with logical scaling
+        try:
+            # Start with a good default window size in perfect 2:3 aspect ratio
+            initial_window_size = (450, 975)  # Close to 2:3 ratio, scales logical 600x900
+            self.dm = DisplayManager(
+                margin=margin,
+                use_integer_scale=not smooth_scale,
+                caption="道地南蠻 — Salty/Sweet",
+                bg_color=(LETTERBOX_COLOR.r, LETTERBOX_COLOR.g, LETTERBOX_COLOR.b),
+                initial_size=initial_window_size,
+                dirty_rects=dirty_rects,
+            )
+        except pygame.error:
+            pygame.quit()
+            raise
+        try:
+            if not pygame.mixer.get_init():
+                pygame.mixer.init(frequency=44100, size=-16, channels=2)
+        except Exception:
+            pass  # no audio device: levels run silent
+
+        self.clock = pygame.time.Clock()
+        self.font = text.font(16)  # HUD
+
+    def close(self) -> None:
+        try:
+            pygame.mixer.music.stop()
+        except Exception:
+            pass
+        pygame.quit()
@@ -0,0 +1,543 @@
+from __future__ import annotations
+import hashlib
+import random
+from contextlib import contextmanager
+from dataclasses import dataclass
+import pygame
+from .constants import (
+    WIDTH, HEIGHT, SIM_DT, MAX_SIM_STEPS,
+    NAUSEA_MAX, NAUSEA_WRONG_EAT, NAUSEA_DECAY_PER_SEC,
+    BOSS_HIT_DAMAGE, BOSS_HIT_DAMAGE_BY_KIND, BOSS_PREWARM_LEAD,
+)
+from .mouth import Mouth
+from .food import Food, food_pool, make_food
+from .projectiles import make_group, WORLD_CULL
+from .models import EatenCounters
+from .progress import Progress
+from .boss import Boss, Coffin, build_boss, make_boss
+from .effects import Smoke, ScreenShake
+from .levels import LevelConfig
+from .rng import stream
+from . import perf, trace
+
+_rng = stream("sim")
+
+
+@dataclass
+class FrameInput:
+    """Player input applied to one simulation tick."""
+    move_x: float = 0.0
+    move_y: float = 0.0
+    toggles: int = 0     # mode toggles requested since the last tick
+    skip: bool = False   # space/tap used to advance past clear/game-over
+
+
+class FixedTimestep:
+    """Accumulates variable frame time and hands out whole fixed ticks."""
+    def __init__(self, step: float = SIM_DT, max_steps: int = MAX_SIM_STEPS):
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, frame_dt: float) -> int:
+        self.accumulator += frame_dt
+        n = 0
+        while self.accumulator >= self.step and n < self.max_steps:
+            self.accumulator -= self.step
+            n += 1
+        if self.accumulator >= self.step:
+            # Too far behind (debugger, window drag); drop the backlog
+            self.accumulator %= self.step
+        return n
+
+    @property
+    def alpha(self) -> float:
+        """Fraction of a tick left over, used to interpolate rendering."""
+        return max(0.0, min(1.0, self.accumulator / self.step))
+
+
+def _parried_soup_hits_boss(obj, boss) -> bool:
+    """Detect a truly parried soup striking the Coffin boss."""
+    return (
+        boss is not None and isinstance(boss, Coffin) and
+        getattr(obj, "kind", "") == "BEEFSOUP" and
+        bool(getattr(obj, "neutralized", False)) and
+        bool(getattr(obj, "parried_by_player", False)) and
+        float(getattr(obj, "vy", 0.0)) < 0.0 and
+        obj.rect.colliderect(boss.rect)
+    )
+
+
+def _near(group, rects, moving: pygame.Rect):
+    """Broadphase walk over `group`: yields items sharing a grid cell with any
+    of `rects`, in the group's own iteration order.
+
+    `moving` (the mouth rect) may jump mid-walk on knockback; the candidates
+    are then re-gathered past the current item, so the result is exactly what
+    a full linear scan with colliderect tests would have hit.
+    """
+    grid = group.grid
+    hi = grid.last_order  # items added during the walk are not visited
+
+    def gather(after: int) -> list:
+        found = {}
+        for r in rects:
+            for o in group.query(r):
+                found[o] = None
+        order = grid.order
+        return sorted((o for o in found if after < order(o) <= hi), key=order)
+
+    seen = moving.copy()
+    pending = gather(0)
+    i = 0
+    while i < len(pending):
+        obj = pending[i]
+        i += 1
+        last = grid.order(obj)
+        yield obj
+        if moving != seen:
+            seen = moving.copy()
+            pending, i = gather(last), 0
+
+
+class Simulation:
+    """Gameplay state of one level, advanced by `step()` in fixed ticks.
+
+    Nothing here draws; run_game renders the state (interpolated) after
+    stepping, and headless tools can step it without a renderer.
+    """
+    def __init__(self, level_cfg: LevelConfig, *, rng: random.Random | None = None,
+                 hat: str | None = None, eat_sound=None, menu_sound=None):
+        self.level_cfg = level_cfg
+        self.level = int(getattr(level_cfg, "level", 1))
+        self.rng = rng if rng is not None else stream("spawn")
+        self.eat_sound = eat_sound
+        self.menu_sound = menu_sound
+
+        self.mouth = Mouth((WIDTH // 2, HEIGHT - 140))
+        try:
+            if hat:
+                self.mouth.set_hat(hat)
+        except Exception:
+            pass
+        self.foods = make_group(WORLD_CULL)
+        self.boss: Boss | None = None
+        self._next_boss: Boss | None = None  # prewarmed, handed over by _spawn_boss
+        self._boss_build = None  # build_boss() under way
+        self.progress = Progress(level_cfg.boss_spawn_time)
+        # effects
+        self.shake = ScreenShake()
+        self.smoke = Smoke()
+
+        self.eaten = EatenCounters()
+        self.score: float = 0.0
+        self.nausea = 0.0
+
+        self.spawn_timer = 0.0
+        self.next_spawn = self.rng.uniform(level_cfg.spawn_interval_min, level_cfg.spawn_interval_max)
+
+        self.level_cleared = False
+        self.game_over = False
+        self.player_invincible = False
+        self.elapsed = 0.0
+        self.ticks = 0
+        self.contact_push_cd = 0.0  # cooldown to avoid continuous boss-contact pushback
+        self.boss_contact_prev = False  # track edge of collision with boss body
+
+        # Level 3: parry gate state (spawn single beef soup until parried)
+        self.l3_parry_gate = (self.level == 3)
+        self.l3_parry_done = False
+        self.l3_parry_soup: Food | None = None
+        self.l3_parry_serial = 0
+
+    @property
+    def gate_closed(self) -> bool:
+        return self.l3_parry_gate and not self.l3_parry_done
+
+    def state_digest(self) -> str:
+        """Short hash of gameplay state; equal digests mean identical runs."""
+        m = self.mouth
+        parts = [self.ticks, self.score, self.nausea, self.eaten.total, self.eaten.correct,
+                 sorted(self.eaten.per_type.items()), tuple(m.rect), m.mode,
+                 self.level_cleared, self.game_over,
+                 [(f.kind, tuple(f.rect), float(f.vx), float(f.vy)) for f in self.foods]]
+        b = self.boss
+        if b is not None:
+            parts += [type(b).__name__, tuple(b.rect), b.bites, getattr(b, "parry_hits", 0),
+                      [(p.kind, tuple(p.rect), float(p.vx), float(p.vy)) for p in b.projectiles]]
+        return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:16]
+
+    # --- interpolation ---
+    def _moving_sprites(self):
+        yield self.mouth
+        yield from self.foods
+        if self.boss is not None:
+            yield self.boss
+            yield from self.boss.projectiles
+            if self.boss.target is not None:
+                yield self.boss.target
+
+    def _capture_prev(self):
+        for s in self._moving_sprites():
+            s._interp_prev = s.rect.topleft
+
+    @contextmanager
+    def interpolated(self, alpha: float):
+        """Temporarily place sprites between their previous and current tick."""
+        moved = []
+        for s in self._moving_sprites():
+            prev = getattr(s, "_interp_prev", None)
+            if prev is None:
+                continue
+            x, y = s.rect.topleft
+            if prev == (x, y):
+                continue
+            moved.append((s, x, y))
+            s.rect.topleft = (round(prev[0] + (x - prev[0]) * alpha),
+                              round(prev[1] + (y - prev[1]) * alpha))
+        try:
+            yield
+        finally:
+            for s, x, y in moved:
+                s.rect.topleft = (x, y)
+
+    # --- tick ---
+    def step(self, dt: float = SIM_DT, inp: FrameInput | None = None):
+        inp = inp or FrameInput()
+        self._capture_prev()
+        self.ticks += 1
+        self.elapsed += dt
+        # cooldowns
+        if self.contact_push_cd > 0.0:
+            self.contact_push_cd = max(0.0, self.contact_push_cd - dt)
+        if not (self.level_cleared or self.game_over):
+            for _ in range(inp.toggles):
+                self.mouth.toggle_mode()
+            self._step_play(dt, inp)
+        # world-level smoke (impacts) keeps drifting after clear/game over
+        self.smoke.update(dt)
+        # Foods dropped this tick go back to the pool only now, after every
+        # pass that might still touch them
+        food_pool.collect()
+        perf.lap("sim")
+
+    def _prewarm_boss(self):
+        # Construction loads sprites and four Sounds; before the bar fills,
+        # fetch one of them per tick, then build (tints are baked on the
+        # render side, see pending_boss)
+        if self._next_boss is not None:
+            return
+        if self._boss_build is None:
+            self._boss_build = build_boss(self.level_cfg)
+        try:
+            next(self._boss_build)
+        except StopIteration as done:
+            self._next_boss = done.value
+            self._boss_build = None
+
+    @property
+    def pending_boss(self) -> Boss | None:
+        """The boss built ahead of its spawn, if any (bake its tints while drawing)."""
+        return self._next_boss
+
+    def spawn_boss_now(self) -> Boss:
+        """Bring the level's boss in right away (benchmarks, debugging)."""
+        if self._next_boss is None:
+            self._next_boss = make_boss(self.level_cfg)
+        self._next_boss.bake()
+        self._spawn_boss()
+        return self.boss
+
+    def _spawn_boss(self):
+        boss, self._next_boss = self._next_boss, None
+        self._boss_build = None
+        if boss is None:
+            boss = make_boss(self.level_cfg)
+        # 播放boss音樂（背景音樂不停止）
+        # 不在boss出現時自動播放音效
+        self.boss = boss
+        trace.instant("boss_spawn", boss=type(boss).__name__, tick=self.ticks)
+
+    def _smoke_burst(self, cx: int, cy: int, n: int, spread: int):
+        for _ in range(n):
+            self.smoke.puff((cx + _rng.randint(-spread, spread),
+                             cy + _rng.randint(-spread, spread)))
+
+    def _step_play(self, dt: float, inp: FrameInput):
+        cfg = self.level_cfg
+        mouth = self.mouth
+        foods = self.foods
+        perf.lap("sim")
+        mouth.update(dt, move=(inp.move_x, inp.move_y))
+        perf.lap("mouth")
+
+        if self.nausea > 0:
+            self.nausea = max(0.0, self.nausea - NAUSEA_DECAY_PER_SEC * dt)
+
+        # Standard spawns nearly zero during boss; blocked during L3 parry gate
+        if self.boss is None and not self.gate_closed:
+            self.spawn_timer += dt
+            if self.spawn_timer >= self.next_spawn and len(foods) < cfg.max_onscreen_food:
+                foods.add(make_food(self.rng, cfg))
+                self.spawn_timer = 0.0
+                self.next_spawn = self.rng.uniform(cfg.spawn_interval_min, cfg.spawn_interval_max)
+
+        # Spawn boss when progress ready; countdown blocked until L3 parry completed
+        if not self.gate_closed:
+            self.progress.update(dt)
+        if self.boss is None and self.progress.boss_time - self.progress.elapsed <= BOSS_PREWARM_LEAD:
+            self._prewarm_boss()
+        if self.boss is None and self.progress.ready and not self.gate_closed:
+            self._spawn_boss()
+
+        # Level 3 parry gate: ensure a single center BEEFSOUP is present until parried
+        if self.gate_closed and self.l3_parry_soup is None:
+            # Singular gate soup falls much slower to be readable; BEEFSOUP is SALTY by design
+            gate = food_pool.acquire("BEEFSOUP", "SALTY", WIDTH // 2, 220.0, False,
+                                     scale=getattr(cfg, "food_scale", 1.0),
+                                     hitbox_scale=getattr(cfg, "food_hitbox_scale", None))
+            foods.add(gate)
+            self.l3_parry_soup = gate
+            self.l3_parry_serial = gate.serial
+
+        # Update foods: move, split HOTDOGs, drop anything off-screen
+        perf.lap("sim")
+        foods.step(dt, mouth.rect.center)
+        perf.lap("foods")
+
+        if self.boss is not None:
+            self._step_boss(dt)  # boss, its projectiles and their hits
+            perf.lap("boss")
+
+        self._collide_foods()
+        perf.lap("collisions")
+
+        # If the gate soup disappeared without a parry (ate or fell), respawn another
+        gate = self.l3_parry_soup
+        if self.gate_closed and gate is not None and (gate.serial != self.l3_parry_serial or gate not in foods):
+            self.l3_parry_soup = None
+
+        boss = self.boss
+        # Boss death ends level
+        if boss is not None and boss.dead:
+            # 播放level clear音效（只播放一次）
+            if not self.level_cleared:
+                trace.instant("level_clear", level=self.level, score=self.score)
+                if hasattr(boss, '_level_clear_snd') and boss._level_clear_snd:
+                    if not pygame.mixer.get_init():
+                        pygame.mixer.init()
+                    with trace.span("mixer.stop", "mixer"):
+                        pygame.mixer.stop()
+                    boss._level_clear_snd.play()
+            self.level_cleared = True
+
+        if self.nausea >= NAUSEA_MAX and not self.player_invincible:
+            if not self.game_over:
+                # trigger player death animation and shake once
+                mouth.die()
+                self.shake.shake(duration=0.45, magnitude=12)
+                trace.instant("game_over", level=self.level, score=self.score)
+                # 播放game over音效（只播放一次）
+                try:
+                    if boss and hasattr(boss, '_game_over_snd') and boss._game_over_snd:
+                        if not pygame.mixer.get_init():
+                            pygame.mixer.init()
+                        with trace.span("mixer.stop", "mixer"):
+                            pygame.mixer.stop()
+                        boss._game_over_snd.play()
+                except Exception:
+                    pass
+            self.game_over = True
+
+    def _step_boss(self, dt: float):
+        boss = self.boss
+        mouth = self.mouth
+        was_dead = boss.dead
+        boss.update(dt, player_pos=mouth.rect.center)
+        # Become invincible once boss starts dying
+        if getattr(boss, 'dying', False):
+            self.player_invincible = True
+        # Boss projectiles: parry hits on boss, then collisions with player
+        for proj in _near(boss.projectiles, self._hit_rects(), mouth.rect):
+            # If a parried soup from boss pool hits the boss, score the hit and remove it
+            if _parried_soup_hits_boss(proj, boss):
+                trace.instant("parry_hit")
+                try:
+                    boss.register_parry_hit()
+                except Exception:
+                    pass
+                try:
+                    boss.projectiles.remove(proj)
+                except Exception:
+                    pass
+                self._smoke_burst(proj.rect.centerx, proj.rect.centery, 6, 8)
+                continue
+
+            # Use shrunken hitboxes for projectiles
+            hitbox = getattr(proj, 'hitbox', None)
+            proj_rect = hitbox if hitbox is not None else proj.rect
+
+            if mouth.rect.colliderect(proj_rect):
+                # --- PARRY HAS PRIORITY (boss projectiles) ---
+                if getattr(proj, "kind", "") == "BEEFSOUP" and getattr(mouth, "switch_grace_timer", 0.0) > 0.0:
+                    proj.neutralized = True
+                    proj.parried_by_player = True
+                    proj.vy = -520.0
+                    proj.vx = _rng.uniform(-120.0, 120.0)
+                    # Skip damage/removal so it can travel upward and potentially hit the boss
+                    continue
+                # If already neutralized (parried), ignore collisions with the player
+                if getattr(proj, 'neutralized', False):
+                    continue
+
+                match = (mouth.mode == proj.category)
+                mouth.flash(match)
+                if self.eat_sound:
+                    self.eat_sound.play()
+                if match:
+                    # Count boss foods toward eaten totals when correctly matched
+                    mouth.bite()
+                    try:
+                        self.eaten.total += 1
+                        self.eaten.correct += 1
+                        self.eaten.per_type[proj.kind] += 1
+                    except Exception:
+                        pass
+                    # Boss foods contribute only a quarter score
+                    self.score += 0.25
+                # Wrong-eat boss projectile: apply penalty only if not currently invincible
+                if not self.player_invincible and not match and not mouth.is_invincible:
+                    dmg = BOSS_HIT_DAMAGE_BY_KIND.get(getattr(proj, "kind", ""), BOSS_HIT_DAMAGE)
+                    self.nausea = min(NAUSEA_MAX, self.nausea + dmg * getattr(self.level_cfg, 'nausea_damage_multiplier', 1.0))
+                    # Knockback and grant brief i-frames
+                    mouth.knockback(1800.0)
+                    mouth.set_invincible(0.5)
+                boss.projectiles.remove(proj)
+
+        # Impact when boss just finished dying
+        if (not was_dead) and boss.dead:
+            self.shake.shake(duration=0.6, magnitude=16)
+            # 停止boss音樂
+            try:
+                boss.stop_boss_music()
+            except Exception:
+                pass
+            # spawn a burst of smoke at impact
+            cx, by = boss.rect.centerx, min(HEIGHT - 20, boss.rect.bottom)
+            for _ in range(22):
+                self.smoke.puff((cx + _rng.randint(-60, 60), by - _rng.randint(0, 20)))
+
+        # Weak point: direct circular contact with the weak point (no food required)
+        if boss.active and boss.target is not None and boss.target.alive:
+            target_mode = "SALTY" if boss.target.color_key == "BLUE" else "SWEET"
+            if mouth.mode == target_mode:
+                t_center = boss.target.rect.center
+                t_radius = max(boss.target.rect.width, boss.target.rect.height) // 2
+                if mouth.circle_hit(t_center, radius=int(t_radius * 0.35)):
+                    mouth.bite()
+                    boss.register_bite()
+                    # Apply strong force-based knockback to player instead of teleport
+                    mouth.knockback(strength=12000.0)
+
+        # Light pushback when touching the boss body (makes reaching target trickier)
+        contact_now = (
+            boss.active
+            and not getattr(boss, 'spawning', False)
+            and not getattr(boss, 'dying', False)
+            and not boss.dead
+            and mouth.rect.colliderect(boss.rect)
+        )
+        if contact_now and not self.boss_contact_prev and self.contact_push_cd <= 0.0 and not self.player_invincible:
+            # Light pushback on first contact with a long cooldown
+            mouth.knockback(strength=1200.0)
+            self.contact_push_cd = 2.0
+        self.boss_contact_prev = contact_now
+
+    def _hit_rects(self) -> list[pygame.Rect]:
+        """Areas where a food can interact: the mouth, plus a Coffin's body."""
+        rects = [self.mouth.rect]
+        if isinstance(self.boss, Coffin):
+            rects.append(self.boss.rect)
+        return rects
+
+    def _collide_foods(self):
+        """World foods vs player (eat, penalty, parry) and parried soup vs boss."""
+        mouth = self.mouth
+        foods = self.foods
+        boss = self.boss
+        for f in _near(foods, self._hit_rects(), mouth.rect):
+            # Use shrunken hitbox for food collisions
+            f_rect = getattr(f, 'hitbox', None)
+            f_rect = f_rect if f_rect is not None else f.rect
+
+            # If a parried soup (world pool) hits the boss, score the hit and remove it
+            if _parried_soup_hits_boss(f, boss):
+                trace.instant("parry_hit")
+                try:
+                    boss.register_parry_hit()
+                except Exception:
+                    pass
+                foods.remove(f)
+                self._smoke_burst(f.rect.centerx, f.rect.centery, 6, 8)
+                continue
+
+            # Skip player collision if already neutralized (parried)
+            if getattr(f, 'neutralized', False):
+                continue
+
+            if not mouth.rect.colliderect(f_rect):
+                continue
+            # --- PARRY HAS PRIORITY (works for sweet->salty and salty->sweet) ---
+            if f.kind == "BEEFSOUP" and getattr(mouth, "switch_grace_timer", 0.0) > 0.0:
+                trace.instant("parry")
+                f.neutralized = True
+                f.parried_by_player = True
+                f.vy = -520.0
+                f.vx = _rng.uniform(-120.0, 120.0)
+                self._smoke_burst(mouth.rect.centerx, mouth.rect.centery, 8, 12)
+                # L3 gate opens on first successful parry
+                if self.gate_closed:
+                    self.l3_parry_done = True
+                    if self.menu_sound:
+                        try:
+                            self.menu_sound.play()
+                        except Exception:
+                            pass
+                # IMPORTANT: skip eat/damage logic; let it fly upward to maybe hit boss
+                continue
+
+            # Match mechanic
+            match = (mouth.mode == f.category)
+            mouth.flash(match)
+            if self.eat_sound:
+                self.eat_sound.play()
+            if match:
+                self.score += 1.0
+                self.eaten.total += 1
+                self.eaten.correct += 1
+                self.eaten.per_type[f.kind] += 1
+                mouth.bite()
+                # Boss weak point damage via correct-eat while target alive and matching mode
+                if boss is not None and boss.active and boss.target is not None and boss.target.alive:
+                    target_mode = "SALTY" if boss.target.color_key == "BLUE" else "SWEET"
+                    if mouth.mode == target_mode:
+                        # Use circle hit instead of rect overlap for reliability
+                        t_center = boss.target.rect.center
+                        t_radius = max(boss.target.rect.width, boss.target.rect.height) // 2
+                        if mouth.circle_hit(t_center, radius=int(t_radius * 0.4)):
+                            mouth.bite()
+                            boss.register_bite()
+                            mouth.knockback(strength=9000.0)
+            else:
+                # Count as eaten (wrong) and apply penalty only if not invincible
+                self.eaten.total += 1
+                if not self.player_invincible and not mouth.is_invincible:
+                    nausea_add = getattr(self.level_cfg, 'nausea_wrong_eat', NAUSEA_WRONG_EAT)
+                    self.nausea = min(NAUSEA_MAX, self.nausea + nausea_add)
+                    # SHAVEDICE wrong eat: apply cold status (slow + blue tint)
+                    if f.kind == "SHAVEDICE":
+                        mouth.apply_cold(duration=2.0, speed_scale=0.7)
+                    # Knockback and grant brief i-frames
+                    mouth.knockback(1800.0)
+                    mouth.set_invincible(0.5)
+            foods.remove(f)
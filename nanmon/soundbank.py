@@ -0,0 +1,293 @@
+"""Sound effects and long clips under one decoded-PCM budget.
+
+`get(path)` is how screens fetch a sound. Short clips (eat, spit, page
+turn, hurt...) are the asset registry's shared Sounds, decoded once per
+process. WAVs of STREAM_MIN_BYTES or more (boss theme, applause, wind,
+cymbals, level clear, the finish-screen loop) come back as a `Stream`
+instead: it answers the Sound calls the screens make, but decodes
+CHUNK_SECONDS at a time and queues the pieces on one of STREAM_CHANNELS
+reserved channels, so no full-length buffer is ever held. A feeder thread
+keeps each playing stream's queue topped up.
+
+Whole Sounds are capped at BUDGET_BYTES of decoded PCM: once the registry
+holds that much, further WAVs stream whatever their length (other formats
+still decode whole; ours are a few KB). `stats()` reports what is held.
+"""
+from __future__ import annotations
+import io
+import math
+import struct
+import threading
+import time
+import pygame
+from . import assets, resources, trace
+
+STREAM_MIN_BYTES = 1024 * 1024  # WAV file size from which a clip streams
+BUDGET_BYTES = 8 * 1024 * 1024  # decoded PCM held as whole Sounds
+STREAM_CHANNELS = 4  # reserved for streams, on top of the mixer's own
+CHUNK_SECONDS = 0.5
+FEED_INTERVAL = 0.02  # seconds between queue top-ups
+_MARGIN = 256  # source frames converted either side of a chunk, then trimmed off
+
+_streams: dict[str, "Stream"] = {}
+_voices: dict[int, "_Voice"] = {}  # reserved channel -> what it is playing
+_lock = threading.Lock()
+_feeder: threading.Thread | None = None
+_reserved = False
+_quit_hooked = False
+
+
+class _Wav:
+    """Where a WAV's sample frames sit in its (mapped) file; nothing decoded."""
+
+    def __init__(self, path: str):
+        data = resources.view(path)
+        if bytes(data[0:4]) != b"RIFF" or bytes(data[8:12]) != b"WAVE":
+            raise ValueError(f"{path}: not a WAV file")
+        fmt = start = None
+        i = 12
+        while i + 8 <= len(data) and (fmt is None or start is None):
+            cid = bytes(data[i:i + 4])
+            n = struct.unpack_from("<I", data, i + 4)[0]
+            if cid == b"fmt ":
+                fmt = bytes(data[i + 8:i + 8 + n])
+            elif cid == b"data":
+                start, length = i + 8, min(n, len(data) - i - 8)
+            i += 8 + n + (n & 1)
+        if fmt is None or start is None:
+            raise ValueError(f"{path}: no fmt/data chunk")
+        self.data = data
+        self.fmt = fmt
+        self.start = start
+        self.rate = struct.unpack_from("<I", fmt, 4)[0]
+        self.block = struct.unpack_from("<H", fmt, 12)[0]
+        self.frames = length // self.block
+
+    def clip(self, first: int, last: int) -> bytes:
+        """Frames [first, last) as a WAV file of their own."""
+        body = self.data[self.start + first * self.block:self.start + last * self.block]
+        riff = 4 + 8 + len(self.fmt) + 8 + len(body)
+        return b"".join((b"RIFF", struct.pack("<I", riff), b"WAVE",
+                         b"fmt ", struct.pack("<I", len(self.fmt)), self.fmt,
+                         b"data", struct.pack("<I", len(body)), body))
+
+
+def _frame_bytes() -> int:
+    _, size, channels = pygame.mixer.get_init()
+    return abs(size) // 8 * channels
+
+
+class _Voice:
+    """One play() of a stream on one reserved channel."""
+    __slots__ = ("stream", "channel", "pos", "loops")
+
+    def __init__(self, stream: "Stream", channel: pygame.mixer.Channel, loops: int):
+        self.stream = stream
+        self.channel = channel
+        self.pos = 0  # next source frame to queue
+        self.loops = loops
+
+    def next_chunk(self) -> pygame.mixer.Sound | None:
+        wav = self.stream._wav
+        if self.pos >= wav.frames:
+            if self.loops == 0:
+                return None
+            if self.loops > 0:
+                self.loops -= 1
+            self.pos = 0
+        first = self.pos
+        step = self.stream._step()
+        self.pos = min(wav.frames, first + max(1, round(CHUNK_SECONDS * wav.rate / step)) * step)
+        return self.stream._chunk(first, self.pos)
+
+    def feed(self) -> bool:
+        """Queue the next chunk if there's room; False once this voice is over."""
+        ch = self.channel
+        if not ch.get_busy():
+            return False  # finished, stopped, or the mixer was stopped under us
+        if ch.get_queue() is None:
+            nxt = self.next_chunk()
+            if nxt is not None:
+                ch.queue(nxt)
+        return True
+
+
+class Stream:
+    """A long clip played a chunk at a time. Supports the Sound calls the
+    screens use: play/stop/set_volume/get_volume/get_length."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._wav = _Wav(path)
+        self._volume = 1.0
+
+    def _step(self) -> int:
+        """Source frames between points that land exactly on an output frame."""
+        rate = self._wav.rate
+        return rate // math.gcd(rate, pygame.mixer.get_init()[0])
+
+    def _chunk(self, first: int, last: int) -> pygame.mixer.Sound:
+        # Let SDL convert a slightly wider slice and keep the middle, so the
+        # resampler sees real neighbours at every chunk edge (no clicks).
+        # Chunk starts fall on whole output frames, so pieces line up exactly.
+        wav = self._wav
+        freq = pygame.mixer.get_init()[0]
+        step = self._step()
+        a = max(0, first - -(-_MARGIN // step) * step)
+        b = min(wav.frames, last + _MARGIN)
+        with trace.span("stream.chunk", "mixer", path=self.path):
+            raw = pygame.mixer.Sound(file=io.BytesIO(wav.clip(a, b))).get_raw()
+        fb = _frame_bytes()
+        lo = (first - a) * freq // wav.rate
+        n = last * freq // wav.rate - first * freq // wav.rate
+        snd = pygame.mixer.Sound(buffer=raw[lo * fb:(lo + n) * fb])
+        snd.set_volume(self._volume)
+        return snd
+
+    @trace.traced("Stream.play", "mixer")
+    def play(self, loops: int = 0, maxtime: int = 0, fade_ms: int = 0) -> pygame.mixer.Channel | None:
+        global _feeder
+        with _lock:
+            _reserve()
+            cid, ch = _free_channel()
+            voice = _Voice(self, ch, loops)
+            first = voice.next_chunk()
+            if first is None:
+                return None
+            ch.play(first)
+            nxt = voice.next_chunk()
+            if nxt is not None:
+                ch.queue(nxt)
+            _voices[cid] = voice
+            if _feeder is None:
+                _feeder = threading.Thread(target=_feed_loop, name="soundbank", daemon=True)
+                _feeder.start()
+        return ch
+
+    def stop(self) -> None:
+        with _lock:
+            for cid, v in list(_voices.items()):
+                if v.stream is self:
+                    v.channel.stop()
+                    del _voices[cid]
+
+    def set_volume(self, value: float) -> None:
+        self._volume = value
+        with _lock:
+            for v in _voices.values():
+                if v.stream is self:
+                    for snd in (v.channel.get_sound(), v.channel.get_queue()):
+                        if snd is not None:
+                            snd.set_volume(value)
+
+    def get_volume(self) -> float:
+        return self._volume
+
+    def get_length(self) -> float:
+        return self._wav.frames / self._wav.rate
+
+
+def _drop() -> None:
+    # Channels and chunks die with the mixer
+    global _reserved, _quit_hooked
+    with _lock:
+        _voices.clear()
+    _reserved = False
+    _quit_hooked = False
+
+
+def _reserve() -> None:
+    global _reserved, _quit_hooked
+    if _reserved:
+        return
+    n = pygame.mixer.get_num_channels()
+    pygame.mixer.set_num_channels(n + STREAM_CHANNELS)
+    pygame.mixer.set_reserved(STREAM_CHANNELS)  # the first ones; Sound.play() skips them
+    _reserved = True
+    if not _quit_hooked:
+        pygame.register_quit(_drop)  # quit hooks run once, so re-arm
+        _quit_hooked = True
+
+
+def _free_channel() -> tuple[int, pygame.mixer.Channel]:
+    """An idle reserved channel, else the one that started playing first."""
+    for i in range(STREAM_CHANNELS):
+        ch = pygame.mixer.Channel(i)
+        if not ch.get_busy():
+            _voices.pop(i, None)
+            return i, ch
+    cid = next(iter(_voices), 0)
+    _voices.pop(cid, None)
+    ch = pygame.mixer.Channel(cid)
+    ch.stop()
+    return cid, ch
+
+
+def _feed_loop() -> None:
+    global _feeder
+    while True:
+        time.sleep(FEED_INTERVAL)
+        with _lock:
+            try:
+                for cid, v in list(_voices.items()):
+                    if not v.feed():
+                        del _voices[cid]
+            except Exception:
+                _voices.clear()  # mixer gone
+            if not _voices:
+                _feeder = None
+                return
+
+
+def _decoded_bytes(path: str) -> int:
+    """What decoding `path` whole would cost in the mixer's format."""
+    wav = _Wav(path)
+    return int(wav.frames * pygame.mixer.get_init()[0] / wav.rate) * _frame_bytes()
+
+
+def streams(path: str) -> bool:
+    """True if `get(path)` hands out a Stream rather than a whole Sound."""
+    if resources.name(path) in _streams:
+        return True
+    if not path.lower().endswith(".wav") or not pygame.mixer.get_init():
+        return False
+    if assets.cached(assets.Asset(path, sound=True)):
+        return False  # already decoded, so sharing it costs nothing more
+    try:
+        if resources.stat(path)[1] >= STREAM_MIN_BYTES:
+            return True
+        return assets.stats()["sound_bytes"] + _decoded_bytes(path) > BUDGET_BYTES
+    except Exception:
+        return False  # leave odd files to mixer.Sound
+
+
+def get(path: str, *, scope: str = assets.APP):
+    """The shared Sound, or a Stream, for `path` (the mixer must already be
+    initialised). Raises like mixer.Sound when the file can't be had."""
+    key = resources.name(path)
+    s = _streams.get(key)
+    if s is not None:
+        return s
+    if streams(path):
+        s = Stream(path)
+        _streams[key] = s
+        return s
+    return assets.sound(path, scope=scope)
+
+
+def stats() -> dict:
+    """Decoded PCM held as whole Sounds against BUDGET_BYTES, how many clips
+    stream, and the most chunk PCM playing streams hold at once."""
+    with _lock:
+        voices = len(_voices)
+    try:
+        chunk = int(CHUNK_SECONDS * pygame.mixer.get_init()[0]) * _frame_bytes()
+    except Exception:
+        chunk = 0
+    return {
+        "pcm_bytes": assets.stats()["sound_bytes"],
+        "budget": BUDGET_BYTES,
+        "streams": len(_streams),
+        "voices": voices,
+        "stream_bytes": voices * 2 * chunk,  # the playing chunk plus the queued one
+    }
@@ -0,0 +1,106 @@
+"""Uniform-grid spatial hash used as the collision broadphase.
+
+The playfield is cut into square cells; every indexed object sits in each
+cell its rect touches (clamped to the border cells when off-screen). Food
+containers keep the grid current as things move, so a collision pass only
+looks at objects near the mouth / boss instead of every live item.
+"""
+from __future__ import annotations
+import pygame
+from .constants import WIDTH, HEIGHT
+
+GRID_CELL = 64
+
+
+class SpatialHash:
+    def __init__(self, cell: int = GRID_CELL, width: int = WIDTH, height: int = HEIGHT):
+        self.cell = int(cell)
+        self.cols = -(-int(width) // self.cell)
+        self.rows = -(-int(height) // self.cell)
+        self._buckets: list[dict] = [{} for _ in range(self.cols * self.rows)]
+        # obj -> (insertion order, x0, y0, x1, y1)
+        self._where: dict = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, obj) -> bool:
+        return obj in self._where
+
+    def span(self, r: pygame.Rect) -> tuple[int, int, int, int]:
+        c, cx, cy = self.cell, self.cols - 1, self.rows - 1
+        x0 = min(max(r.left // c, 0), cx)
+        y0 = min(max(r.top // c, 0), cy)
+        x1 = min(max((r.right - 1) // c, x0), cx)
+        y1 = min(max((r.bottom - 1) // c, y0), cy)
+        return x0, y0, x1, y1
+
+    def _link(self, obj, x0, y0, x1, y1):
+        b, cols = self._buckets, self.cols
+        for gy in range(y0, y1 + 1):
+            row = gy * cols
+            for gx in range(x0, x1 + 1):
+                b[row + gx][obj] = None
+
+    def _unlink(self, obj, x0, y0, x1, y1):
+        b, cols = self._buckets, self.cols
+        for gy in range(y0, y1 + 1):
+            row = gy * cols
+            for gx in range(x0, x1 + 1):
+                b[row + gx].pop(obj, None)
+
+    def insert(self, obj, rect: pygame.Rect):
+        if obj in self._where:
+            self.move(obj, rect)
+            return
+        sp = self.span(rect)
+        self._seq += 1
+        self._where[obj] = (self._seq, *sp)
+        self._link(obj, *sp)
+
+    def move_span(self, obj, sp: tuple[int, int, int, int]) -> bool:
+        """Re-bucket `obj` if its cell span changed; returns True if it did."""
+        old = self._where.get(obj)
+        if old is None or old[1:] == sp:
+            return False
+        self._unlink(obj, *old[1:])
+        self._where[obj] = (old[0], *sp)
+        self._link(obj, *sp)
+        return True
+
+    def move(self, obj, rect: pygame.Rect) -> bool:
+        return self.move_span(obj, self.span(rect))
+
+    def remove(self, obj):
+        old = self._where.pop(obj, None)
+        if old is not None:
+            self._unlink(obj, *old[1:])
+
+    def clear(self):
+        for b in self._buckets:
+            b.clear()
+        self._where.clear()
+
+    def query(self, rect: pygame.Rect) -> list:
+        """Objects sharing a cell with `rect`, in insertion order."""
+        x0, y0, x1, y1 = self.span(rect)
+        b, cols = self._buckets, self.cols
+        if x0 == x1 and y0 == y1:
+            found = b[y0 * cols + x0]
+        else:
+            found = {}
+            for gy in range(y0, y1 + 1):
+                row = gy * cols
+                for gx in range(x0, x1 + 1):
+                    found.update(b[row + gx])
+        where = self._where
+        return sorted(found, key=lambda o: where[o][0])
+
+    def order(self, obj) -> int:
+        """Insertion order of `obj` (matches its container's iteration order)."""
+        return self._where[obj][0]
+
+    @property
+    def last_order(self) -> int:
+        return self._seq
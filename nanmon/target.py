@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import math
-import os
-import random
 import pygame
 
 from .constants import TARGET_IMG_PATHS, TARGET_SIZE, TARGET_LIFETIME
+from .rng import stream
+from . import assets, resources
+
+_rng = stream("target")
+
+
+def preload_assets() -> list[assets.Asset]:
+    return [assets.Asset(p, TARGET_SIZE) for p in TARGET_IMG_PATHS.values() if p]
 
 
 class Target:
@@ -15,12 +21,12 @@ class Target:
 
     def __init__(self, boss_rect: pygame.Rect):
         # 固定顏色（一次抽籤）
-        self.color_key = random.choice(["BLUE", "PINK"])
+        self.color_key = _rng.choice(["BLUE", "PINK"])
 
         # 放在 boss 外圍：下半部外緣（避免跑到上半或背面）
         bw, bh = boss_rect.width, boss_rect.height
         # 範圍約 36°..144°（0.20π..0.80π），偏向畫面下方
-        ang = random.uniform(math.pi * 0.20, math.pi * 0.80)
+        ang = _rng.uniform(math.pi * 0.20, math.pi * 0.80)
         rx = (bw * 0.42) * math.cos(ang)
         ry = (bh * 0.42) * math.sin(ang)
         ox, oy = int(rx), int(ry)
@@ -28,9 +34,9 @@ class Target:
 
         # 載入圖像（或簡易圈圈）
         path = TARGET_IMG_PATHS.get(self.color_key, "")
-        if path and os.path.exists(path):
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.scale(img, TARGET_SIZE)
+        if path and resources.exists(path):
+            # 每 ~1.2 秒重生一次：共用同一張已縮放的圖
+            img = assets.image(path, TARGET_SIZE)
         else:
             img = pygame.Surface(TARGET_SIZE, pygame.SRCALPHA)
             color = (80, 80, 255) if self.color_key == "BLUE" else (255, 80, 180)
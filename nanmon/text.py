@@ -0,0 +1,84 @@
+"""Shared fonts and a cache of rendered text.
+
+`font(size)` hands out one Font per (path, size) for the whole process, so
+screens stop reopening the same .otf. `render()` keeps recently drawn
+strings as surfaces in an LRU keyed by (font, text, colour, outline), so
+labels redrawn every frame are rasterised once. Cached surfaces are shared:
+don't draw into them.
+
+Outlined text is baked premultiplied (the stroke composited under the fill
+exactly as eight offset blits would be); blit it with `blit_outlined()`.
+Fonts die with pygame.quit(), so both caches are dropped then.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+import pygame
+from .constants import FONT_PATH
+from . import resources
+
+TEXT_CACHE_SIZE = 256  # rendered strings kept
+
+_OUTLINE_OFFSETS = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+_fonts: dict[tuple[str, int], pygame.font.Font] = {}
+_texts: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+_quit_hooked = False
+_counts = {"hits": 0, "renders": 0}
+
+
+def _drop() -> None:
+    global _quit_hooked
+    _quit_hooked = False
+    _fonts.clear()
+    _texts.clear()
+
+
+def font(size: int, path: str = FONT_PATH) -> pygame.font.Font:
+    """The shared Font for `path` at `size` (raises like pygame.font.Font)."""
+    global _quit_hooked
+    key = (path, int(size))
+    f = _fonts.get(key)
+    if f is None:
+        f = pygame.font.Font(resources.source(path), int(size))
+        _fonts[key] = f
+        if not _quit_hooked:
+            pygame.register_quit(_drop)  # quit hooks run once, so re-arm
+            _quit_hooked = True
+    return f
+
+
+def render(f: pygame.font.Font, text: str, color, outline=None) -> pygame.Surface:
+    """`f.render(text, True, color)`, cached. With an `outline` colour the
+    result is one pixel larger on every side and premultiplied."""
+    key = (f, text, tuple(color), tuple(outline) if outline is not None else None)
+    surf = _texts.get(key)
+    if surf is not None:
+        _texts.move_to_end(key)
+        _counts["hits"] += 1
+        return surf
+    _counts["renders"] += 1
+    surf = f.render(text, True, color)
+    if outline is not None:
+        # premul_alpha() on a raw font surface comes back empty; convert first
+        fill = surf.convert_alpha().premul_alpha()
+        stroke = f.render(text, True, outline).convert_alpha().premul_alpha()
+        w, h = fill.get_size()
+        surf = pygame.Surface((w + 2, h + 2), pygame.SRCALPHA)
+        for dx, dy in _OUTLINE_OFFSETS:
+            surf.blit(stroke, (1 + dx, 1 + dy), special_flags=pygame.BLEND_PREMULTIPLIED)
+        surf.blit(fill, (1, 1), special_flags=pygame.BLEND_PREMULTIPLIED)
+    _texts[key] = surf
+    if len(_texts) > TEXT_CACHE_SIZE:
+        _texts.popitem(last=False)
+    return surf
+
+
+def blit_outlined(surface: pygame.Surface, f: pygame.font.Font, text: str, pos: tuple[int, int],
+                  color=(255, 255, 255), outline=(0, 0, 0)) -> pygame.Rect:
+    """Draw `text` at `pos` (the fill's top-left) with a one-pixel outline."""
+    surf = render(f, text, color, outline)
+    return surface.blit(surf, (pos[0] - 1, pos[1] - 1), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+
+def stats() -> dict:
+    return {"fonts": len(_fonts), "texts": len(_texts), **_counts}
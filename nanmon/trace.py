@@ -0,0 +1,145 @@
+"""Timeline recording in Chrome's Trace Event format, for hitch analysis.
+
+    python main.py --trace run.json
+
+Open the file in https://ui.perfetto.dev or chrome://tracing. Once
+`start()`ed, `span(name)` (a context manager) and `traced(name)` (a
+decorator) record complete events and `instant(name)` marks a moment;
+perf.lap() sections land here as spans too, so every gameplay frame shows
+its events/sim/draw/present split under a "frame" span. Events go into a
+ring buffer holding the last CAPACITY of them and are written out by
+`flush()` at exit, so a long session keeps its most recent few minutes.
+
+While off (the default) a span is one flag test and a shared no-op
+context; only worth guarding call sites whose arguments are costly to build.
+Instants are rare gameplay moments, so the last RECENT of them are kept in
+`recent` whether or not a trace is recording (nanmon.hitch logs them).
+"""
+from __future__ import annotations
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+CAPACITY = 200_000  # events kept; a gameplay frame records about a dozen
+RECENT = 8
+
+on = False
+_path: str | None = None
+_t0 = 0.0
+# (phase, name, category, start, duration, thread id, args), oldest first
+_events: deque[tuple] = deque(maxlen=CAPACITY)
+_threads: dict[int, str] = {}
+recent: deque[tuple] = deque(maxlen=RECENT)  # (perf_counter, name, args)
+
+
+def start(path: str, capacity: int = CAPACITY) -> None:
+    """Record from now on; `flush()` (also run at exit) writes to `path`."""
+    global on, _path, _t0, _events
+    _events = deque(maxlen=capacity)
+    _threads.clear()
+    _path = path
+    _t0 = time.perf_counter()
+    on = True
+    atexit.unregister(flush)
+    atexit.register(flush)
+
+
+def _tid() -> int:
+    tid = threading.get_ident()
+    if tid not in _threads:
+        _threads[tid] = threading.current_thread().name
+    return tid
+
+
+def complete(name: str, begin: float, end: float, args: dict | None = None, cat: str = "game") -> None:
+    """Record a span that ran between perf_counter() readings `begin` and `end`."""
+    if on:
+        _events.append(("X", name, cat, begin, end - begin, _tid(), args))
+
+
+def instant(name: str, cat: str = "game", **args) -> None:
+    t = time.perf_counter()
+    recent.append((t, name, args or None))
+    if on:
+        _events.append(("i", name, cat, t, 0.0, _tid(), args or None))
+
+
+class _Span:
+    __slots__ = ("name", "cat", "args", "begin")
+
+    def __init__(self, name: str, cat: str, args: dict | None):
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.begin = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        complete(self.name, self.begin, time.perf_counter(), self.args, self.cat)
+        return False
+
+
+class _Off:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_OFF = _Off()
+
+
+def span(name: str, cat: str = "game", **args):
+    """`with span("name"):` records how long the block took."""
+    return _Span(name, cat, args or None) if on else _OFF
+
+
+def traced(name: str | None = None, cat: str = "game"):
+    """Decorator recording every call of the function as a span."""
+    def wrap(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def inner(*a, **kw):
+            if not on:
+                return fn(*a, **kw)
+            begin = time.perf_counter()
+            try:
+                return fn(*a, **kw)
+            finally:
+                complete(label, begin, time.perf_counter(), None, cat)
+        return inner
+    return wrap
+
+
+def flush() -> None:
+    """Write what the ring holds to the trace file (rewritten on every call)."""
+    if _path is None:
+        return
+    pid = os.getpid()
+    out = [{"ph": "M", "name": "process_name", "pid": pid, "tid": 0, "args": {"name": "nanmon"}}]
+    out += [{"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": tname}}
+            for tid, tname in list(_threads.items())]
+    for ph, name, cat, t, dur, tid, args in list(_events):
+        e = {"ph": ph, "name": name, "cat": cat, "ts": round((t - _t0) * 1e6, 1), "pid": pid, "tid": tid}
+        if ph == "X":
+            e["dur"] = round(dur * 1e6, 1)
+        else:
+            e["s"] = "t"  # thread-scoped instant
+        if args:
+            e["args"] = args
+        out.append(e)
+    try:
+        with open(_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": out, "displayTimeUnit": "ms"}, f)
+    except OSError:
+        pass  # an unwritable trace shouldn't take the game down on exit
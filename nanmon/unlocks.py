@@ -2,6 +2,7 @@ from __future__ import annotations
 import json
 import os
 from .constants import ASSET_HAT_DIR
+from . import resources
 
 _UNLOCKS_FILE = os.path.join(os.path.dirname(__file__), "unlocked_hats.json")
 
@@ -45,6 +46,6 @@ def unlock_hat(name: str) -> None:
 
 def list_all_hats() -> list[str]:
     try:
-        return [fn for fn in os.listdir(ASSET_HAT_DIR) if fn.lower().endswith((".png", ".jpg", ".jpeg"))]
+        return [fn for fn in resources.listdir(ASSET_HAT_DIR) if fn.lower().endswith((".png", ".jpg", ".jpeg"))]
     except Exception:
         return []
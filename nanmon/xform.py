@@ -0,0 +1,87 @@
+"""Shared LRU cache of scaled, rotated and flipped surfaces.
+
+Animations that transform the same source the same way every frame (a
+constant-scale sprite, a pulsing label, a wobbling box) look the result up
+here instead of re-running pygame.transform. Entries are keyed by
+(source surface, op, params); the source itself is part of the key, not its
+id(), so a freed surface can never alias a new one. Rotation angles snap to
+ANGLE_STEP degrees so oscillating or spinning sprites reuse a bounded set of
+frames; sizes are whole pixels already and are used as given.
+
+Results are held up to BUDGET_BYTES of pixels, least recently used first
+out. Cached surfaces are shared: don't draw into them. Sources must not be
+drawn into after being transformed through here either.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+import pygame
+
+BUDGET_BYTES = 16 * 1024 * 1024
+ANGLE_STEP = 1.0  # degrees
+
+_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+_bytes = 0
+_counts = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _nbytes(surf: pygame.Surface) -> int:
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+def get(src: pygame.Surface, op: str, params: tuple, make) -> pygame.Surface:
+    """Cached `make()` for (src, op, params); `make` builds it on a miss."""
+    global _bytes
+    key = (src, op, params)
+    out = _cache.get(key)
+    if out is not None:
+        _cache.move_to_end(key)
+        _counts["hits"] += 1
+        return out
+    _counts["misses"] += 1
+    out = make()
+    size = _nbytes(out)
+    if size > BUDGET_BYTES:
+        return out  # never fits; hand it out uncached
+    _cache[key] = out
+    _bytes += size
+    while _bytes > BUDGET_BYTES:
+        _, old = _cache.popitem(last=False)
+        _bytes -= _nbytes(old)
+        _counts["evictions"] += 1
+    return out
+
+
+def scale(src: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+    size = (max(1, int(size[0])), max(1, int(size[1])))
+    if size == src.get_size():
+        return src
+    return get(src, "scale", size, lambda: pygame.transform.scale(src, size))
+
+
+def smoothscale(src: pygame.Surface, size: tuple[int, int]) -> pygame.Surface:
+    size = (max(1, int(size[0])), max(1, int(size[1])))
+    return get(src, "smoothscale", size, lambda: pygame.transform.smoothscale(src, size))
+
+
+def rotate(src: pygame.Surface, angle: float) -> pygame.Surface:
+    """pygame.transform.rotate with `angle` snapped to ANGLE_STEP."""
+    angle = round(angle / ANGLE_STEP) * ANGLE_STEP % 360.0
+    if angle == 0.0:
+        return src
+    return get(src, "rotate", angle, lambda: pygame.transform.rotate(src, angle))
+
+
+def flip(src: pygame.Surface, flip_x: bool, flip_y: bool = False) -> pygame.Surface:
+    flags = (bool(flip_x), bool(flip_y))
+    return get(src, "flip", flags, lambda: pygame.transform.flip(src, *flags))
+
+
+def clear() -> None:
+    global _bytes
+    _cache.clear()
+    _bytes = 0
+
+
+def stats() -> dict:
+    """Entry count, bytes held against the budget, and hit/miss/eviction counters."""
+    return {"entries": len(_cache), "bytes": _bytes, "budget": BUDGET_BYTES, **_counts}
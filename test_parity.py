@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Parity checks for the optimizations that claim identical behaviour:
+the --soa array store vs the sprite groups (same replay digest), and the
+spatial-hash broadphase vs a brute-force rect scan."""
+
+import os
+import random
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+import pytest
+
+from nanmon.constants import WIDTH, HEIGHT
+from nanmon.projectiles import array_store_enabled, use_array_store
+from nanmon.replay import InputRecorder, run_replay
+from nanmon.simulation import FrameInput
+from nanmon.spatial import SpatialHash
+
+TICKS = 1500  # 25 s: past the boss spawn, so its projectiles are in the mix
+
+
+def _record(path, level, seed):
+    rng = random.Random(seed)
+    rec = InputRecorder(path, level=level, seed=seed)
+    mx = my = 0.0
+    for tick in range(TICKS):
+        if tick % 20 == 0:
+            mx, my = rng.uniform(-1, 1), rng.uniform(-1, 1)
+        toggles = 1 if rng.random() < 0.02 else 0
+        rec.record(FrameInput(mx, my, toggles, False))
+    rec.close()
+
+
+@pytest.mark.parametrize("level", [1, 2])
+def test_array_store_replay_digest(tmp_path, level):
+    pytest.importorskip("numpy")
+    path = str(tmp_path / f"level{level}.nmr")
+    _record(path, level, seed=1234 + level)
+    was = array_store_enabled()
+    try:
+        use_array_store(False)
+        plain = run_replay(path)
+        assert use_array_store(True)
+        soa = run_replay(path)
+    finally:
+        use_array_store(was)
+    assert plain["ticks"] == soa["ticks"] == TICKS
+    assert plain["digest"] == soa["digest"]
+
+
+def test_replay_is_repeatable(tmp_path):
+    path = str(tmp_path / "again.nmr")
+    _record(path, 1, seed=99)
+    assert run_replay(path)["digest"] == run_replay(path)["digest"]
+
+
+def _random_rect(rng):
+    # Mostly on screen, some straddling or wholly past every border
+    w, h = rng.randint(1, 160), rng.randint(1, 160)
+    x = rng.randint(-300, WIDTH + 300)
+    y = rng.randint(-300, HEIGHT + 300)
+    return pygame.Rect(x, y, w, h)
+
+
+def test_spatial_hash_covers_brute_force():
+    rng = random.Random(7)
+    grid = SpatialHash()
+    rects = {}
+    for i in range(400):
+        rects[i] = _random_rect(rng)
+        grid.insert(i, rects[i])
+    for i in rng.sample(sorted(rects), 150):  # move some, drop some
+        rects[i] = _random_rect(rng)
+        grid.move(i, rects[i])
+    for i in rng.sample(sorted(rects), 50):
+        grid.remove(i)
+        del rects[i]
+    for _ in range(500):
+        probe = _random_rect(rng)
+        found = grid.query(probe)
+        hits = {i for i, r in rects.items() if r.colliderect(probe)}
+        assert hits <= set(found)
+        assert found == sorted(found, key=grid.order)